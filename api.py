@@ -0,0 +1,59 @@
+"""!
+@file api.py
+@brief Point d'entrée du service headless JSON-sur-HTTP (sans interface graphique).
+@details Lancer `python api.py --port 8080` puis, par exemple :
+         `curl -X POST localhost:8080/sessions -d '{"players": ["Alice", "Bob"], "features": ["US 1"]}'`.
+         Voir controllers/HttpApi.py pour la liste des routes.
+"""
+
+import argparse
+import sys
+
+from controllers.HttpApi import ApiServer
+from controllers.RoomManager import RoomManager, ShardedRoomManager
+
+
+def main(argv=None):
+    """!
+    @brief Démarre le service et sert les requêtes jusqu'à Ctrl+C, puis écrit les sessions ouvertes sur disque.
+    @return Code de retour du processus.
+    """
+    parser = argparse.ArgumentParser(description="Service JSON-sur-HTTP du Planning Poker")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--shards", type=int, default=0,
+                        help="nombre de processus shards (0 : toutes les sessions dans ce processus)")
+    parser.add_argument("--rooms-dir", default=None, help="dossier des sessions évincées")
+    parser.add_argument("--evict-after", type=float, default=600,
+                        help="inactivité (secondes) avant éviction sur disque, 0 pour désactiver")
+    args = parser.parse_args(argv)
+
+    if args.shards > 0:
+        manager = ShardedRoomManager(args.shards, args.rooms_dir)
+    else:
+        manager = RoomManager(args.rooms_dir)
+    api = ApiServer(manager, args.host, args.port, args.evict_after or None)
+    try:
+        api.start()
+    except OSError as e:
+        print(f"Impossible d'écouter sur {args.host}:{args.port} : {e}", file=sys.stderr)
+        if hasattr(manager, "close"):
+            manager.close()
+        return 1
+    print(f"Service Planning Poker sur http://{api.host}:{api.port}")
+    try:
+        api.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        try:
+            manager.evict_idle(0)  # les sessions survivent à un redémarrage du service
+        except OSError as e:
+            print(f"Sauvegarde des sessions impossible : {e}", file=sys.stderr)
+        if hasattr(manager, "close"):
+            manager.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
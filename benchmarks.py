@@ -0,0 +1,556 @@
+"""!
+@file benchmarks.py
+@brief Suite de benchmarks headless (débit, latences p50/p99, pic mémoire) comparée à une baseline.
+@details Lancer `python benchmarks.py` pour comparer à benchmarks_baseline.json,
+         `python benchmarks.py --update-baseline` pour réenregistrer la référence.
+         Le code de retour vaut 1 si une régression dépasse la tolérance ou si un budget
+         absolu (temps d'import au lancement) est dépassé.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from models import SessionCodec
+from tools.HeadlessSimulator import HeadlessSimulator, VOTE_DISTRIBUTIONS
+from tools import StartupProbe
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks_baseline.json")
+
+
+def percentile(samples, q):
+    """!
+    @brief Calcule un percentile par la méthode du rang le plus proche.
+    @param samples Liste de mesures.
+    @param q Percentile voulu (0-100).
+    @return La valeur du percentile, 0 si la liste est vide.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(timings, peaks):
+    """!
+    @brief Agrège les mesures brutes par opération.
+    @param timings Durées (secondes) par opération.
+    @param peaks Pics mémoire (octets) par opération.
+    @return Dictionnaire {opération: {calls, ops_per_s, p50_us, p99_us, peak_kib}}.
+    """
+    report = {}
+    for name, samples in sorted(timings.items()):
+        total = sum(samples)
+        report[name] = {
+            "calls": len(samples),
+            "ops_per_s": round(len(samples) / total, 1) if total else 0.0,
+            "p50_us": round(percentile(samples, 50) * 1e6, 2),
+            "p99_us": round(percentile(samples, 99) * 1e6, 2),
+            "peak_kib": round(peaks.get(name, 0) / 1024, 2),
+        }
+    return report
+
+
+def bench_session(players, stories, distribution, mode, seed=0):
+    """!
+    @brief Rejoue une partie complète deux fois : une passe chronométrée, une passe mémoire.
+    @return Le rapport agrégé par opération.
+    @note tracemalloc ralentit fortement l'exécution, d'où la passe séparée.
+    """
+    timed = HeadlessSimulator(players, stories, distribution, mode, seed=seed)
+    timed.run()
+
+    tracemalloc.start()
+    try:
+        traced = HeadlessSimulator(players, stories, distribution, mode, seed=seed, track_memory=True)
+        traced.run()
+    finally:
+        tracemalloc.stop()
+
+    return summarize(timed.timings, traced.peaks)
+
+
+def bench_import(stories, players=50, repeat=5):
+    """!
+    @brief Mesure l'import d'une sauvegarde volumineuse : from_dict et from_stream.
+    @param stories Nombre de stories dans le backlog importé.
+    @param players Nombre de joueurs dans la sauvegarde.
+    @param repeat Nombre d'imports chronométrés par opération.
+    @return Le rapport agrégé pour les opérations from_dict et from_stream.
+    @note Le pic mémoire de from_dict n'inclut pas json.load ; celui de from_stream couvre tout l'import.
+    """
+    source = HeadlessSimulator(players, stories)
+    data = source.session.to_dict()
+    raw = json.dumps(data, indent=4).encode("utf-8")
+
+    def run(sim):
+        sim._call("from_dict", sim.session.from_dict, data)
+        sim._call("from_stream", sim.session.from_stream, io.BytesIO(raw))
+
+    target = HeadlessSimulator(0, 0)
+    for _ in range(repeat):
+        run(target)
+
+    tracemalloc.start()
+    try:
+        traced = HeadlessSimulator(0, 0, track_memory=True)
+        run(traced)
+    finally:
+        tracemalloc.stop()
+
+    return summarize(target.timings, traced.peaks)
+
+
+def bench_formats(players=40, stories=2000, repeat=20):
+    """!
+    @brief Compare le JSON indenté historique au format compact (taille et vitesse).
+    @param players Nombre de joueurs de la partie simulée.
+    @param stories Nombre de stories de la partie simulée.
+    @param repeat Nombre d'encodages/décodages chronométrés par format.
+    @return Tuple (rapport agrégé, tailles en octets par format).
+    """
+    sim = HeadlessSimulator(players, stories, distribution="split")
+    sim.run(snapshot_every=0)
+    data = sim.session.to_dict(status="FINISHED")
+
+    bench = HeadlessSimulator(0, 0)
+    sizes = {}
+    for fmt, path in (("json", "partie.json"), ("compact", "partie" + SessionCodec.COMPACT_EXTENSION)):
+        for _ in range(repeat):
+            raw = bench._call(f"encode_{fmt}", SessionCodec.encode_for_path, path, data)
+            bench._call(f"decode_{fmt}", SessionCodec.decode, raw)
+        sizes[fmt] = len(raw)
+    return summarize(bench.timings, {}), sizes
+
+
+def bench_game_view(players, stories=3):
+    """!
+    @brief Mesure le coût d'un vote dans la GameView : durée et nombre de widgets Tk créés.
+    @param players Nombre de joueurs à table.
+    @param stories Nombre de stories du backlog.
+    @return Tuple (rapport agrégé, widgets créés à chaque vote), ou None sans affichage disponible.
+    @note Les créations sont comptées en instrumentant tkinter.BaseWidget._setup, appelé par
+          chaque widget Tk ; le dernier vote (qui révèle les cartes) n'est pas mesuré.
+    """
+    import tkinter
+    try:
+        import customtkinter as ctk
+        root = ctk.CTk()
+    except (ImportError, tkinter.TclError) as e:
+        print(f"Benchmark GameView ignoré (aucun affichage) : {e}")
+        return None
+    root.withdraw()
+
+    created = [0]
+    original_setup = tkinter.BaseWidget._setup
+
+    def counting_setup(widget, master, cnf):
+        created[0] += 1
+        return original_setup(widget, master, cnf)
+
+    tkinter.BaseWidget._setup = counting_setup
+    try:
+        from views.GameView import GameView
+        from views.RefreshScheduler import RefreshScheduler
+        root.scheduler = RefreshScheduler(root)
+        sim = HeadlessSimulator(players, stories)
+        view = GameView(root, sim.controller)
+        view.refresh_ui()
+        root.update_idletasks()
+
+        def vote(card):
+            view._on_vote(card)
+            root.update_idletasks()  # exécute la repeinte programmée par le scheduler
+
+        per_vote = []
+        for card in sim.draw_votes(sim.rng, sim.controller.deck, players - 1):
+            created[0] = 0
+            sim._call("gameview_vote", vote, card)
+            per_vote.append(created[0])
+    finally:
+        tkinter.BaseWidget._setup = original_setup
+        root.destroy()
+    return summarize(sim.timings, {}), per_vote
+
+
+def bench_prewarm(repeat=3):
+    """!
+    @brief Mesure le préchauffage de toutes les cartes (cache disque vide) : un seul processus puis un pool.
+    @param repeat Nombre de préchauffages chronométrés par mode.
+    @return Le rapport agrégé (prewarm_serial, prewarm_pool), ou None si cairo est indisponible.
+    @note Le temps du pool inclut le démarrage des processus : c'est le temps mur réellement gagné.
+    """
+    from views.CardPrewarm import CardPrewarmer
+    from views.CardRasterCache import CardRasterCache, rasterize_svg
+    from views.GameView import CARD_SIZES
+    try:
+        rasterize_svg(b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1 1"/>', 1)
+    except (ImportError, OSError) as e:
+        print(f"Benchmark de préchauffage ignoré (cairo indisponible) : {e}")
+        return None
+
+    timings = {}
+    for op, workers in (("prewarm_serial", 1), ("prewarm_pool", os.cpu_count() or 1)):
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory() as tmp:
+                prewarmer = CardPrewarmer(CARD_SIZES, raster_cache=CardRasterCache(tmp), workers=workers)
+                start = time.perf_counter()
+                prewarmer.start().flush()
+                timings.setdefault(op, []).append(time.perf_counter() - start)
+    return summarize(timings, {})
+
+
+def bench_rooms(rooms, players=8, stories=20, shards=None):
+    """!
+    @brief Test de charge multi-salles : empreinte mémoire, votes par seconde, éviction et rechargement.
+    @param rooms Nombre de salles hébergées.
+    @param players Nombre de joueurs par salle.
+    @param stories Nombre de stories par salle.
+    @param shards Nombre de processus shards (par défaut le nombre de cœurs ; 1 : pas de mesure shardée).
+    @return Tuple (rapport agrégé, métriques {bytes_per_room, rooms_per_gb, bytes_per_played_room,
+            played_rooms_per_gb, votes_per_s, sharded_votes_per_s}).
+    @note Dans la mesure shardée, un thread par shard pousse les votes de ses salles : les shards
+          votent en parallèle, chacun dans son processus.
+    """
+    import threading
+    from controllers.RoomManager import RoomManager, ShardedRoomManager, shard_for
+
+    names = [f"Joueur {i}" for i in range(players)]
+    backlog = [f"Story {i}" for i in range(stories)]
+    ids = [f"room{i}" for i in range(rooms)]
+    timings = {"create_room": [], "vote": [], "evict": [], "reload": []}
+    metrics = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracemalloc.start()
+        try:
+            manager = RoomManager(tmp)
+            before = tracemalloc.get_traced_memory()[0]
+            for room_id in ids:
+                manager.create_room(names, backlog, room_id=room_id)
+            metrics["bytes_per_room"] = round((tracemalloc.get_traced_memory()[0] - before) / rooms)
+        finally:
+            tracemalloc.stop()
+        metrics["rooms_per_gb"] = int((1 << 30) / metrics["bytes_per_room"])
+        del manager
+
+    # Une salle qui a joué tout son backlog garde historique, scores et deltas récents : on la mesure aussi.
+    played = min(rooms, 500)
+    with tempfile.TemporaryDirectory() as tmp:
+        tracemalloc.start()
+        try:
+            manager = RoomManager(tmp)
+            before = tracemalloc.get_traced_memory()[0]
+            for room_id in ids[:played]:
+                manager.create_room(names, backlog, room_id=room_id)
+                for _ in backlog:
+                    for name in names:
+                        manager.call(room_id, "vote", name, "5")
+                    manager.call(room_id, "validate", 5)
+            metrics["bytes_per_played_room"] = round((tracemalloc.get_traced_memory()[0] - before) / played)
+        finally:
+            tracemalloc.stop()
+        metrics["played_rooms_per_gb"] = int((1 << 30) / metrics["bytes_per_played_room"])
+        del manager
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = RoomManager(tmp)
+        for room_id in ids:
+            start = time.perf_counter()
+            manager.create_room(names, backlog, room_id=room_id)
+            timings["create_room"].append(time.perf_counter() - start)
+        wall = time.perf_counter()
+        for room_id in ids:
+            for name in names:
+                start = time.perf_counter()
+                manager.call(room_id, "vote", name, "5")
+                timings["vote"].append(time.perf_counter() - start)
+        metrics["votes_per_s"] = round(rooms * players / (time.perf_counter() - wall))
+
+        start = time.perf_counter()
+        manager.evict_idle(0)
+        timings["evict"].append((time.perf_counter() - start) / rooms)
+        for room_id in ids[:min(rooms, 1000)]:
+            start = time.perf_counter()
+            manager.call(room_id, "snapshot")
+            timings["reload"].append(time.perf_counter() - start)
+
+    shards = shards or os.cpu_count() or 1
+    if shards > 1:
+        with tempfile.TemporaryDirectory() as tmp, ShardedRoomManager(shards, tmp) as sharded:
+            by_shard = [[] for _ in range(shards)]
+            for room_id in ids:
+                by_shard[shard_for(room_id, shards)].append(room_id)
+                sharded.create_room(names, backlog, room_id=room_id)
+            samples = timings["vote_sharded"] = []
+
+            def drive(room_ids):
+                for room_id in room_ids:
+                    for name in names:
+                        start = time.perf_counter()
+                        sharded.call(room_id, "vote", name, "5")
+                        samples.append(time.perf_counter() - start)
+
+            threads = [threading.Thread(target=drive, args=(room_ids,)) for room_ids in by_shard]
+            wall = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            metrics["sharded_votes_per_s"] = round(rooms * players / (time.perf_counter() - wall))
+    return summarize(timings, {}), metrics
+
+
+def bench_http(sessions=200, players=8, batch=50):
+    """!
+    @brief Service JSON-sur-HTTP face à un client local : latence par requête, keep-alive et points d'entrée bulk.
+    @param sessions Nombre de sessions créées.
+    @param players Nombre de joueurs par session.
+    @param batch Nombre de sessions par requête /votes/bulk.
+    @return Tuple (rapport agrégé, métriques {keepalive_votes_per_s, new_conn_votes_per_s, bulk_votes_per_s}).
+    @note Les ops vote et vote_new_conn envoient les mêmes requêtes, sur une connexion persistante
+          ou sur une connexion ouverte par requête : l'écart mesure le coût de l'établissement TCP.
+    """
+    import http.client
+    from controllers.HttpApi import ApiServer
+    from controllers.RoomManager import RoomManager
+
+    names = [f"Joueur {i}" for i in range(players)]
+    session = {"players": names, "features": [f"Story {i}" for i in range(20)]}
+    timings = {"create_bulk": [], "vote": [], "vote_new_conn": [], "vote_bulk": [], "state": [],
+               "results_bulk": []}
+    metrics = {}
+
+    def post(conn, path, body, op):
+        data = json.dumps(body).encode("utf-8")
+        start = time.perf_counter()
+        conn.request("POST", path, body=data, headers={"Content-Type": "application/json"})
+        payload = conn.getresponse().read()
+        timings[op].append(time.perf_counter() - start)
+        return json.loads(payload)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api = ApiServer(RoomManager(tmp))
+        host, port = api.start_in_thread()
+        conn = http.client.HTTPConnection(host, port)
+        try:
+            ids = []
+            for first in range(0, sessions * 3, batch):
+                count = min(batch, sessions * 3 - first)
+                ids += post(conn, "/sessions/bulk", {"sessions": [session] * count}, "create_bulk")["ids"]
+            single, fresh, bulk = ids[:sessions], ids[sessions:2 * sessions], ids[2 * sessions:]
+
+            wall = time.perf_counter()
+            for room_id in single:
+                for name in names:
+                    post(conn, f"/sessions/{room_id}/votes", {"player": name, "card": "5"}, "vote")
+            metrics["keepalive_votes_per_s"] = round(sessions * players / (time.perf_counter() - wall))
+
+            wall = time.perf_counter()
+            for room_id in fresh:
+                for name in names:
+                    new_conn = http.client.HTTPConnection(host, port)
+                    post(new_conn, f"/sessions/{room_id}/votes", {"player": name, "card": "5"}, "vote_new_conn")
+                    new_conn.close()
+            metrics["new_conn_votes_per_s"] = round(sessions * players / (time.perf_counter() - wall))
+
+            votes = {name: "5" for name in names}
+            wall = time.perf_counter()
+            for first in range(0, sessions, batch):
+                post(conn, "/votes/bulk", {"sessions": {room_id: votes for room_id in bulk[first:first + batch]}},
+                     "vote_bulk")
+            metrics["bulk_votes_per_s"] = round(sessions * players / (time.perf_counter() - wall))
+
+            for room_id in single:
+                start = time.perf_counter()
+                conn.request("GET", f"/sessions/{room_id}")
+                conn.getresponse().read()
+                timings["state"].append(time.perf_counter() - start)
+            for first in range(0, sessions, batch):
+                post(conn, "/results/bulk", {"ids": ids[first:first + batch]}, "results_bulk")
+        finally:
+            conn.close()
+            api.stop()
+    return summarize(timings, {}), metrics
+
+
+def bench_startup(repeat=3):
+    """!
+    @brief Mesure le démarrage : imports (`-X importtime`) et temps jusqu'au premier affichage.
+    @param repeat Nombre de lancements mesurés.
+    @return Le rapport agrégé (import_startup, process_import, first_frame si un affichage est disponible).
+    """
+    timings = {"import_startup": [], "process_import": []}
+    for _ in range(repeat):
+        imported, wall_ms = StartupProbe.measure_imports()
+        timings["import_startup"].append(StartupProbe.startup_import_ms(imported) / 1000)
+        timings["process_import"].append(wall_ms / 1000)
+
+        first_frame_ms = StartupProbe.measure_first_frame()
+        if first_frame_ms is not None:
+            timings.setdefault("first_frame", []).append(first_frame_ms / 1000)
+    return summarize(timings, {})
+
+
+def check_budgets(report):
+    """!
+    @brief Vérifie les budgets absolus, indépendants de la baseline.
+    @param report Rapport courant {scénario: {opération: métriques}}.
+    @return Liste des dépassements, sous forme de messages lisibles.
+    @note Le temps d'import médian du lancement doit rester sous StartupProbe.STARTUP_IMPORT_BUDGET_MS.
+    """
+    startup = report.get("startup", {}).get("import_startup")
+    if startup is None:
+        return []
+    import_ms = startup["p50_us"] / 1000
+    if import_ms > StartupProbe.STARTUP_IMPORT_BUDGET_MS:
+        return [f"startup/import_startup: {import_ms:.0f} ms > budget {StartupProbe.STARTUP_IMPORT_BUDGET_MS} ms"]
+    return []
+
+
+def compare(report, baseline, tolerance):
+    """!
+    @brief Compare un rapport à la baseline enregistrée.
+    @param report Rapport courant {scénario: {opération: métriques}}.
+    @param baseline Rapport de référence, même format.
+    @param tolerance Facteur de dégradation toléré (ex: 2.0 = deux fois plus lent).
+    @return Liste des régressions détectées, sous forme de messages lisibles.
+    """
+    regressions = []
+    for scenario, ops in report.items():
+        for op, metrics in ops.items():
+            ref = baseline.get(scenario, {}).get(op)
+            if not ref:
+                continue
+            keys = ["p50_us", "peak_kib"]
+            if metrics["calls"] >= 100:
+                keys.append("p99_us")  # p99 n'a de sens qu'avec assez d'échantillons
+            for key in keys:
+                # On ignore les valeurs minuscules, trop bruitées pour être comparées.
+                floor = {"p50_us": 5.0, "p99_us": 50.0, "peak_kib": 1.0}[key]
+                if metrics[key] > max(ref[key], floor) * tolerance:
+                    regressions.append(f"{scenario}/{op}: {key} {metrics[key]} > {ref[key]} x{tolerance}")
+    return regressions
+
+
+def print_report(report):
+    """!
+    @brief Affiche le rapport sous forme de tableau.
+    """
+    header = f"{'scénario / opération':<48}{'appels':>8}{'ops/s':>12}{'p50 µs':>10}{'p99 µs':>10}{'pic KiB':>10}"
+    print(header)
+    print("-" * len(header))
+    for scenario, ops in report.items():
+        for op, m in ops.items():
+            print(f"{scenario + ' / ' + op:<48}{m['calls']:>8}{m['ops_per_s']:>12}"
+                  f"{m['p50_us']:>10}{m['p99_us']:>10}{m['peak_kib']:>10}")
+
+
+def main(argv=None):
+    """!
+    @brief Point d'entrée en ligne de commande.
+    @return Code de retour du processus (0 si aucune régression).
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks headless du Planning Poker")
+    parser.add_argument("--players", type=int, nargs="+", default=[8, 40, 200])
+    parser.add_argument("--stories", type=int, default=200)
+    parser.add_argument("--import-stories", type=int, default=50000)
+    parser.add_argument("--gui-players", type=int, nargs="*", default=[8, 40, 200])
+    parser.add_argument("--rooms", type=int, default=5000)
+    parser.add_argument("--shards", type=int, default=None)
+    parser.add_argument("--http-sessions", type=int, default=200)
+    parser.add_argument("--distribution", choices=sorted(VOTE_DISTRIBUTIONS), default="skewed")
+    parser.add_argument("--mode", default="Moyenne")
+    parser.add_argument("--tolerance", type=float, default=2.0)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = {}
+    for players in args.players:
+        scenario = f"session-{players}p-{args.stories}s-{args.distribution}"
+        report[scenario] = bench_session(players, args.stories, args.distribution, args.mode)
+
+    report[f"import-{args.import_stories}s"] = bench_import(args.import_stories)
+
+    report["startup"] = bench_startup()
+
+    rooms_report, room_metrics = bench_rooms(args.rooms, shards=args.shards)
+    report[f"rooms-{args.rooms}"] = rooms_report
+
+    http_report, http_metrics = bench_http(args.http_sessions)
+    report[f"http-{args.http_sessions}"] = http_report
+
+    prewarm_report = bench_prewarm()
+    if prewarm_report is not None:
+        report["prewarm-cards"] = prewarm_report
+
+    formats_report, sizes = bench_formats()
+    report["formats-40p-2000s"] = formats_report
+
+    widget_counts = {}
+    for players in args.gui_players:
+        result = bench_game_view(players)
+        if result is None:
+            break
+        report[f"gameview-{players}p"], widget_counts[players] = result
+
+    print_report(report)
+    for players, per_vote in widget_counts.items():
+        if not per_vote:
+            continue
+        print(f"\nWidgets créés par vote ({players} joueurs) : "
+              f"moyenne {sum(per_vote) / len(per_vote):.1f}, max {max(per_vote)}")
+    if prewarm_report is not None:
+        speedup = prewarm_report["prewarm_serial"]["p50_us"] / prewarm_report["prewarm_pool"]["p50_us"]
+        print(f"\nPréchauffage des cartes sur {os.cpu_count()} cœurs : pool x{speedup:.1f} par rapport à un processus")
+    print(f"\nSalles : {room_metrics['bytes_per_room']} octets par salle neuve, soit {room_metrics['rooms_per_gb']} salles par Go ; "
+          f"{room_metrics['bytes_per_played_room']} octets par salle au backlog entièrement joué, "
+          f"soit {room_metrics['played_rooms_per_gb']} salles par Go ; "
+          f"{room_metrics['votes_per_s']} votes/s dans un processus"
+          + (f", {room_metrics['sharded_votes_per_s']} votes/s sur {args.shards or os.cpu_count()} shards"
+             if "sharded_votes_per_s" in room_metrics else ""))
+    print(f"\nAPI HTTP : {http_metrics['keepalive_votes_per_s']} votes/s en keep-alive, "
+          f"{http_metrics['new_conn_votes_per_s']} votes/s avec une connexion par requête, "
+          f"{http_metrics['bulk_votes_per_s']} votes/s via /votes/bulk")
+    print("\nTaille sur disque : " + ", ".join(f"{fmt} {size / 1024:.1f} KiB" for fmt, size in sizes.items())
+          + f" (gain x{sizes['json'] / sizes['compact']:.1f})")
+
+    over_budget = check_budgets(report)
+    if over_budget:
+        print("\nBUDGETS DÉPASSÉS :")
+        for line in over_budget:
+            print(f"  - {line}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"\nBaseline mise à jour : {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\nAucune baseline trouvée (lancer avec --update-baseline).")
+        return 1 if over_budget else 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = compare(report, baseline, args.tolerance)
+    if regressions:
+        print("\nRÉGRESSIONS DÉTECTÉES :")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+
+    print("\nAucune régression par rapport à la baseline.")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
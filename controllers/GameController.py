@@ -1,6 +1,8 @@
-from statistics import mean, median, multimode
-import json
+from functools import partial
 from tkinter import filedialog
+from models import SessionCodec
+from models.ConsensusEngine import ConsensusEngine
+from models.GameRules import DECK
 from views.CustomPopup import CustomPopup
 
 class GameController:
@@ -10,8 +12,10 @@ class GameController:
         model Modèle de session de jeu.
         main_controller Contrôleur principal pour la navigation.
         deck Liste des valeurs de cartes disponibles.
-        current_player_index Index du joueur courant.
+        consensus Moteur de calcul du consensus construit sur le deck.
+        current_player_index Index du joueur affiché comme votant attendu (curseur d'affichage).
         revealed Indique si les votes sont révélés.
+        journal Journal d'évènements optionnel (SessionJournal) pour la reprise après crash.
     """
 
     def __init__(self, game_session, main_controller):
@@ -24,7 +28,9 @@ class GameController:
         self.model = game_session
         self.main_controller = main_controller
         
-        self.deck = ["0", "1", "2", "3", "5", "8", "13", "20", "40", "100", "interro", "cafe"]
+        self.deck = list(DECK)
+        self.consensus = ConsensusEngine(self.deck)
+        self.journal = None
         
         self.reset()
 
@@ -49,34 +55,66 @@ class GameController:
         """!
         @brief Retourne le nom du joueur qui doit voter.
         @return Nom du joueur ou None si fini.
-        @note Basé sur l'index courant, pas sur la présence d'un vote existant.
+        @note Basé sur l'index courant ; cast_vote l'avance au-delà des joueurs ayant déjà voté.
         """
         players = self.model.get_player_names()
         if self.current_player_index < len(players):
             return players[self.current_player_index]
         return None
 
-    def cast_vote(self, card_value):
+    def cast_vote(self, card_value, player_name=None):
         """!
-        @brief Enregistre le vote du joueur courant et passe au suivant.
+        @brief Enregistre le vote d'un joueur (par défaut le joueur courant) et avance au prochain votant attendu.
         @param card_value Valeur de la carte choisie.
+        @param player_name Joueur qui vote, dans n'importe quel ordre (None : joueur courant).
         @return True si le vote est enregistré, False sinon.
-        @note Retourne False si aucun joueur n'est disponible (fin de tour).
+        @note Retourne False si aucun joueur n'est disponible (fin de tour), si le joueur a déjà voté
+              ou si le tour est révélé.
+        @see GameSession.cast_vote
         """
-        player_name = self.get_current_player_name()
-        if player_name:
-            self.model.votes[player_name] = card_value
-            self.current_player_index += 1
-            return True
-        return False
+        player_name = player_name or self.get_current_player_name()
+        if not player_name:
+            return False
+        try:
+            self.model.cast_vote(player_name, card_value)
+        except ValueError:
+            return False
+        self._advance_current_player()
+        self._journal("record_vote", player_name, card_value)
+        return True
+
+    def _advance_current_player(self):
+        """!
+        @brief Place le curseur sur le prochain joueur qui n'a pas encore voté.
+        @note Tous les joueurs avant le curseur ont voté : tant qu'il n'y a pas plus de votes que de
+              joueurs avant le curseur (votes dans l'ordre), il suffit de l'avancer d'un cran.
+        """
+        players = self.model.get_player_names()
+        votes = self.model.votes
+        index = self.current_player_index
+        if index < len(players) and players[index] in votes:
+            index += 1
+        if len(votes) > index:
+            while index < len(players) and players[index] in votes:
+                index += 1
+        self.current_player_index = index
+
+    def reveal_votes(self):
+        """!
+        @brief Retourne les cartes une fois le tour terminé.
+        @note Journalise la révélation pour qu'une reprise réaffiche les résultats.
+        """
+        self.revealed = True
+        self.model.reveal()
+        self._journal("record_reveal")
 
     def is_round_finished(self):
         """!
         @brief Vérifie si tous les joueurs ont voté.
         @return True si le tour est terminé, False sinon.
-        @note Se base sur l'index courant et le nombre de joueurs inscrits.
+        @note O(1) : compteur de votants attendus de l'urne, indépendant de l'ordre des votes.
         """
-        return self.current_player_index >= len(self.model.players)
+        return self.model.votes.is_complete()
 
     def get_votes(self):
         """!
@@ -93,7 +131,7 @@ class GameController:
         @return True si tous les votes sont "cafe", False sinon.
         @note Retourne False si aucun vote n'est présent.
         """
-        votes = list(self.model.votes.values())
+        votes = self.model.votes.values()
         if not votes: return False
         return all(v == "cafe" for v in votes)
 
@@ -102,41 +140,11 @@ class GameController:
         @brief Calcule le résultat du vote selon les règles (Unanimité au T1, puis règle choisie).
         @return Résultat numérique/str, "?" si inconnu, ou None si pas de décision.
         @note Ignore les cartes "interro" et "cafe" pour le calcul.
+        @see ConsensusEngine.resolve
         """
-        votes_values = [v for v in self.model.votes.values() if v not in ["interro", "cafe"]]
-        
-        numeric_votes = []
-        for v in votes_values:
-            if v.isdigit(): numeric_votes.append(int(v))
-        
-        if self.model.current_round_number == 1:
-            if not numeric_votes: return None 
-            if len(set(numeric_votes)) == 1:
-                return numeric_votes[0] 
-            else:
-                return None 
-
-        if not numeric_votes: return "?"
-
-        mode = self.model.rules.selected_mode
-        
-        if mode == "Unanimité":
-            return numeric_votes[0] if len(set(numeric_votes)) == 1 else None
-        elif mode == "Moyenne":
-            return round(mean(numeric_votes))
-        elif mode == "Médiane":
-            return round(median(numeric_votes))
-        elif mode == "Majorité Absolue":
-            counts = {x: numeric_votes.count(x) for x in set(numeric_votes)}
-            winner = max(counts, key=counts.get)
-            if counts[winner] > len(numeric_votes) / 2:
-                return winner
-            return None 
-        elif mode == "Majorité Relative":
-            res = multimode(numeric_votes)
-            return max(res)
-
-        return None
+        return self.consensus.resolve(self.model.votes.values(),
+                                      self.model.current_round_number,
+                                      self.model.rules.selected_mode)
 
     def handle_end_of_round(self):
         """!
@@ -165,6 +173,7 @@ class GameController:
         self.model.save_feature_score(final_score)
         self.model.next_feature()
         self._reset_round_state()
+        self._journal("record_validation", final_score)
 
         if self.model.get_current_feature() is None:
             self.finish_game()
@@ -178,12 +187,39 @@ class GameController:
         """
         self.model.next_round()
         self._reset_round_state()
+        self._journal("record_revote")
         self.main_controller.show_game()
 
+    def resume_from_journal(self):
+        """!
+        @brief Restaure la partie journalisée et l'état du tour courant.
+        @raises ValueError Si aucun journal n'est disponible ou s'il est invalide.
+        @see SessionJournal.resume
+        """
+        self.revealed = self.journal.resume(self.model)
+        if self.revealed:
+            self.model.votes.close()
+        self.current_player_index = 0
+        self._advance_current_player()
+
+    def _journal(self, method, *args):
+        """!
+        @brief Transmet un évènement au journal s'il est actif.
+        @param method Nom de la méthode à appeler (record_* ou discard).
+        @param args Données de l'évènement.
+        @note Une erreur d'écriture désactive le journal sans interrompre la partie.
+        """
+        if self.journal is None:
+            return
+        try:
+            getattr(self.journal, method)(*args)
+        except OSError as e:
+            print(f"Journal désactivé : {e}")
+            self.journal = None
+
     def _reset_round_state(self):
         self.current_player_index = 0
         self.revealed = False
-        self.model.votes = {}
 
     def save_game_state_and_quit(self):
         """!
@@ -197,8 +233,10 @@ class GameController:
     def finish_game(self):
         """!
         @brief Fin de partie : Redirige vers la page de résultats.
+        @note La partie journalisée est terminée : le journal de reprise est supprimé.
         @see MainController.show_result
         """
+        self._journal("discard")
         self.main_controller.show_result()
 
     def _export_json(self, data, success_msg):
@@ -207,13 +245,16 @@ class GameController:
         @param data Données à exporter.
         @param success_msg Message de succès.
         @return None
-        @raises OSError Si l'écriture du fichier échoue.
+        @note L'écriture est déléguée au SessionWriter (thread d'écriture, fichier atomique) ;
+              la popup de succès ou d'erreur s'affiche une fois l'écriture terminée.
         """
-        filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=SessionCodec.SAVE_FILETYPES)
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
-                CustomPopup("Succès", success_msg, type="info")
-            except Exception as e:
-                CustomPopup("Erreur", f"Erreur sauvegarde: {e}", type="error")
\ No newline at end of file
+            def on_done(error):
+                if error is None:
+                    CustomPopup("Succès", success_msg, type="info")
+                else:
+                    CustomPopup("Erreur", f"Erreur sauvegarde: {error}", type="error")
+
+            self.main_controller.writer.submit(filename, data, on_done=on_done,
+                                               encoder=partial(SessionCodec.encode_for_path, filename))
@@ -0,0 +1,410 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from controllers.RoomManager import RoomManager
+
+## Taille maximale d'un corps de requête, en octets.
+MAX_BODY_BYTES = 1 << 24
+
+_ID = r"(?P<room_id>[^/]+)"
+
+## Table de routage : (méthode HTTP, chemin, nom du gestionnaire de ApiServer).
+ROUTES = (
+    ("POST", r"/sessions", "_create_session"),
+    ("POST", r"/sessions/bulk", "_create_sessions"),
+    ("GET", rf"/sessions/{_ID}", "_get_state"),
+    ("DELETE", rf"/sessions/{_ID}", "_close_session"),
+    ("GET", rf"/sessions/{_ID}/changes", "_get_changes"),
+    ("POST", rf"/sessions/{_ID}/backlog", "_import_backlog"),
+    ("POST", rf"/sessions/{_ID}/votes", "_post_votes"),
+    ("POST", rf"/sessions/{_ID}/revote", "_revote"),
+    ("POST", rf"/sessions/{_ID}/validate", "_validate"),
+    ("GET", rf"/sessions/{_ID}/results", "_get_results"),
+    ("POST", r"/votes/bulk", "_post_votes_bulk"),
+    ("POST", r"/results/bulk", "_get_results_bulk"),
+)
+
+_COMPILED_ROUTES = tuple((method, re.compile(path), handler) for method, path, handler in ROUTES)
+
+
+def _names(body, key):
+    """!
+    @brief Lit une liste de chaînes dans un corps de requête.
+    @param body Corps JSON décodé.
+    @param key Clé de la liste.
+    @return La liste (vide si la clé est absente).
+    @raises ValueError Si la valeur n'est pas une liste de chaînes.
+    """
+    value = body.get(key, [])
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f"'{key}' doit être une liste de chaînes")
+    return value
+
+
+def _mapping(body, key):
+    """!
+    @brief Lit un objet JSON obligatoire dans un corps de requête.
+    @raises ValueError Si la valeur est absente ou n'est pas un objet.
+    """
+    value = body.get(key)
+    if not isinstance(value, dict):
+        raise ValueError(f"'{key}' doit être un objet JSON")
+    return value
+
+
+def _scalar(body, key):
+    """!
+    @brief Lit une valeur simple obligatoire (joueur, carte, score) dans un corps de requête.
+    @param body Corps JSON décodé.
+    @param key Clé de la valeur.
+    @return La valeur (chaîne ou nombre).
+    @raises ValueError Si la valeur est absente ou n'est ni une chaîne ni un nombre.
+    """
+    value = body.get(key)
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"'{key}' doit être une chaîne ou un nombre")
+    return value
+
+
+class ApiServer:
+    """!
+    @brief Service JSON-sur-HTTP headless : import de backlog, création de sessions, votes et résultats.
+    @details Les sessions sont les salles d'un RoomManager (ou d'un ShardedRoomManager) ; aucune
+             I/O ne passe par tkinter. Le serveur (http.server de la bibliothèque standard) répond
+             en HTTP/1.1 avec Content-Length sur chaque réponse : un client garde la même connexion
+             TCP pour toutes ses requêtes (keep-alive). Les points d'entrée /bulk regroupent de
+             nombreuses sessions, votes ou résultats en un seul aller-retour. Un thread optionnel
+             évince périodiquement les sessions inactives sur disque.
+    @note Corps de création (format de SetupController.export_data) : {"players": [...],
+          "features": [...], "rule": "Moyenne"}. Les erreurs sont renvoyées en {"error": message}
+          avec le code 400 (requête refusée), 404 (session ou route inconnue), 405 ou 500.
+    @attributes
+        manager RoomManager hébergeant les sessions.
+        host Adresse d'écoute.
+        port Port d'écoute (attribué par le système si 0, connu après start()).
+        evict_after Durée d'inactivité (secondes) avant éviction d'une session sur disque, None pour ne jamais évincer.
+    """
+
+    def __init__(self, manager=None, host="127.0.0.1", port=0, evict_after=None):
+        """!
+        @brief Prépare le service sans ouvrir de socket.
+        @param manager RoomManager ou ShardedRoomManager (par défaut un RoomManager).
+        @param host Adresse d'écoute.
+        @param port Port d'écoute (0 : port libre choisi par le système).
+        @param evict_after Durée d'inactivité avant éviction (secondes), None pour désactiver.
+        @example
+            api = ApiServer(RoomManager(), port=8080, evict_after=600)
+            api.serve_forever()
+        """
+        self.manager = manager or RoomManager()
+        self.host = host
+        self.port = port
+        self.evict_after = evict_after
+
+        self._httpd = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        """!
+        @brief Ouvre le socket d'écoute.
+        @raises OSError Si l'adresse est déjà utilisée ou indisponible.
+        """
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _ApiHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.api = self
+        self.port = self._httpd.server_address[1]
+
+    def serve_forever(self):
+        """!
+        @brief Sert les requêtes jusqu'à stop() (bloquant).
+        """
+        if self._httpd is None:
+            self.start()
+        if self.evict_after is not None:
+            threading.Thread(target=self._evict_loop, name="ApiEviction", daemon=True).start()
+        self._httpd.serve_forever()
+
+    def start_in_thread(self):
+        """!
+        @brief Démarre le service dans un thread dédié.
+        @return Tuple (hôte, port) d'écoute.
+        @raises OSError Si le socket ne peut pas être ouvert.
+        """
+        self.start()
+        self._thread = threading.Thread(target=self.serve_forever, name="ApiServer", daemon=True)
+        self._thread.start()
+        return self.host, self.port
+
+    def stop(self):
+        """!
+        @brief Arrête le service et ferme le socket d'écoute.
+        """
+        self._stopped.set()
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _evict_loop(self):
+        """!
+        @brief Évince les sessions inactives toutes les evict_after secondes.
+        @note Une erreur d'écriture est signalée sans arrêter le service : les sessions restent en mémoire.
+        """
+        while not self._stopped.wait(self.evict_after):
+            try:
+                self.manager.evict_idle(self.evict_after)
+            except OSError as e:
+                print(f"Éviction impossible : {e}")
+
+    def handle(self, method, path, query, body):
+        """!
+        @brief Traite une requête décodée.
+        @param method Méthode HTTP.
+        @param path Chemin de l'URL.
+        @param query Paramètres de requête (parse_qs).
+        @param body Corps JSON décodé (dictionnaire, vide si absent).
+        @return Tuple (code HTTP, objet JSON de réponse).
+        """
+        allowed = False
+        for route_method, pattern, handler in _COMPILED_ROUTES:
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            if route_method != method:
+                allowed = True
+                continue
+            try:
+                return getattr(self, handler)(body, query, **match.groupdict())
+            except KeyError as e:
+                return 404, {"error": f"Session inconnue : {e.args[0] if e.args else ''}"}
+            except ValueError as e:
+                return 400, {"error": str(e)}
+            except Exception as e:
+                # Toujours une réponse : le client ne doit pas voir sa connexion coupée sans explication
+                return 500, {"error": f"Erreur interne : {type(e).__name__}: {e}"}
+        if allowed:
+            return 405, {"error": f"Méthode non autorisée : {method} {path}"}
+        return 404, {"error": f"Route inconnue : {path}"}
+
+    # --- Gestionnaires de routes : (corps, paramètres, groupes du chemin) -> (code, réponse) ---
+
+    def _create(self, body):
+        """!
+        @brief Crée une session à partir d'un corps au format de SetupController.export_data.
+        @return L'identifiant de la session.
+        @raises ValueError Si le corps est invalide, s'il y a moins de 2 joueurs ou aucune fonctionnalité.
+        """
+        if not isinstance(body, dict):
+            raise ValueError("Session invalide : objet JSON attendu")
+        players, features = _names(body, "players"), _names(body, "features")
+        if len(set(players)) < 2 or not features:
+            raise ValueError("Il faut au moins 2 joueurs et 1 fonctionnalité")
+        rule = body.get("rule")
+        if rule is not None and not isinstance(rule, str):
+            raise ValueError("'rule' doit être une chaîne")
+        return self.manager.create_room(players, features, rule)
+
+    def _create_session(self, body, query):
+        """!
+        @brief POST /sessions : crée une session ; réponse 201 {id, state}.
+        """
+        room_id = self._create(body)
+        return 201, {"id": room_id, "state": self.manager.call(room_id, "snapshot")}
+
+    def _create_sessions(self, body, query):
+        """!
+        @brief POST /sessions/bulk {sessions: [...]} : crée plusieurs sessions ; réponse 201 {ids, errors}.
+        """
+        sessions = body.get("sessions")
+        if not isinstance(sessions, list):
+            raise ValueError("'sessions' doit être une liste")
+        ids, errors = [], {}
+        for index, session in enumerate(sessions):
+            try:
+                ids.append(self._create(session))
+            except ValueError as e:
+                ids.append(None)
+                errors[str(index)] = str(e)
+        return 201, {"ids": ids, "errors": errors}
+
+    def _get_state(self, body, query, room_id):
+        """!
+        @brief GET /sessions/{id}[?full=1] : état de la session (backlog inclus avec full).
+        """
+        full = query.get("full", ["0"])[0] not in ("0", "false", "")
+        return 200, self.manager.call(room_id, "snapshot", full)
+
+    def _close_session(self, body, query, room_id):
+        """!
+        @brief DELETE /sessions/{id} : ferme la session et renvoie son état final.
+        """
+        return 200, self.manager.close_room(room_id)
+
+    def _get_changes(self, body, query, room_id):
+        """!
+        @brief GET /sessions/{id}/changes?since=v : deltas depuis v, ou état complet si v n'est plus disponible.
+        """
+        try:
+            since = int(query.get("since", ["0"])[0])
+        except ValueError:
+            raise ValueError("'since' doit être un entier") from None
+        changes = self.manager.call(room_id, "changes_since", since)
+        if changes is None:
+            return 200, {"changes": None, "state": self.manager.call(room_id, "snapshot")}
+        return 200, {"changes": changes}
+
+    def _import_backlog(self, body, query, room_id):
+        """!
+        @brief POST /sessions/{id}/backlog {features} : ajoute des fonctionnalités ; réponse {accepted, rejected}.
+        """
+        accepted, rejected = self.manager.call(room_id, "import_backlog", _names(body, "features"))
+        return 200, {"accepted": accepted, "rejected": rejected}
+
+    def _post_votes(self, body, query, room_id):
+        """!
+        @brief POST /sessions/{id}/votes {player, card[, change]} ou {votes: {joueur: carte}} : vote(s) ; réponse {rejected, state}.
+        """
+        if "votes" in body:
+            rejected = self.manager.call(room_id, "vote_many", _mapping(body, "votes"))
+        else:
+            method = "change_vote" if body.get("change") else "vote"
+            self.manager.call(room_id, method, _scalar(body, "player"), _scalar(body, "card"))
+            rejected = {}
+        return 200, {"rejected": rejected, "state": self.manager.call(room_id, "snapshot")}
+
+    def _revote(self, body, query, room_id):
+        """!
+        @brief POST /sessions/{id}/revote : relance le tour révélé.
+        """
+        self.manager.call(room_id, "revote")
+        return 200, self.manager.call(room_id, "snapshot")
+
+    def _validate(self, body, query, room_id):
+        """!
+        @brief POST /sessions/{id}/validate {score} : valide l'estimation de la fonctionnalité courante.
+        """
+        self.manager.call(room_id, "validate", _scalar(body, "score"))
+        return 200, self.manager.call(room_id, "snapshot")
+
+    def _get_results(self, body, query, room_id):
+        """!
+        @brief GET /sessions/{id}/results : estimations validées.
+        """
+        return 200, self.manager.call(room_id, "results")
+
+    def _post_votes_bulk(self, body, query):
+        """!
+        @brief POST /votes/bulk {sessions: {id: {joueur: carte}}} : votes de plusieurs sessions ; réponse {rejected}.
+        """
+        rejected = {}
+        for room_id, votes in _mapping(body, "sessions").items():
+            if not isinstance(votes, dict):
+                rejected[room_id] = {"error": "Votes invalides : objet JSON attendu"}
+                continue
+            try:
+                refused = self.manager.call(room_id, "vote_many", votes)
+            except KeyError:
+                refused = {"error": f"Session inconnue : {room_id}"}
+            if refused:
+                rejected[room_id] = refused
+        return 200, {"rejected": rejected}
+
+    def _get_results_bulk(self, body, query):
+        """!
+        @brief POST /results/bulk {ids} : résultats de plusieurs sessions ; réponse {results, missing}.
+        """
+        results, missing = {}, []
+        for room_id in _names(body, "ids"):
+            try:
+                results[room_id] = self.manager.call(room_id, "results")
+            except KeyError:
+                missing.append(room_id)
+        return 200, {"results": results, "missing": missing}
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    """!
+    @brief Adaptateur http.server : décode la requête, délègue à ApiServer.handle et encode la réponse.
+    @note HTTP/1.1 et Content-Length systématique : la connexion reste ouverte entre les requêtes.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # En-têtes et corps partent en deux écritures : sans TCP_NODELAY, Nagle retiendrait le corps
+    # jusqu'à l'ACK retardé du client (~40 ms par requête sur une connexion persistante).
+    disable_nagle_algorithm = True
+    server_version = "PlanningPokerAPI/1.0"
+
+    def do_GET(self):
+        """!
+        @brief Requêtes GET.
+        """
+        self._dispatch("GET")
+
+    def do_POST(self):
+        """!
+        @brief Requêtes POST.
+        """
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        """!
+        @brief Requêtes DELETE.
+        """
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        """!
+        @brief Lit le corps, traite la requête et envoie la réponse JSON.
+        """
+        url = urlsplit(self.path)
+        try:
+            body = self._read_body()
+        except ValueError as e:
+            status, payload = 400, {"error": str(e)}
+        else:
+            status, payload = self.server.api.handle(method, url.path, parse_qs(url.query), body)
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self):
+        """!
+        @brief Lit et décode le corps JSON de la requête.
+        @return Le dictionnaire reçu (vide sans corps).
+        @raises ValueError Si le corps est trop gros ou n'est pas un objet JSON.
+        @note Un corps trop gros n'est pas lu : la connexion est fermée après la réponse.
+        """
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            self.close_connection = True
+            raise ValueError("En-tête Content-Length invalide") from None
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise ValueError(f"Corps trop volumineux (max {MAX_BODY_BYTES} octets)")
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ValueError(f"JSON invalide : {e}") from None
+        if not isinstance(body, dict):
+            raise ValueError("Objet JSON attendu")
+        return body
+
+    def log_message(self, format, *args):
+        """!
+        @brief Journal d'accès désactivé : une ligne sur stderr par requête coûterait plus que la requête.
+        """
@@ -1,9 +1,11 @@
-import json
 from tkinter import filedialog
 from models.GameSession import GameSession
+from models import SessionCodec
+from models.SessionJournal import SessionJournal, default_journal_path
 from controllers.SetupController import SetupController
 from controllers.GameController import GameController
 from controllers.ResultController import ResultController
+from controllers.SessionWriter import SessionWriter
 from views.CustomPopup import CustomPopup
 
 class MainController:
@@ -16,6 +18,10 @@ class MainController:
         setup_controller Contrôleur de configuration.
         game_controller Contrôleur de jeu.
         result_controller Contrôleur des résultats.
+        journal Journal d'évènements de la partie en cours (reprise après crash).
+        writer Service d'écriture en arrière-plan partagé par les contrôleurs.
+        remote_controller Contrôleur de la partie réseau rejointe (None en partie locale).
+        server Serveur de la partie réseau hébergée (None si aucune).
     """
 
     def __init__(self, view):
@@ -26,11 +32,18 @@ class MainController:
         """
         self.view = view
         self.game_session = GameSession() 
+        self.writer = SessionWriter(root=view)
         
         self.setup_controller = SetupController(self.game_session, self)
         self.game_controller = GameController(self.game_session, self)
         self.result_controller = ResultController(self.game_session, self)
 
+        self.journal = SessionJournal(default_journal_path())
+        self.game_controller.journal = self.journal
+
+        self.remote_controller = None
+        self.server = None
+
     def show_home(self):
         """!
         @brief Affiche la vue d'accueil.
@@ -45,10 +58,11 @@ class MainController:
         @details RESET impératif pour ne pas garder l'état de l'ancienne partie.
         @note Remet le modèle et le GameController à zéro avant affichage.
         """
+        self.leave_remote_game()
         self.game_session.reset()      
         self.game_controller.reset()   
         
-        setup_frame = self.view.frames["SetupView"]
+        setup_frame = self.view.get_frame("SetupView")
         setup_frame.controller = self.setup_controller
         setup_frame.refresh_ui()
         self.view.show_frame("SetupView")
@@ -57,18 +71,28 @@ class MainController:
         """!
         @brief Charge une partie depuis un fichier JSON et redirige vers la bonne vue.
         @details Si la partie est FINISHED -> ResultView. Sinon -> GameView.
+                 Le format est détecté par l'en-tête : JSON (lu en streaming via GameSession.from_stream),
+                 archive compacte .ppk ou JSON gzip (décodés par SessionCodec).
         @raises OSError Si la lecture du fichier échoue.
         @raises ValueError Si le contenu JSON est invalide pour GameSession.
         """
-        filename = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
+        filename = filedialog.askopenfilename(filetypes=[("Sauvegardes Planning Poker", "*.json *.ppk"),
+                                                         ("JSON files", "*.json"),
+                                                         ("Archive compacte", "*.ppk")])
         if not filename:
             return
 
+        self.leave_remote_game()
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            self.game_session.from_dict(data)
+            with open(filename, 'rb') as f:
+                fmt = SessionCodec.detect_format(f.read(4))
+                f.seek(0)
+                if fmt == "json":
+                    data = self.game_session.from_stream(f, progress=self.report_progress)
+                else:
+                    data = SessionCodec.decode(f.read())
+                    self.game_session.from_dict(data)
+            self.view.show_progress(None)
             self.game_controller.reset()
 
             status = data.get("status", "IN_PROGRESS")
@@ -80,36 +104,169 @@ class MainController:
             else:
                 if self.game_session.get_current_feature():
                     CustomPopup("Chargement", "Partie reprise avec succès !", type="info")
+                    self.begin_journal()
                     self.show_game()
                 else:
                     self.show_result()
 
         except Exception as e:
+            self.view.show_progress(None)
             CustomPopup("Erreur", f"Impossible de charger la partie :\n{e}", type="error")
 
+    def begin_journal(self):
+        """!
+        @brief Démarre la journalisation de la partie qui commence.
+        @note Écrit un instantané initial ; une erreur d'écriture désactive seulement la reprise.
+        """
+        self.game_controller.journal = self.journal
+        try:
+            self.journal.start(self.game_session, revealed=self.game_controller.revealed)
+        except OSError as e:
+            print(f"Journal désactivé : {e}")
+            self.game_controller.journal = None
+
+    def resume_game(self):
+        """!
+        @brief Reprend la dernière partie interrompue à partir du journal automatique.
+        @details Recharge le dernier instantané puis rejoue les évènements suivants.
+        @see SessionJournal.resume
+        """
+        if not self.journal.exists():
+            CustomPopup("Reprise", "Aucune partie interrompue à reprendre.", type="info")
+            return
+
+        self.leave_remote_game()
+        try:
+            self.game_controller.journal = self.journal
+            self.game_controller.resume_from_journal()
+        except Exception as e:
+            CustomPopup("Erreur", f"Impossible de reprendre la partie :\n{e}", type="error")
+            return
+
+        if self.game_session.get_current_feature():
+            self.show_game()
+        else:
+            self.game_controller.finish_game()
+
+    def report_progress(self, done, total):
+        """!
+        @brief Relaie la progression d'un import volumineux vers la fenêtre principale.
+        @param done Nombre d'octets déjà lus.
+        @param total Taille totale du fichier, ou None si inconnue.
+        @see MainWindow.show_progress
+        """
+        if total:
+            self.view.show_progress(min(1.0, done / total))
+
     def show_game(self):
         """!
         @brief Affiche la vue du jeu.
+        @note La repeinte est regroupée par le RefreshScheduler : plusieurs appels dans la même
+              action utilisateur ne redessinent la vue qu'une fois.
         @see GameController
         """
-        game_frame = self.view.frames["GameView"]
-        game_frame.controller = self.game_controller 
-        game_frame.refresh_ui()
+        game_frame = self.view.get_frame("GameView")
+        game_frame.controller = self.remote_controller or self.game_controller
+        game_frame.schedule_refresh()
         self.view.show_frame("GameView")
 
+    def host_game(self):
+        """!
+        @brief Héberge la partie configurée sur le réseau local puis la suit en tant qu'animateur.
+        @details Le SessionServer reçoit une copie de la session et tourne dans son propre thread ;
+                 cette fenêtre le rejoint comme observateur (relance du vote, validation) pendant
+                 que chaque joueur vote depuis son poste.
+        @see SessionServer
+        """
+        import socket
+        from controllers.SessionServer import SessionServer
+
+        self.stop_hosting()
+        hosted = GameSession()
+        hosted.from_dict(self.game_session.to_dict())
+        try:
+            self.server = SessionServer(hosted, host="0.0.0.0")
+            _, port = self.server.start_in_thread()
+        except OSError as e:
+            self.server = None
+            CustomPopup("Erreur", f"Impossible d'héberger la partie :\n{e}", type="error")
+            return
+
+        if self.join_game("127.0.0.1", port, None):
+            CustomPopup("Partie réseau", f"Partie hébergée sur {socket.gethostname()}:{port}\n"
+                                         "Les joueurs peuvent la rejoindre depuis l'accueil.", type="info")
+
+    def join_game(self, host, port, player):
+        """!
+        @brief Rejoint une partie hébergée : la GameView devient client du serveur.
+        @param host Adresse du serveur.
+        @param port Port du serveur.
+        @param player Nom du joueur local (None : observateur).
+        @return True si la connexion a réussi.
+        """
+        import asyncio
+        from controllers.RemoteGameController import RemoteGameController
+
+        self.leave_remote_game()
+        remote = RemoteGameController(self, player)
+        try:
+            remote.connect(host, int(port))
+        except (OSError, ValueError, asyncio.TimeoutError) as e:
+            CustomPopup("Erreur", f"Impossible de rejoindre la partie :\n{e}", type="error")
+            return False
+        self.remote_controller = remote
+        self.show_game()
+        return True
+
+    def leave_remote_game(self):
+        """!
+        @brief Quitte la partie réseau rejointe, s'il y en a une.
+        @note La session locale garde le dernier état reçu.
+        """
+        if self.remote_controller is not None:
+            self.remote_controller.close()
+            self.remote_controller = None
+
+    def stop_hosting(self):
+        """!
+        @brief Arrête le serveur de la partie hébergée, s'il y en a un.
+        """
+        if self.server is not None:
+            self.server.stop()
+            self.server = None
+
+    def pause_hosted_game(self):
+        """!
+        @brief Pause café d'une partie hébergée : arrête le serveur puis sauvegarde sa session.
+        @details Même règle qu'en partie locale (GameController.save_game_state_and_quit) : la partie
+                 est enregistrée en PAUSED pour être reprise via « Charger Partie ». L'arrêt du
+                 serveur renvoie les joueurs à l'accueil ; personne ne reste sur un tour bloqué.
+        """
+        server = self.server
+        self.leave_remote_game()
+        self.stop_hosting()
+        if server is not None:
+            self.game_session.from_dict(server.session.to_dict())
+        self.game_controller.save_game_state_and_quit()
+
     def show_result(self): 
         """!
         @brief Affiche la vue des résultats de fin de partie.
         @see ResultController
+        @note Ne touche pas au journal de reprise : afficher une archive terminée ne doit pas effacer
+              une partie interrompue (voir GameController.finish_game).
         """
-        result_frame = self.view.frames["ResultView"]
+        result_frame = self.view.get_frame("ResultView")
         result_frame.controller = self.result_controller
-        result_frame.refresh_ui()
+        result_frame.schedule_refresh()
         self.view.show_frame("ResultView")
 
     def quit_app(self):
         """!
         @brief Quitte l'application.
-        @note Déclenche la fermeture de la fenêtre principale.
+        @note Attend (au plus quelques secondes) la fin des sauvegardes en cours avant de fermer la fenêtre.
         """
+        self.writer.flush(timeout=5)
+        self.leave_remote_game()
+        self.stop_hosting()
         self.view.quit_app()
\ No newline at end of file
@@ -0,0 +1,288 @@
+import asyncio
+import queue
+import threading
+
+from controllers.SessionServer import SessionClient
+from models.GameRules import DECK
+
+
+class RemoteGameController:
+    """!
+    @brief Contrôleur de jeu client : expose l'interface de GameController à la GameView,
+           mais joue sur une partie hébergée par un SessionServer.
+    @details La connexion tourne dans une boucle asyncio sur un thread dédié ; chaque état reçu
+             est appliqué sur le thread Tk (relève via after(), comme SessionWriter) à une copie
+             locale de la session, puis la vue est repeinte. Après l'état initial, le serveur
+             n'envoie que des deltas, appliqués par le SessionClient. Les votes sont envoyés au serveur, qui
+             révèle le tour au dernier vote reçu.
+    @attributes
+        model GameSession locale, miroir de la partie hébergée.
+        main_controller Contrôleur principal pour la navigation.
+        player Nom du joueur local (None : observateur/animateur, qui ne vote pas).
+        deck Liste des valeurs de cartes disponibles.
+        revealed Indique si les votes sont révélés.
+        result Issue du tour révélé, calculée par le serveur.
+        journal Toujours None : la partie est journalisée côté serveur.
+    """
+
+    def __init__(self, main_controller, player=None, poll_ms=30):
+        """!
+        @brief Prépare le client sans se connecter.
+        @param main_controller Instance du MainController (sa GameSession sert de miroir).
+        @param player Nom du joueur local, ou None pour suivre la partie sans voter.
+        @param poll_ms Période de relève des messages reçus côté Tk.
+        @example
+            remote = RemoteGameController(main_controller, "Alice")
+            remote.connect("192.168.1.20", 8765)
+        """
+        self.model = main_controller.game_session
+        self.main_controller = main_controller
+        self.player = player
+        self.deck = list(DECK)
+        self.revealed = False
+        self.result = None
+        self.journal = None
+        self.poll_ms = poll_ms
+
+        self._client = SessionClient(player)
+        self._inbox = queue.Queue()
+        self._loop = None
+        self._thread = None
+
+    def connect(self, host, port, timeout=5):
+        """!
+        @brief Se connecte au serveur et applique l'état initial de la partie.
+        @param host Adresse du serveur.
+        @param port Port du serveur.
+        @param timeout Délai maximal de connexion (secondes).
+        @raises OSError Si le serveur est injoignable.
+        @raises ValueError Si le serveur refuse le joueur.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="RemoteGame", daemon=True)
+        self._thread.start()
+        try:
+            state = asyncio.run_coroutine_threadsafe(
+                asyncio.wait_for(self._client.connect(host, port), timeout), self._loop).result()
+        except BaseException:
+            self._stop_loop()
+            raise
+        self._apply_state(state)
+        asyncio.run_coroutine_threadsafe(self._receive_loop(), self._loop)
+        self._schedule_poll()
+
+    def close(self):
+        """!
+        @brief Quitte la partie et arrête le thread réseau.
+        """
+        if self._loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._client.close(), self._loop).result(timeout=2)
+        except Exception:
+            pass
+        self._stop_loop()
+
+    def _stop_loop(self):
+        """!
+        @brief Arrête la boucle asyncio du thread réseau, puis la ferme avec ses sockets.
+        @note Les tâches encore en attente (boucle de réception) sont annulées avant la fermeture ;
+              si le thread ne s'arrête pas à temps, la boucle est abandonnée au thread démon.
+        """
+        loop, thread = self._loop, self._thread
+        self._loop = self._thread = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=2)
+        if thread.is_alive():
+            return
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.wait(pending))
+        loop.close()
+
+    async def _receive_loop(self):
+        """!
+        @brief Place chaque message reçu dans la file relevée par le thread Tk.
+        @note Un état complet ou un delta est transmis sous forme de copie de l'état tenu par le
+              SessionClient (le backlog n'est recopié qu'avec un état complet). Une déconnexion est
+              signalée par un message de type "closed".
+        """
+        try:
+            while True:
+                message = await self._client.receive()
+                if message is None:
+                    break
+                if message["type"] in ("state", "delta"):
+                    state = self._client.state
+                    message = dict(state, voted=list(state["voted"]), validated=dict(state["validated"]),
+                                   backlog=state["backlog"] if message["type"] == "state" else None)
+                self._inbox.put(message)
+        except (ConnectionError, ValueError):
+            pass
+        self._inbox.put({"type": "closed"})
+
+    def _schedule_poll(self):
+        """!
+        @brief Programme la relève des messages reçus sur le thread Tk.
+        """
+        self.main_controller.view.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """!
+        @brief Applique les messages reçus, repeint la vue, puis se reprogramme tant que la connexion est ouverte.
+        @note Plusieurs états reçus entre deux relèves ne produisent qu'une navigation/repeinte.
+        """
+        if self._loop is None:
+            return
+        state = None
+        while True:
+            try:
+                message = self._inbox.get_nowait()
+            except queue.Empty:
+                break
+            if message["type"] == "state":
+                state = message
+            elif message["type"] == "error":
+                print(f"Serveur : {message['message']}")
+            elif message["type"] == "closed":
+                self._on_disconnected()
+                return
+
+        if state is not None:
+            self._apply_state(state)
+            if state["status"] == "FINISHED":
+                self.main_controller.show_result()
+            else:
+                self.main_controller.show_game()
+        self._schedule_poll()
+
+    def _on_disconnected(self):
+        """!
+        @brief Retour à l'accueil quand le serveur ferme la connexion.
+        """
+        from views.CustomPopup import CustomPopup
+        self._stop_loop()
+        self.main_controller.leave_remote_game()
+        self.main_controller.show_home()
+        CustomPopup("Partie réseau", "La connexion avec l'hôte a été perdue.", type="warning")
+
+    def _apply_state(self, state):
+        """!
+        @brief Recopie un état reçu du serveur dans la session locale.
+        @param state Message "state" du serveur.
+        @note Avant la révélation, seuls les noms des votants sont connus : leurs votes valent None.
+        """
+        session = self.model
+        if state.get("backlog") is not None:
+            session.backlog.clear()
+            session.backlog.add_features(state["backlog"])
+        if tuple(state["players"]) != session.get_player_names():
+            session.players.clear()
+            for name in state["players"]:
+                session.add_player(name)
+        session.rules.set_mode(state["rule"])
+        session.current_feature_index = state["feature_index"]
+        session.current_round_number = state["round"]
+        session.validated_features = dict(state["validated"])
+        session.votes.restore(state["votes"] if state["votes"] is not None else dict.fromkeys(state["voted"]))
+        self.revealed = state["revealed"]
+        self.result = state["result"]
+
+    def _send(self, kind, **fields):
+        """!
+        @brief Envoie un message au serveur sans attendre.
+        """
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._client.send(kind, **fields), self._loop)
+
+    # --- Interface GameController utilisée par la GameView ---
+
+    def reset(self):
+        """!
+        @brief Sans effet : l'état du tour est celui du serveur.
+        """
+
+    def get_current_feature_name(self):
+        """!
+        @brief Récupère le nom de la fonctionnalité courante.
+        @return Nom de la fonctionnalité ou None.
+        """
+        return self.model.get_current_feature()
+
+    def get_current_player_name(self):
+        """!
+        @brief Joueur attendu : le joueur local s'il n'a pas voté, sinon le premier joueur qui n'a pas voté.
+        @return Nom du joueur, ou None si tout le monde a voté.
+        """
+        votes = self.model.votes
+        if self.player is not None and self.player not in votes:
+            return self.player
+        for name in self.model.get_player_names():
+            if name not in votes:
+                return name
+        return None
+
+    def cast_vote(self, card_value):
+        """!
+        @brief Envoie le vote du joueur local (un vote déjà envoyé est remplacé).
+        @param card_value Valeur de la carte choisie.
+        @return True si le vote est envoyé, False pour un observateur ou un tour révélé.
+        @note Le statut "A voté" est affiché immédiatement ; l'état du serveur suit. Un second vote
+              est envoyé comme changement ("change"), le serveur refusant les doubles votes.
+        """
+        if self.player is None or self.revealed:
+            return False
+        self._send("change" if self.player in self.model.votes else "vote", card=card_value)
+        self.model.votes.record(self.player, None)
+        return True
+
+    def is_round_finished(self):
+        """!
+        @brief Toujours False : c'est le serveur qui révèle le tour au dernier vote.
+        """
+        return False
+
+    def reveal_votes(self):
+        """!
+        @brief Sans effet : la révélation est décidée par le serveur.
+        """
+
+    def get_votes(self):
+        """!
+        @brief Récupère les votes connus du tour.
+        @return Dictionnaire {joueur: valeur}, valeurs à None avant la révélation.
+        """
+        return self.model.votes
+
+    def handle_end_of_round(self):
+        """!
+        @brief Issue du tour calculée par le serveur.
+        @return "COFFEE", "REVOTE" ou l'estimation.
+        @note Pause café : dans la fenêtre de l'hôte, la session hébergée est sauvegardée et le
+              serveur arrêté (MainController.pause_hosted_game) ; les autres clients quittent la
+              partie et reviennent à l'accueil.
+        """
+        if self.result == "COFFEE":
+            if self.main_controller.server is not None:
+                self.main_controller.pause_hosted_game()
+            else:
+                from views.CustomPopup import CustomPopup
+                self.main_controller.leave_remote_game()
+                self.main_controller.show_home()
+                CustomPopup("Partie réseau", "Pause café : l'hôte sauvegarde la partie.", type="info")
+        return self.result
+
+    def restart_round(self):
+        """!
+        @brief Demande au serveur de relancer le vote sur la même fonctionnalité.
+        """
+        self._send("revote")
+
+    def validate_feature(self, final_score):
+        """!
+        @brief Demande au serveur de valider l'estimation et de passer à la fonctionnalité suivante.
+        @param final_score Score retenu.
+        """
+        self._send("validate", score=final_score)
@@ -1,5 +1,6 @@
-import json
+from functools import partial
 from tkinter import filedialog
+from models import SessionCodec
 from views.CustomPopup import CustomPopup
 
 class ResultController:
@@ -35,18 +36,24 @@ class ResultController:
         @brief Exporte les résultats finaux en JSON avec le statut FINISHED.
         @return None
         @note Ouvre une boîte de dialogue de sauvegarde ; l'utilisateur peut annuler.
-        @raises OSError Si l'écriture du fichier échoue.
+              L'écriture se fait en arrière-plan via le SessionWriter du MainController.
         """
         data = self.model.to_dict(status="FINISHED")
         
-        filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=SessionCodec.SAVE_FILETYPES)
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
-                CustomPopup("Succès", "Résultats sauvegardés avec succès !", type="info")
-            except Exception as e:
-                CustomPopup("Erreur", f"Erreur lors de la sauvegarde :\n{e}", type="error")
+            self.main_controller.writer.submit(filename, data, on_done=self._on_saved,
+                                               encoder=partial(SessionCodec.encode_for_path, filename))
+
+    def _on_saved(self, error):
+        """!
+        @brief Affiche le résultat de la sauvegarde une fois l'écriture terminée.
+        @param error Exception levée par l'écriture, ou None en cas de succès.
+        """
+        if error is None:
+            CustomPopup("Succès", "Résultats sauvegardés avec succès !", type="info")
+        else:
+            CustomPopup("Erreur", f"Erreur lors de la sauvegarde :\n{error}", type="error")
 
     def go_home(self):
         """!
@@ -0,0 +1,369 @@
+import json
+import multiprocessing
+import os
+import re
+import secrets
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from models.ConsensusEngine import ConsensusEngine
+from models.GameRules import DECK
+from models.Room import Room
+from models.SessionJournal import user_data_dir
+
+## Méthodes de Room accessibles via RoomManager.call (et donc depuis un shard).
+ROOM_METHODS = frozenset({"snapshot", "changes_since", "results", "import_backlog", "vote", "vote_many",
+                          "change_vote", "revote", "validate", "to_dict"})
+
+_ROOM_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def default_rooms_dir():
+    """!
+    @brief Emplacement par défaut des salles évincées sur disque.
+    @return Chemin du dossier (non créé ici).
+    """
+    return os.path.join(user_data_dir(), "rooms")
+
+
+def new_room_id():
+    """!
+    @brief Tire un identifiant de salle aléatoire, utilisable comme nom de fichier.
+    @return Une chaîne hexadécimale de 12 caractères.
+    """
+    return secrets.token_hex(6)
+
+
+def shard_for(room_id, shards):
+    """!
+    @brief Shard responsable d'une salle.
+    @param room_id Identifiant de la salle.
+    @param shards Nombre de shards.
+    @return Index du shard, stable d'un processus à l'autre (CRC32, pas hash() qui est salé).
+    """
+    return zlib.crc32(room_id.encode("utf-8")) % shards
+
+
+class RoomManager:
+    """!
+    @brief Héberge des milliers de salles indépendantes dans un seul processus.
+    @details Les salles résidentes sont rangées dans un OrderedDict du moins au plus récemment
+             utilisé : evict_idle() parcourt seulement le début de la file et écrit chaque salle
+             inactive dans un fichier JSON compact (écriture atomique), puis la libère. Une salle
+             évincée est rechargée à son prochain accès. Toutes les salles partagent le deck et le
+             moteur de consensus ; un verrou sérialise les accès concurrents (threads du serveur HTTP).
+    @attributes
+        directory Dossier des salles évincées.
+        deck Valeurs de cartes acceptées par toutes les salles.
+        evictions Nombre de salles écrites sur disque.
+        loads Nombre de salles rechargées depuis le disque.
+    """
+
+    def __init__(self, directory=None, deck=DECK):
+        """!
+        @brief Prépare un gestionnaire vide.
+        @param directory Dossier des salles évincées (par défaut default_rooms_dir()).
+        @param deck Valeurs de cartes acceptées.
+        @example
+            manager = RoomManager()
+            room_id = manager.create_room(["Alice", "Bob"], ["US 1", "US 2"])
+            manager.call(room_id, "vote", "Alice", "5")
+        """
+        self.directory = directory or default_rooms_dir()
+        self.deck = tuple(deck)
+        self.evictions = 0
+        self.loads = 0
+
+        self._consensus = ConsensusEngine(self.deck)
+        self._rooms = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        """!
+        @brief Nombre de salles résidentes en mémoire.
+        """
+        return len(self._rooms)
+
+    def __contains__(self, room_id):
+        """!
+        @brief Indique si la salle existe, en mémoire ou sur disque.
+        """
+        return room_id in self._rooms or (_ROOM_ID.fullmatch(room_id) is not None
+                                          and os.path.exists(self._path(room_id)))
+
+    def create_room(self, players, backlog, rule=None, room_id=None):
+        """!
+        @brief Ouvre une nouvelle salle.
+        @param players Noms des joueurs.
+        @param backlog Fonctionnalités à estimer.
+        @param rule Mode de validation (None : règle par défaut).
+        @param room_id Identifiant imposé (routage par shard), sinon tiré au hasard.
+        @return L'identifiant de la salle.
+        @raises ValueError Si l'identifiant est invalide ou déjà pris, ou si la règle est inconnue.
+        """
+        room_id = room_id or new_room_id()
+        if not _ROOM_ID.fullmatch(room_id):
+            raise ValueError(f"Identifiant de salle invalide : {room_id}")
+        room = Room.create(players, backlog, rule, self.deck, self._consensus)
+        with self._lock:
+            if room_id in self:
+                raise ValueError(f"Salle déjà existante : {room_id}")
+            self._rooms[room_id] = room
+        return room_id
+
+    def call(self, room_id, method, *args):
+        """!
+        @brief Exécute une méthode de Room sur une salle (rechargée si elle était évincée).
+        @param room_id Identifiant de la salle.
+        @param method Nom de la méthode (voir ROOM_METHODS).
+        @param args Arguments de la méthode.
+        @return La valeur retournée par la méthode.
+        @raises KeyError Si la salle n'existe pas.
+        @raises ValueError Si la méthode est inconnue ou si l'action est refusée par les règles.
+        """
+        if method not in ROOM_METHODS:
+            raise ValueError(f"Méthode de salle inconnue : {method}")
+        with self._lock:
+            return getattr(self._get(room_id), method)(*args)
+
+    def close_room(self, room_id):
+        """!
+        @brief Ferme une salle et supprime sa copie sur disque.
+        @param room_id Identifiant de la salle.
+        @return L'état final de la salle (Room.to_dict()).
+        @raises KeyError Si la salle n'existe pas.
+        """
+        with self._lock:
+            data = self._get(room_id).to_dict()
+            del self._rooms[room_id]
+            try:
+                os.remove(self._path(room_id))
+            except FileNotFoundError:
+                pass
+        return data
+
+    def evict_idle(self, max_idle):
+        """!
+        @brief Écrit sur disque et libère les salles inutilisées depuis max_idle secondes.
+        @param max_idle Durée d'inactivité minimale (0 : toutes les salles).
+        @return Nombre de salles évincées.
+        @raises OSError Si le dossier des salles n'est pas accessible en écriture.
+        """
+        deadline = time.monotonic() - max_idle
+        evicted = 0
+        with self._lock:
+            while self._rooms:
+                room_id, room = next(iter(self._rooms.items()))
+                if room.last_active > deadline:
+                    break
+                self._save(room_id, room)
+                del self._rooms[room_id]
+                evicted += 1
+            self.evictions += evicted
+        return evicted
+
+    def stats(self):
+        """!
+        @brief Compteurs du gestionnaire.
+        @return Dictionnaire {resident, evictions, loads}.
+        """
+        return {"resident": len(self._rooms), "evictions": self.evictions, "loads": self.loads}
+
+    def _get(self, room_id):
+        """!
+        @brief Retourne une salle en la marquant comme la plus récemment utilisée.
+        @raises KeyError Si la salle n'existe ni en mémoire ni sur disque.
+        """
+        room = self._rooms.get(room_id)
+        if room is None:
+            room = self._load(room_id)
+            self._rooms[room_id] = room
+        else:
+            self._rooms.move_to_end(room_id)
+        room.last_active = time.monotonic()
+        return room
+
+    def _path(self, room_id):
+        """!
+        @brief Fichier d'une salle évincée.
+        """
+        return os.path.join(self.directory, room_id + ".json")
+
+    def _save(self, room_id, room):
+        """!
+        @brief Écrit une salle sur disque de façon atomique.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(room_id)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(room.to_dict(), f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _load(self, room_id):
+        """!
+        @brief Recharge une salle évincée puis supprime son fichier.
+        @raises KeyError Si aucune salle ne porte cet identifiant.
+        """
+        if not _ROOM_ID.fullmatch(room_id):
+            raise KeyError(room_id)
+        path = self._path(room_id)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            raise KeyError(room_id) from None
+        room = Room.from_dict(data, self.deck, self._consensus)
+        os.remove(path)
+        self.loads += 1
+        return room
+
+
+def _serve_shard(conn, directory, deck):
+    """!
+    @brief Boucle d'un processus shard : exécute les commandes reçues sur son RoomManager.
+    @param conn Extrémité enfant du Pipe.
+    @param directory Dossier des salles évincées.
+    @param deck Valeurs de cartes acceptées.
+    @note Fonction de module : elle doit être importable par les processus "spawn".
+    """
+    manager = RoomManager(directory, deck)
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        method, args = request
+        try:
+            conn.send(("ok", getattr(manager, method)(*args)))
+        except (KeyError, ValueError) as e:
+            conn.send((type(e).__name__, e.args[0] if e.args else ""))
+        except OSError as e:
+            conn.send(("OSError", str(e)))
+        except Exception as e:
+            # Une commande invalide ne doit pas tuer le shard : ses salles résidentes seraient perdues
+            conn.send((type(e).__name__, str(e)))
+    conn.close()
+
+
+class ShardedRoomManager:
+    """!
+    @brief Répartit les salles entre plusieurs processus RoomManager selon leur identifiant.
+    @details Chaque shard est un processus ("spawn") qui possède son propre RoomManager : les salles
+             de shards différents sont servies en parallèle, sans partager le GIL. Une salle est
+             toujours routée vers le même shard (shard_for) ; les commandes transitent par un Pipe,
+             protégé par un verrou par shard pour pouvoir être appelées depuis plusieurs threads.
+             Même interface que RoomManager pour create_room, call, close_room, evict_idle et stats.
+    @attributes
+        shards Nombre de processus shards.
+        directory Dossier des salles évincées, commun à tous les shards.
+    """
+
+    def __init__(self, shards, directory=None, deck=DECK):
+        """!
+        @brief Démarre les processus shards.
+        @param shards Nombre de processus.
+        @param directory Dossier des salles évincées (par défaut default_rooms_dir()).
+        @param deck Valeurs de cartes acceptées.
+        @example
+            with ShardedRoomManager(4) as manager:
+                room_id = manager.create_room(["Alice", "Bob"], ["US 1"])
+        """
+        self.shards = max(1, shards)
+        self.directory = directory or default_rooms_dir()
+        context = multiprocessing.get_context("spawn")
+        self._conns = []
+        self._locks = []
+        self._processes = []
+        for index in range(self.shards):
+            parent, child = context.Pipe()
+            process = context.Process(target=_serve_shard, args=(child, self.directory, tuple(deck)),
+                                      name=f"RoomShard-{index}", daemon=True)
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._locks.append(threading.Lock())
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _request(self, shard, method, *args):
+        """!
+        @brief Envoie une commande à un shard et attend sa réponse.
+        @raises KeyError, ValueError, OSError Erreur levée dans le shard.
+        @raises RuntimeError Toute autre erreur levée dans le shard (le shard reste disponible).
+        """
+        with self._locks[shard]:
+            self._conns[shard].send((method, args))
+            status, value = self._conns[shard].recv()
+        if status == "ok":
+            return value
+        raise {"KeyError": KeyError, "ValueError": ValueError, "OSError": OSError}.get(status, RuntimeError)(value)
+
+    def create_room(self, players, backlog, rule=None, room_id=None):
+        """!
+        @brief Ouvre une salle sur le shard désigné par son identifiant.
+        @see RoomManager.create_room
+        """
+        room_id = room_id or new_room_id()
+        return self._request(shard_for(room_id, self.shards), "create_room",
+                             list(players), list(backlog), rule, room_id)
+
+    def call(self, room_id, method, *args):
+        """!
+        @brief Exécute une méthode de Room dans le shard de la salle.
+        @see RoomManager.call
+        """
+        return self._request(shard_for(room_id, self.shards), "call", room_id, method, *args)
+
+    def close_room(self, room_id):
+        """!
+        @brief Ferme une salle dans son shard.
+        @see RoomManager.close_room
+        """
+        return self._request(shard_for(room_id, self.shards), "close_room", room_id)
+
+    def evict_idle(self, max_idle):
+        """!
+        @brief Évince les salles inactives de tous les shards.
+        @return Nombre total de salles évincées.
+        @see RoomManager.evict_idle
+        """
+        return sum(self._request(shard, "evict_idle", max_idle) for shard in range(self.shards))
+
+    def stats(self):
+        """!
+        @brief Compteurs cumulés de tous les shards.
+        @return Dictionnaire {resident, evictions, loads}.
+        """
+        total = {}
+        for shard in range(self.shards):
+            for key, value in self._request(shard, "stats").items():
+                total[key] = total.get(key, 0) + value
+        return total
+
+    def close(self, timeout=5):
+        """!
+        @brief Arrête les processus shards (les salles résidentes sont perdues : évincer avant si besoin).
+        @param timeout Délai maximal d'attente par processus (secondes).
+        """
+        for conn, lock in zip(self._conns, self._locks):
+            with lock:
+                try:
+                    conn.send(None)
+                except OSError:
+                    pass
+                conn.close()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._conns, self._locks, self._processes = [], [], []
@@ -0,0 +1,421 @@
+import asyncio
+import json
+import threading
+
+from models.GameRules import DECK
+from models.Room import Room
+
+## Taille maximale d'un message (une ligne JSON), en octets.
+MAX_MESSAGE_BYTES = 1 << 16
+
+
+def encode_message(message):
+    """!
+    @brief Encode un message du protocole : un objet JSON compact par ligne, en UTF-8.
+    @param message Dictionnaire contenant au moins la clé "type".
+    @return Les octets à écrire sur le socket.
+    """
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+async def read_message(reader):
+    """!
+    @brief Lit le prochain message du protocole.
+    @param reader asyncio.StreamReader connecté.
+    @return Le dictionnaire reçu, ou None si la connexion est fermée.
+    @raises ValueError Si la ligne reçue n'est pas un objet JSON avec un champ "type".
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    message = json.loads(line)
+    if not isinstance(message, dict) or "type" not in message:
+        raise ValueError("Message invalide")
+    return message
+
+
+def _scalar(message, key):
+    """!
+    @brief Lit une valeur simple obligatoire (joueur, carte, score) dans un message.
+    @param message Message décodé.
+    @param key Clé de la valeur.
+    @return La valeur (chaîne ou nombre).
+    @raises ValueError Si la valeur est absente ou n'est ni une chaîne ni un nombre.
+    """
+    value = message.get(key)
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"'{key}' doit être une chaîne ou un nombre")
+    return value
+
+
+def apply_delta(state, delta):
+    """!
+    @brief Applique un delta du flux de changements à un état "state" reçu du serveur.
+    @param state Dictionnaire d'état, modifié sur place.
+    @param delta Delta émis par ChangeStream (voir ses types).
+    @note Les deltas ne contiennent ni le backlog ni la liste des validations : leur taille ne dépend
+          que du type de changement (un vote ne transporte que le nom du votant).
+    """
+    kind = delta["type"]
+    if kind == "vote":
+        if delta["player"] not in state["voted"]:
+            state["voted"].append(delta["player"])
+    elif kind == "reveal":
+        state.update(voted=list(delta["votes"]), votes=delta["votes"], revealed=True, result=delta["result"])
+    elif kind in ("revote", "validated"):
+        state.update(voted=[], votes=None, revealed=False, result=None)
+        if kind == "revote":
+            state["round"] = delta["round"]
+        else:
+            state["validated"][delta["feature"]] = delta["score"]
+            state.update(round=1, feature_index=delta["feature_index"], feature=delta["next"],
+                         status="IN_PROGRESS" if delta["next"] is not None else "FINISHED")
+    state["version"] = delta["v"]
+
+
+class SessionServer:
+    """!
+    @brief Serveur asyncio hébergeant une GameSession pour un vote simultané en réseau local.
+    @details Chaque joueur se connecte depuis son propre client et vote quand il le souhaite :
+             le tour est révélé dès que le dernier vote arrive, la durée d'un tour est donc celle
+             du votant le plus lent et non la somme des votes. Les règles du tour sont portées par
+             une Room ; toutes ses modifications ont lieu dans la boucle asyncio du serveur. À la
+             connexion, le client reçoit l'état complet (backlog compris) ; ensuite, seuls les deltas
+             versionnés du flux de changements de la session sont diffusés, si bien qu'un vote coûte
+             la même bande passante quelle que soit la taille du backlog. Les valeurs des votes ne
+             sont envoyées qu'après la révélation.
+    @note Protocole : un objet JSON par ligne. Messages client : join {player} (null : observateur),
+          vote {card}, change {card}, revote, validate {score}, state, sync {version}.
+          Messages serveur : state, delta {changes}, error {message}.
+    @attributes
+        session GameSession hébergée.
+        room Salle portant les règles du vote sur cette session.
+        host Adresse d'écoute.
+        port Port d'écoute (attribué par le système si 0, connu après start()).
+        revealed Indique si les votes du tour sont révélés.
+        result Issue du tour révélé ("COFFEE", "REVOTE" ou l'estimation), None avant la révélation.
+    """
+
+    def __init__(self, session, deck=DECK, host="127.0.0.1", port=0):
+        """!
+        @brief Prépare le serveur sans ouvrir de socket.
+        @param session GameSession configurée (joueurs, backlog, règle).
+        @param deck Valeurs de cartes acceptées.
+        @param host Adresse d'écoute ("0.0.0.0" pour tout le réseau local).
+        @param port Port d'écoute (0 : port libre choisi par le système).
+        @example
+            server = SessionServer(session, host="0.0.0.0", port=8765)
+            host, port = server.start_in_thread()
+        """
+        self.session = session
+        self.room = Room(session, deck)
+        self.host = host
+        self.port = port
+
+        self._server = None
+        self._clients = {}
+        self._sent_version = session.changes.version
+        self._loop = None
+        self._thread = None
+
+    async def start(self):
+        """!
+        @brief Ouvre le socket d'écoute.
+        @raises OSError Si l'adresse est déjà utilisée ou indisponible.
+        """
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port,
+                                                  limit=MAX_MESSAGE_BYTES)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """!
+        @brief Ferme le socket d'écoute et toutes les connexions.
+        """
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._clients):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def start_in_thread(self):
+        """!
+        @brief Démarre le serveur dans un thread dédié (sa propre boucle asyncio).
+        @return Tuple (hôte, port) d'écoute.
+        @raises OSError Si le socket ne peut pas être ouvert.
+        @note Permet d'héberger une partie depuis l'application Tk sans bloquer mainloop.
+        """
+        started = threading.Event()
+        errors = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self.start())
+            except OSError as e:
+                errors.append(e)
+                started.set()
+                return
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="SessionServer", daemon=True)
+        self._thread.start()
+        started.wait()
+        if errors:
+            raise errors[0]
+        return self.host, self.port
+
+    def stop(self, timeout=5):
+        """!
+        @brief Arrête un serveur démarré par start_in_thread().
+        @param timeout Délai maximal d'attente du thread (secondes).
+        """
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._thread = None
+
+    @property
+    def revealed(self):
+        """!
+        @brief Indique si les votes du tour sont révélés.
+        """
+        return self.room.revealed
+
+    @property
+    def result(self):
+        """!
+        @brief Issue du tour révélé, None avant la révélation.
+        """
+        return self.room.result
+
+    def snapshot(self, full=False):
+        """!
+        @brief État public de la partie, tel qu'envoyé aux clients.
+        @see Room.snapshot
+        """
+        return self.room.snapshot(full)
+
+    def vote(self, player, card):
+        """!
+        @brief Enregistre le vote d'un joueur ; révèle le tour au dernier vote.
+        @see Room.vote
+        """
+        self.room.vote(player, card)
+
+    def change_vote(self, player, card):
+        """!
+        @brief Remplace le vote d'un joueur avant la révélation.
+        @see Room.change_vote
+        """
+        self.room.change_vote(player, card)
+
+    def revote(self):
+        """!
+        @brief Relance un tour de vote sur la même fonctionnalité.
+        @see Room.revote
+        """
+        self.room.revote()
+
+    def validate(self, score):
+        """!
+        @brief Valide l'estimation de la fonctionnalité courante et passe à la suivante.
+        @see Room.validate
+        """
+        self.room.validate(score)
+
+    async def _handle_client(self, reader, writer):
+        """!
+        @brief Boucle de lecture d'une connexion client.
+        @note Une erreur de protocole ou de règle est renvoyée au seul client fautif ; elle ne ferme
+              pas sa connexion.
+        """
+        self._clients[writer] = None
+        try:
+            while True:
+                try:
+                    message = await read_message(reader)
+                except (ValueError, asyncio.LimitOverrunError) as e:
+                    await self._send(writer, {"type": "error", "message": f"Message invalide : {e}"})
+                    continue
+                if message is None:
+                    break
+                try:
+                    reply = self._dispatch(writer, message)
+                except (ValueError, TypeError) as e:
+                    await self._send(writer, {"type": "error", "message": str(e)})
+                    continue
+                if reply is None:
+                    await self._broadcast()
+                else:
+                    await self._send(writer, reply)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+
+    def _dispatch(self, writer, message):
+        """!
+        @brief Applique un message client à la partie.
+        @param writer Flux de la connexion émettrice.
+        @param message Message décodé.
+        @return La réponse destinée au seul émetteur, ou None si la partie a changé
+                (les deltas sont alors diffusés à tous les clients).
+        @raises ValueError Si le message est inconnu, mal formé (joueur, carte ou score qui n'est ni
+                une chaîne ni un nombre) ou refusé par les règles.
+        """
+        kind = message["type"]
+        if kind == "join":
+            player = message.get("player")
+            if player is not None:
+                player = _scalar(message, "player")
+            if player is not None and player not in self.session.players:
+                raise ValueError(f"Joueur inconnu : {player}")
+            self._clients[writer] = player
+            return self.snapshot(full=True)
+        if kind == "state":
+            return self.snapshot(full=True)
+        if kind == "sync":
+            return self._sync(message.get("version"))
+        if kind in ("vote", "change"):
+            player = self._clients.get(writer)
+            if player is None:
+                raise ValueError("Rejoindre la partie en tant que joueur avant de voter")
+            card = _scalar(message, "card")
+            if kind == "vote":
+                self.vote(player, card)
+            else:
+                self.change_vote(player, card)
+            return None
+        if kind == "revote":
+            self.revote()
+            return None
+        if kind == "validate":
+            self.validate(_scalar(message, "score"))
+            return None
+        raise ValueError(f"Type de message inconnu : {kind}")
+
+    def _sync(self, version):
+        """!
+        @brief Réponse à une demande de resynchronisation.
+        @param version Dernière version appliquée par le client.
+        @return Les deltas manquants, ou l'état courant (sans backlog) si la version n'est plus disponible.
+        """
+        changes = self.session.changes.since(version) if isinstance(version, int) else None
+        if changes is None:
+            return self.snapshot()
+        return {"type": "delta", "changes": changes}
+
+    async def _send(self, writer, message):
+        """!
+        @brief Envoie un message à un client.
+        """
+        writer.write(encode_message(message))
+        await writer.drain()
+
+    async def _broadcast(self):
+        """!
+        @brief Diffuse à tous les clients connectés les deltas émis depuis la dernière diffusion.
+        @note Le message est encodé une seule fois ; un client déconnecté est ignoré. Si l'historique
+              du flux ne couvre plus la dernière diffusion, l'état courant est envoyé à la place.
+        """
+        changes = self.session.changes.since(self._sent_version)
+        self._sent_version = self.session.changes.version
+        if changes == []:
+            return
+        payload = encode_message(self.snapshot() if changes is None else {"type": "delta", "changes": changes})
+        writers = list(self._clients)
+        for writer in writers:
+            writer.write(payload)
+        for writer in writers:
+            try:
+                await writer.drain()
+            except ConnectionError:
+                self._clients.pop(writer, None)
+
+
+class SessionClient:
+    """!
+    @brief Client asyncio du protocole SessionServer.
+    @details Le client tient à jour une copie de l'état de la partie : chaque état complet la
+             remplace, chaque delta y est appliqué dans l'ordre des versions. Un trou dans les
+             versions (delta manqué) déclenche une demande "sync" depuis la dernière version appliquée.
+    @attributes
+        player Nom du joueur représenté (None : observateur).
+        state Dernier état connu de la partie (message "state" mis à jour par les deltas), None avant connexion.
+    """
+
+    def __init__(self, player=None):
+        """!
+        @brief Prépare le client sans se connecter.
+        @param player Nom du joueur, ou None pour un observateur (animateur).
+        """
+        self.player = player
+        self.state = None
+        self._reader = None
+        self._writer = None
+
+    async def connect(self, host, port):
+        """!
+        @brief Se connecte au serveur puis rejoint la partie.
+        @param host Adresse du serveur.
+        @param port Port du serveur.
+        @return Le premier état reçu (l'état complet, aussi conservé dans state).
+        @raises OSError Si la connexion échoue.
+        @raises ValueError Si le serveur refuse le joueur.
+        """
+        self._reader, self._writer = await asyncio.open_connection(host, port, limit=MAX_MESSAGE_BYTES)
+        await self.send("join", player=self.player)
+        message = await self.receive()
+        if message is None or message["type"] == "error":
+            await self.close()
+            raise ValueError(message["message"] if message else "Connexion refusée")
+        return message
+
+    async def send(self, kind, **fields):
+        """!
+        @brief Envoie un message au serveur.
+        @param kind Type du message ("vote", "change", "revote", "validate", "state", "sync").
+        @param fields Champs du message (ex: card="5").
+        """
+        self._writer.write(encode_message(dict(fields, type=kind)))
+        await self._writer.drain()
+
+    async def receive(self):
+        """!
+        @brief Attend le prochain message du serveur et met à jour state.
+        @return Le message, ou None si la connexion est fermée.
+        @see apply_delta
+        """
+        message = await read_message(self._reader)
+        if message is None:
+            return None
+        if message["type"] == "state":
+            self.state = message
+        elif message["type"] == "delta" and self.state is not None:
+            for delta in message["changes"]:
+                version = self.state["version"]
+                if delta["v"] <= version:
+                    continue
+                if delta["v"] != version + 1:
+                    await self.send("sync", version=version)
+                    break
+                apply_delta(self.state, delta)
+        return message
+
+    async def close(self):
+        """!
+        @brief Ferme la connexion.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._writer = None
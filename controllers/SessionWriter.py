@@ -0,0 +1,188 @@
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+
+
+def encode_json(data):
+    """!
+    @brief Sérialiseur par défaut : JSON indenté, identique aux exports historiques.
+    @param data Données à sérialiser.
+    @return Les octets UTF-8 à écrire.
+    """
+    return json.dumps(data, indent=4).encode("utf-8")
+
+
+def _target_mode(path):
+    """!
+    @brief Droits à donner au fichier écrit par atomic_write().
+    @param path Chemin final du fichier.
+    @return Les droits du fichier existant, sinon 0666 moins l'umask du processus.
+    """
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write(path, payload):
+    """!
+    @brief Écrit un fichier de façon atomique (fichier temporaire puis renommage).
+    @param path Chemin final du fichier.
+    @param payload Contenu en octets.
+    @raises OSError Si l'écriture ou le renommage échoue ; le fichier existant reste intact.
+    @note mkstemp crée le fichier temporaire en 0600 : on lui redonne les droits du fichier
+          remplacé, ou ceux d'un open() classique (0666 moins l'umask) pour un nouveau fichier.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix="." + os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        os.fchmod(fd, _target_mode(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SessionWriter:
+    """!
+    @brief Service d'écriture partagé : sérialise et écrit les sauvegardes hors du thread Tk.
+    @details Les demandes sont placées dans une file par chemin de destination ; plusieurs
+             demandes rapprochées pour le même fichier sont fusionnées en une seule écriture
+             (seules les dernières données sont écrites). Chaque écriture est atomique.
+             Les callbacks de fin sont rappelés sur le thread Tk via after(), sans bloquer mainloop.
+    @attributes
+        writes Nombre d'écritures effectuées.
+        coalesced Nombre de demandes fusionnées avec une demande en attente.
+    """
+
+    def __init__(self, root=None, coalesce_delay=0.05, poll_ms=50):
+        """!
+        @brief Prépare le service sans démarrer de thread.
+        @param root Widget Tk utilisé pour after() ; sans root, les callbacks sont rappelés par flush().
+        @param coalesce_delay Délai (secondes) d'attente des demandes suivantes avant d'écrire.
+        @param poll_ms Période de relève des écritures terminées côté Tk.
+        @example
+            writer = SessionWriter(root=main_window)
+        """
+        self.root = root
+        self.coalesce_delay = coalesce_delay
+        self.poll_ms = poll_ms
+        self.writes = 0
+        self.coalesced = 0
+
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._busy = False
+        self._done = queue.Queue()
+        self._thread = None
+        self._polling = False
+
+    def submit(self, path, data, on_done=None, encoder=encode_json):
+        """!
+        @brief Demande l'écriture de données dans un fichier.
+        @param path Chemin du fichier de destination.
+        @param data Données à sérialiser ; elles ne doivent plus être modifiées par l'appelant.
+        @param on_done Callback optionnel on_done(erreur) appelé sur le thread Tk (erreur vaut None en cas de succès).
+        @param encoder Fonction data -> bytes exécutée sur le thread d'écriture.
+        @note Si une demande pour le même chemin attend encore, elle est remplacée
+              et son callback sera rappelé avec le résultat de l'écriture fusionnée.
+        """
+        with self._cond:
+            callbacks = [on_done] if on_done else []
+            if path in self._pending:
+                self.coalesced += 1
+                callbacks = self._pending[path][2] + callbacks
+            self._pending[path] = (data, encoder, callbacks)
+            self._cond.notify()
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="SessionWriter", daemon=True)
+                self._thread.start()
+
+        self._schedule_poll()
+
+    def _run(self):
+        """!
+        @brief Boucle du thread d'écriture.
+        """
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                self._busy = True
+
+            # Laisse le temps aux demandes d'une même rafale d'arriver.
+            if self.coalesce_delay:
+                time.sleep(self.coalesce_delay)
+
+            with self._cond:
+                path = next(iter(self._pending))
+                data, encoder, callbacks = self._pending.pop(path)
+
+            error = None
+            try:
+                atomic_write(path, encoder(data))
+            except Exception as exc:
+                error = exc
+
+            with self._cond:
+                self.writes += 1
+                self._busy = bool(self._pending)
+                self._done.put((callbacks, error))
+                self._cond.notify_all()
+
+    def _schedule_poll(self):
+        """!
+        @brief Programme la relève des écritures terminées sur le thread Tk.
+        """
+        if self.root is None or self._polling:
+            return
+        self._polling = True
+        self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """!
+        @brief Rappelle les callbacks des écritures terminées, puis se reprogramme si besoin.
+        """
+        self._polling = False
+        with self._cond:
+            active = self._busy or bool(self._pending)
+        self._drain()
+        if active or not self._done.empty():
+            self._schedule_poll()
+
+    def _drain(self):
+        """!
+        @brief Exécute les callbacks en attente dans le thread appelant.
+        """
+        while True:
+            try:
+                callbacks, error = self._done.get_nowait()
+            except queue.Empty:
+                return
+            for callback in callbacks:
+                callback(error)
+
+    def flush(self, timeout=None):
+        """!
+        @brief Attend la fin de toutes les écritures en attente et rappelle leurs callbacks.
+        @param timeout Délai maximal (secondes), None pour attendre indéfiniment.
+        @return True si toutes les écritures sont terminées.
+        @note Utilisé à la fermeture de l'application et dans les tests.
+        """
+        with self._cond:
+            finished = self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+        self._drain()
+        return finished
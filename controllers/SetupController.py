@@ -1,5 +1,6 @@
-import json
 from tkinter import filedialog
+from models import SessionStream
+from models.GameSession import GameSession
 from views.CustomPopup import CustomPopup
 
 class SetupController:
@@ -79,7 +80,7 @@ class SetupController:
         @return Liste des modes de validation.
         @see GameRules.available_modes
         """
-        return self.model.rules.available_modes
+        return list(self.model.rules.available_modes)
 
     def set_rule(self, rule_name):
         """!
@@ -93,61 +94,95 @@ class SetupController:
         """!
         @brief Exporte les données de la session (joueurs, backlog, règle) dans un fichier JSON.
         @details Ouvre une boîte de dialogue pour choisir l'emplacement de sauvegarde.
-        @raises OSError Si l'écriture du fichier échoue.
+                 L'écriture se fait en arrière-plan via le SessionWriter du MainController.
         """
         data = {
-            "players": self.get_players(),
-            "features": self.get_features(),
+            "players": list(self.get_players()),
+            "features": list(self.get_features()),
             "rule": self.model.rules.selected_mode
         }
         filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
-                CustomPopup("Export Réussi", "La partie a été sauvegardée avec succès !", type="info")
-            except Exception as e:
-                CustomPopup("Erreur d'export", f"Une erreur est survenue :\n{e}", type="error")
+            self.main_controller.writer.submit(filename, data, on_done=self._on_exported)
+
+    def _on_exported(self, error):
+        """!
+        @brief Affiche le résultat de l'export une fois l'écriture terminée.
+        @param error Exception levée par l'écriture, ou None en cas de succès.
+        """
+        if error is None:
+            CustomPopup("Export Réussi", "La partie a été sauvegardée avec succès !", type="info")
+        else:
+            CustomPopup("Erreur d'export", f"Une erreur est survenue :\n{error}", type="error")
     
     def import_data(self):
         """!
         @brief Importe les données d'une session depuis un fichier JSON.
         @details Ouvre une boîte de dialogue pour choisir le fichier et met à jour le modèle.
+                 Joueurs et fonctionnalités sont lus en streaming dans une session temporaire :
+                 la configuration en cours n'est remplacée que si tout le fichier est valide.
         @return True si l'import a réussi, False sinon.
         @raises ValueError Si le fichier ne contient pas les clés attendues.
         """
         filename = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    self.model.players.clear()
-                    self.model.backlog.features.clear()
-                    
-                    for p in data.get("players", []):
-                        self.model.add_player(p)
-                    for feat in data.get("features", []):
-                        self.model.backlog.add_feature(feat)
-                    
-                    rule = data.get("rule")
-                    if rule:
-                        self.set_rule(rule)
+                staged = GameSession()
+                with open(filename, 'rb') as f:
+                    data = SessionStream.stream_into_session(staged, f, SessionStream.SETUP_TARGETS,
+                                                             progress=self.main_controller.report_progress)
+                rule = data.get("rule")
+                if rule:
+                    staged.rules.set_mode(rule)
+                self._apply_setup(staged)
+                self.main_controller.view.show_progress(None)
 
                 CustomPopup("Import Réussi", "Données chargées avec succès !", type="info")
                 return True
             except Exception as e:
+                self.main_controller.view.show_progress(None)
                 CustomPopup("Erreur d'import", f"Le fichier est corrompu :\n{e}", type="error")
                 return False
         return False
 
+    def _apply_setup(self, staged):
+        """!
+        @brief Remplace joueurs, backlog et règle du modèle par ceux d'une session importée.
+        @param staged GameSession temporaire, entièrement chargée.
+        @note Le roster et le backlog du modèle sont vidés puis remplis sur place : les objets
+              partagés avec les vues et l'urne restent les mêmes.
+        """
+        self.model.players.clear()
+        for name in staged.players.names:
+            self.model.add_player(name)
+        self.model.backlog.clear()
+        self.model.backlog.add_features(staged.backlog.features)
+        self.model.rules.set_mode(staged.rules.selected_mode)
+
     def start_game(self):
         """!
         @brief Vérifie les conditions et affiche une alerte CustomPopup si nécessaire.
         """
-        if len(self.model.players) >= 2 and self.model.backlog.features:
+        if self._can_start():
+            self.main_controller.begin_journal()
             self.main_controller.show_game()
-        else:
-            CustomPopup("Impossible de lancer", 
-                        "Pour démarrer, il faut :\n• au moins 2 joueurs\n• au moins 1 fonctionnalité", 
-                        type="warning")
\ No newline at end of file
+
+    def host_game(self):
+        """!
+        @brief Vérifie les conditions puis héberge la partie pour un vote en réseau local.
+        @see MainController.host_game
+        """
+        if self._can_start():
+            self.main_controller.host_game()
+
+    def _can_start(self):
+        """!
+        @brief Vérifie qu'une partie peut démarrer, sinon affiche une alerte CustomPopup.
+        @return True s'il y a au moins 2 joueurs et 1 fonctionnalité.
+        """
+        if len(self.model.players) >= 2 and self.model.backlog.features:
+            return True
+        CustomPopup("Impossible de lancer", 
+                    "Pour démarrer, il faut :\n• au moins 2 joueurs\n• au moins 1 fonctionnalité", 
+                    type="warning")
+        return False
\ No newline at end of file
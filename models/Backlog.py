@@ -1,17 +1,47 @@
 class Backlog:
     """!
     @brief Gère la liste des fonctionnalités (User Stories) à estimer.
+    @details Un index ordonné (dict) garantit des tests de doublon et des suppressions en O(1),
+             tandis que la liste features conserve l'ordre d'insertion et l'accès par position.
     @attributes
-        features Liste des fonctionnalités à estimer.
+        features Liste des fonctionnalités à estimer (lecture seule).
     """
 
+    __slots__ = ("_index", "_features", "_stale")
+
     def __init__(self):
         """!
         @brief Initialise un backlog vide.
         @example
             backlog = Backlog()
         """
-        self.features = []
+        self._index = {}
+        self._features = []
+        self._stale = False
+
+    @property
+    def features(self):
+        """!
+        @brief Vue ordonnée des fonctionnalités, reconstruite seulement après une suppression.
+        @return La liste des fonctionnalités.
+        @note Ne pas modifier la liste retournée : passer par add_feature/remove_feature/clear.
+        """
+        if self._stale:
+            self._features = list(self._index)
+            self._stale = False
+        return self._features
+
+    def __len__(self):
+        """!
+        @brief Nombre de fonctionnalités du backlog.
+        """
+        return len(self._index)
+
+    def __contains__(self, name):
+        """!
+        @brief Test d'appartenance en O(1).
+        """
+        return name in self._index
 
     def add_feature(self, name):
         """!
@@ -20,10 +50,29 @@ class Backlog:
         @return True si l'ajout a réussi, False si le nom est vide ou existe déjà.
         @note Le nom doit être non vide et unique.
         """
-        if name and name not in self.features:
-            self.features.append(name)
-            return True
-        return False
+        if not name or name in self._index:
+            return False
+        self._index[name] = None
+        if not self._stale:
+            self._features.append(name)
+        return True
+
+    def add_features(self, names):
+        """!
+        @brief Ajoute un lot de fonctionnalités en une seule passe.
+        @param names Itérable de noms de fonctionnalités.
+        @return Tuple (acceptées, rejetées) ; les rejets sont les noms vides ou en doublon.
+        @example
+            accepted, rejected = backlog.add_features(["Login", "Logout", "Login"])  # (2, 1)
+        """
+        accepted = rejected = 0
+        add = self.add_feature
+        for name in names:
+            if add(name):
+                accepted += 1
+            else:
+                rejected += 1
+        return accepted, rejected
 
     def remove_feature(self, name):
         """!
@@ -31,5 +80,14 @@ class Backlog:
         @param name Le nom de la fonctionnalité à retirer.
         @note Ignore les noms inexistants.
         """
-        if name in self.features:
-            self.features.remove(name)
\ No newline at end of file
+        if name in self._index:
+            del self._index[name]
+            self._stale = True
+
+    def clear(self):
+        """!
+        @brief Vide entièrement le backlog.
+        """
+        self._index.clear()
+        self._features = []
+        self._stale = False
@@ -0,0 +1,81 @@
+import threading
+from collections import deque
+from itertools import islice
+
+## Nombre de deltas conservés par défaut : quelques tours d'une salle ordinaire.
+DEFAULT_WINDOW = 32
+
+
+class ChangeStream:
+    """!
+    @brief Flux versionné des changements d'une session : petits deltas rejouables à partir d'un numéro de version.
+    @details Chaque changement reçoit le numéro de version suivant ; seuls les maxlen derniers deltas
+             sont conservés, dans une deque bornée (allouée au premier changement), pour qu'un client
+             brièvement en retard rattrape son état avec since(). Au-delà, il se resynchronise sur un
+             état complet. La fenêtre est volontairement courte : chaque salle hébergée garde son
+             flux, et un delta "reveal" contient tous les votes du tour. Les deltas ont une taille
+             indépendante du backlog : un vote ne transporte que le nom du votant.
+    @note Types de deltas : "vote" {player}, "reveal" {votes, result}, "revote" {round},
+          "validated" {feature, score, feature_index, next}.
+    @attributes
+        version Numéro du dernier changement émis (0 : aucun).
+        maxlen Nombre de deltas conservés pour since().
+    """
+
+    __slots__ = ("version", "maxlen", "_ring", "_floor", "_lock")
+
+    def __init__(self, maxlen=DEFAULT_WINDOW):
+        """!
+        @brief Crée un flux vide.
+        @param maxlen Nombre de deltas conservés.
+        @example
+            stream = ChangeStream()
+            stream.emit("vote", player="Alice")
+            stream.since(0)  # [{"v": 1, "type": "vote", "player": "Alice"}]
+        """
+        self.version = 0
+        self.maxlen = maxlen
+        self._ring = None
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    def emit(self, kind, **fields):
+        """!
+        @brief Ajoute un changement au flux.
+        @param kind Type du delta.
+        @param fields Champs du delta.
+        @return Le delta émis (avec sa version "v").
+        """
+        with self._lock:
+            if self._ring is None:
+                self._ring = deque(maxlen=self.maxlen)
+            self.version = version = self.version + 1
+            fields["v"] = version
+            fields["type"] = kind
+            self._ring.append(fields)
+            return fields
+
+    def since(self, version):
+        """!
+        @brief Deltas émis après une version donnée.
+        @param version Dernière version connue du client.
+        @return La liste des deltas (vide si le client est à jour), ou None si la version est trop
+                ancienne ou inconnue : le client doit alors repartir d'un état complet.
+        """
+        with self._lock:
+            current = self.version
+            if version == current:
+                return []
+            ring = self._ring
+            if ring is None or version > current or version < max(self._floor, current - len(ring)):
+                return None
+            return list(islice(ring, len(ring) - (current - version), None))
+
+    def skip_to(self, version):
+        """!
+        @brief Repositionne le flux sur une version sans historique (session restaurée ou répliquée).
+        @param version Nouvelle version courante.
+        """
+        with self._lock:
+            self.version = self._floor = version
+            self._ring = None
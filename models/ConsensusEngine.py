@@ -0,0 +1,168 @@
+class ConsensusEngine:
+    """!
+    @brief Calcule le consensus d'un tour de vote à partir d'un histogramme unique.
+    @details Chaque vote est converti une seule fois en index de deck, puis toutes les règles
+             (Unanimité, Majorité Absolue, Majorité Relative, Médiane, Moyenne) sont résolues
+             en parcourant l'histogramme, sans trier ni recompter les votes.
+    @attributes
+        values Valeurs numériques du deck, triées par ordre croissant.
+        ignored_cards Cartes exclues du calcul ("interro", "cafe").
+    """
+
+    def __init__(self, deck, ignored_cards=("interro", "cafe")):
+        """!
+        @brief Prépare l'index des cartes numériques du deck.
+        @param deck Liste des valeurs de cartes (chaînes) utilisées par le jeu.
+        @param ignored_cards Cartes spéciales ignorées par les calculs.
+        @example
+            engine = ConsensusEngine(["0", "1", "2", "3", "5", "8", "cafe"])
+        @note L'index n'est plus modifié ensuite : un même moteur peut servir plusieurs salles et threads.
+        """
+        self.ignored_cards = frozenset(ignored_cards)
+        self.values = sorted({value for value in map(self._card_value, deck) if value is not None})
+        self._value_index = {v: i for i, v in enumerate(self.values)}
+        self._index = {str(v): i for i, v in enumerate(self.values)}
+
+    def _card_value(self, card):
+        """!
+        @brief Valeur numérique d'une carte.
+        @param card Valeur de la carte votée.
+        @return L'entier correspondant (ex: "05" -> 5), ou None si la carte est ignorée ou non numérique.
+        """
+        if card in self.ignored_cards or not isinstance(card, str) or not card.isdigit():
+            return None
+        try:
+            return int(card)
+        except ValueError:  # chiffres Unicode ("²") acceptés par isdigit mais pas par int
+            return None
+
+    def _card_index(self, card):
+        """!
+        @brief Retourne l'index d'histogramme d'une carte du deck.
+        @param card Valeur de la carte votée.
+        @return L'index de la valeur de la carte, ou None si elle est ignorée, non numérique ou hors deck.
+        """
+        idx = self._index.get(card)
+        if idx is None:
+            value = self._card_value(card)
+            if value is not None:
+                idx = self._value_index.get(value)
+        return idx
+
+    def histogram(self, votes):
+        """!
+        @brief Construit l'histogramme des votes numériques.
+        @param votes Itérable des valeurs votées.
+        @return Tuple (compteurs par index, nombre de votes numériques, premier index voté, valeurs indexées).
+        @note Si une carte hors deck apparaît, le comptage est refait sur un index propre à ce tour :
+              l'index partagé du moteur n'est jamais modifié.
+        """
+        if not isinstance(votes, (list, tuple)):
+            votes = list(votes)
+
+        index = self._index
+        counts = [0] * len(self.values)
+        total = 0
+        first = None
+        for card in votes:
+            idx = index.get(card)
+            if idx is None:
+                idx = self._card_index(card)
+                if idx is None:
+                    if self._card_value(card) is not None:
+                        return self._off_deck_histogram(votes)
+                    continue
+            counts[idx] += 1
+            total += 1
+            if first is None:
+                first = idx
+        return counts, total, first, self.values
+
+    def _off_deck_histogram(self, votes):
+        """!
+        @brief Histogramme d'un tour contenant des valeurs hors deck, sur un index local.
+        @param votes Séquence des valeurs votées.
+        @return Même tuple que histogram().
+        """
+        numeric = [value for value in map(self._card_value, votes) if value is not None]
+        values = sorted(set(self.values).union(numeric))
+        index = {v: i for i, v in enumerate(values)}
+        counts = [0] * len(values)
+        for value in numeric:
+            counts[index[value]] += 1
+        return counts, len(numeric), index[numeric[0]], values
+
+    def resolve(self, votes, round_number, mode):
+        """!
+        @brief Calcule le résultat d'un tour selon les règles du Planning Poker.
+        @param votes Itérable des valeurs votées (chaînes).
+        @param round_number Numéro du tour (unanimité obligatoire au tour 1).
+        @param mode Règle appliquée à partir du tour 2.
+        @return Résultat entier, "?" si aucun vote numérique après le tour 1, ou None si pas de décision.
+        @example
+            engine.resolve(["5", "5", "8"], 2, "Majorité Absolue")  # 5
+        """
+        counts, total, first, values = self.histogram(votes)
+
+        if round_number == 1:
+            if not total:
+                return None
+            return values[first] if counts[first] == total else None
+
+        if not total:
+            return "?"
+
+        if mode == "Unanimité":
+            return values[first] if counts[first] == total else None
+        elif mode == "Moyenne":
+            return round(sum(c * v for c, v in zip(counts, values)) / total)
+        elif mode == "Médiane":
+            return self._median(counts, total, values)
+        elif mode == "Majorité Absolue":
+            best = max(range(len(counts)), key=counts.__getitem__)
+            return values[best] if counts[best] > total / 2 else None
+        elif mode == "Majorité Relative":
+            top = max(counts)
+            # Parcours décroissant : en cas d'égalité, la plus grande valeur l'emporte.
+            for i in range(len(counts) - 1, -1, -1):
+                if counts[i] == top:
+                    return values[i]
+
+        return None
+
+    def _median(self, counts, total, values):
+        """!
+        @brief Calcule la médiane arrondie à partir de l'histogramme.
+        @param counts Compteurs par index.
+        @param total Nombre de votes numériques.
+        @param values Valeurs correspondant aux index.
+        @return La médiane arrondie (même convention que statistics.median).
+        """
+        low_rank = (total - 1) // 2
+        high_rank = total // 2
+        low = high = None
+        seen = 0
+        for i, c in enumerate(counts):
+            if not c:
+                continue
+            seen += c
+            if low is None and seen > low_rank:
+                low = values[i]
+            if seen > high_rank:
+                high = values[i]
+                break
+        if low == high:
+            return low
+        return round((low + high) / 2)
+
+    def resolve_many(self, vote_vectors, round_number, mode):
+        """!
+        @brief Évalue un lot de vecteurs de votes avec la même règle.
+        @param vote_vectors Itérable de séquences de votes.
+        @param round_number Numéro du tour appliqué à chaque vecteur.
+        @param mode Règle appliquée à partir du tour 2.
+        @return Liste des résultats, dans l'ordre des vecteurs fournis.
+        @note Utile pour le rejeu de sessions archivées ou les simulations.
+        """
+        resolve = self.resolve
+        return [resolve(votes, round_number, mode) for votes in vote_vectors]
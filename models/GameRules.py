@@ -1,19 +1,29 @@
+## Valeurs des cartes du deck, dans l'ordre d'affichage.
+DECK = ("0", "1", "2", "3", "5", "8", "13", "20", "40", "100", "interro", "cafe")
+
+## Modes de validation disponibles, partagés par toutes les sessions.
+MODES = ("Unanimité", "Majorité Absolue", "Majorité Relative", "Médiane", "Moyenne")
+
+
 class GameRules:
     """!
     @brief Gère les règles de validation pour le Planning Poker.
     @attributes
-        available_modes Modes de validation disponibles.
+        available_modes Modes de validation disponibles (tuple partagé MODES).
         selected_mode Mode actuellement sélectionné.
     """
 
+    __slots__ = ("selected_mode",)
+
+    available_modes = MODES
+
     def __init__(self):
         """!
         @brief Initialise les règles par défaut.
-        @details Définit la liste des modes disponibles et sélectionne 'Unanimité' par défaut.
+        @details Sélectionne 'Unanimité' par défaut ; la liste des modes est commune à toutes les instances.
         @example
             rules = GameRules()
         """
-        self.available_modes = ["Unanimité", "Majorité Absolue", "Majorité Relative", "Médiane", "Moyenne"]
         self.selected_mode = "Unanimité"
 
     def set_mode(self, mode):
@@ -1,20 +1,28 @@
-from models.Player import Player
+from models.Roster import Roster
 from models.Backlog import Backlog
 from models.GameRules import GameRules
+from models.VoteCollector import VoteCollector
+from models.ChangeStream import ChangeStream
+from models import SessionStream
 
 class GameSession:
     """!
     @brief Modèle principal contenant toute la data vive de la partie.
     @attributes
-        players Liste des joueurs.
+        players Roster des joueurs (ordonné, indexé par nom).
         backlog Backlog des fonctionnalités.
         rules Règles de validation.
         current_feature_index Index de la fonctionnalité courante.
         current_round_number Numéro du tour en cours.
-        votes Votes du tour en cours.
+        votes Urne du tour en cours (VoteCollector liée au roster).
         validated_features Estimations validées par fonctionnalité.
+        round_history Historique des tours terminés (fonctionnalité, numéro de tour, votes).
+        changes Flux versionné des changements du tour (votes, révélation, revote, validation).
     """
 
+    __slots__ = ("players", "backlog", "rules", "current_feature_index", "current_round_number",
+                 "votes", "validated_features", "round_history", "changes")
+
     def __init__(self):
         """!
         @brief Initialise une nouvelle session de jeu.
@@ -31,32 +39,36 @@ class GameSession:
         @return None
         @note Remet aussi l'index de fonctionnalité et de tour à leurs valeurs initiales.
         """
-        self.players = []
+        self.players = Roster()
         self.backlog = Backlog()
         self.rules = GameRules()
         
         # --- État du Jeu ---
         self.current_feature_index = 0
         self.current_round_number = 1
-        self.votes = {} 
         self.validated_features = {}
+        self.round_history = []
+        self.changes = ChangeStream()
+        self.votes = VoteCollector(self.players, on_cast=self._on_cast)
 
     def to_dict(self, status="IN_PROGRESS"):
         """!
         @brief Convertit l'état complet de la session en dictionnaire pour l'export JSON.
         @param status Le statut de la partie ("IN_PROGRESS", "FINISHED", "PAUSED").
         @return Un dictionnaire contenant toutes les données nécessaires à la restauration.
+        @note Le dictionnaire ne partage aucune liste avec la session : il peut être sérialisé dans un autre thread.
         @example
             payload = session.to_dict(status="FINISHED")
         """
         return {
             "status": status,
             "rules": self.rules.selected_mode,
-            "players": [p.name for p in self.players],
-            "backlog": self.backlog.features,
+            "players": list(self.players.names),
+            "backlog": list(self.backlog.features),
             "current_feature_index": self.current_feature_index,
             "current_round_number": self.current_round_number,
-            "validated_features": {str(k): v for k, v in self.validated_features.items()}
+            "validated_features": {str(k): v for k, v in self.validated_features.items()},
+            "history": list(self.round_history)
         }
 
     def from_dict(self, data):
@@ -75,15 +87,59 @@ class GameSession:
             for p_name in data.get("players", []):
                 self.add_player(p_name)
                 
-            for feat in data.get("backlog", []):
-                self.backlog.add_feature(feat)
+            self.backlog.add_features(data.get("backlog", []))
                 
             self.current_feature_index = data.get("current_feature_index", 0)
             self.current_round_number = data.get("current_round_number", 1)
             
             self.validated_features = data.get("validated_features", {})
+            self.round_history = list(data.get("history", []))
+        except Exception as exc:  # Defensive in case of malformed data
+            raise ValueError("Données de session invalides") from exc
+
+    def from_stream(self, fp, batch_size=1000, progress=None, chunk_size=1 << 16):
+        """!
+        @brief Restaure l'état de la session en lisant un fichier JSON en streaming.
+        @details Équivalent de from_dict pour les très gros fichiers : joueurs, backlog et scores
+                 sont injectés par lots sans charger le document complet en mémoire.
+        @param fp Fichier ouvert en mode binaire.
+        @param batch_size Taille des lots injectés dans le modèle.
+        @param progress Callback optionnel progress(octets_lus, octets_totaux).
+        @param chunk_size Taille des blocs lus dans le fichier.
+        @return Les valeurs scalaires du fichier (dont "status").
+        @raises ValueError Si le format du fichier est invalide ou incomplet ; la session est alors inchangée.
+        @note Le fichier est lu dans une session temporaire, adoptée seulement si la lecture aboutit :
+              un fichier tronqué ou corrompu ne laisse pas une partie à moitié chargée.
+        @see SessionStream.stream_into_session
+        """
+        staged = GameSession()
+        try:
+            scalars = SessionStream.stream_into_session(staged, fp, SessionStream.SESSION_TARGETS,
+                                                        batch_size=batch_size, progress=progress,
+                                                        chunk_size=chunk_size)
+            if "rules" in scalars:
+                staged.rules.set_mode(scalars["rules"])
+            staged.current_feature_index = scalars.get("current_feature_index", 0)
+            staged.current_round_number = scalars.get("current_round_number", 1)
         except Exception as exc:  # Defensive in case of malformed data
             raise ValueError("Données de session invalides") from exc
+        self._adopt(staged)
+        return scalars
+
+    def _adopt(self, other):
+        """!
+        @brief Reprend l'état d'une autre session, avec une urne et un flux de changements neufs.
+        @param other GameSession entièrement chargée, qui ne doit plus être utilisée ensuite.
+        """
+        self.players = other.players
+        self.backlog = other.backlog
+        self.rules = other.rules
+        self.current_feature_index = other.current_feature_index
+        self.current_round_number = other.current_round_number
+        self.validated_features = other.validated_features
+        self.round_history = other.round_history
+        self.changes = ChangeStream()
+        self.votes = VoteCollector(self.players, on_cast=self._on_cast)
 
     def add_player(self, name):
         """!
@@ -92,10 +148,7 @@ class GameSession:
         @return True si l'ajout est un succès, False sinon.
         @note Le nom doit être unique et non vide.
         """
-        if not name or any(p.name == name for p in self.players):
-            return False
-        self.players.append(Player(name))
-        return True
+        return self.players.add(name)
 
     def remove_player(self, name):
         """!
@@ -104,16 +157,16 @@ class GameSession:
         @return None
         @note Ignore les noms inexistants.
         """
-        self.players = [p for p in self.players if p.name != name]
+        self.players.remove(name)
 
     def get_player_names(self):
         """!
-        @brief Récupère la liste des noms des joueurs.
-        @return Une liste de chaînes de caractères.
+        @brief Récupère les noms des joueurs dans l'ordre d'inscription.
+        @return Un tuple de chaînes de caractères, mis en cache jusqu'à la prochaine modification du roster.
         @example
             names = session.get_player_names()
         """
-        return [p.name for p in self.players]
+        return self.players.names
 
     def get_current_feature(self):
         """!
@@ -137,23 +190,67 @@ class GameSession:
             raise ValueError("Aucune fonctionnalité courante à enregistrer")
         self.validated_features[feature] = score
     
+    def cast_vote(self, player, card):
+        """!
+        @brief Enregistre le vote d'un joueur et émet un delta "vote" sans la valeur de la carte.
+        @param player Nom du joueur.
+        @param card Valeur de la carte.
+        @return True pour le vote qui complète le tour.
+        @raises ValueError Si le vote est refusé (voir VoteCollector.cast).
+        @note Le delta est émis sous le verrou de l'urne : le delta du dernier vote précède toujours la révélation.
+        """
+        return self.votes.cast(player, card)
+
+    def _on_cast(self, player):
+        """!
+        @brief Callback de l'urne : émet le delta d'un vote accepté.
+        """
+        self.changes.emit("vote", player=player)
+
+    def reveal(self, result=None):
+        """!
+        @brief Ferme l'urne et émet un delta "reveal" avec les votes du tour.
+        @param result Issue du tour si elle est déjà connue (serveur), None sinon.
+        """
+        self.votes.close()
+        self.changes.emit("reveal", votes=self.votes.snapshot(), result=result)
+
     def next_feature(self):
         """!
         @brief Passe à la fonctionnalité suivante.
-        @details Réinitialise le compteur de tours à 1 et vide les votes.
+        @details Réinitialise le compteur de tours à 1, vide les votes et émet un delta "validated".
         @return None
         @note Incrémente l'index de backlog même si aucune story suivante n'existe.
         """
+        self._archive_round()
+        feature = self.get_current_feature()
         self.current_feature_index += 1
         self.current_round_number = 1 
-        self.votes = {}
+        self.votes.reset()
+        self.changes.emit("validated", feature=feature, score=self.validated_features.get(feature),
+                          feature_index=self.current_feature_index, next=self.get_current_feature())
 
     def next_round(self):
         """!
         @brief Passe au tour de vote suivant pour la même fonctionnalité.
-        @details Incrémente le compteur de tours et vide les votes pour revoter.
+        @details Incrémente le compteur de tours, vide les votes pour revoter et émet un delta "revote".
         @return None
         @note Ne modifie pas l'index de fonctionnalité.
         """
+        self._archive_round()
         self.current_round_number += 1
-        self.votes = {}
\ No newline at end of file
+        self.votes.reset()
+        self.changes.emit("revote", round=self.current_round_number)
+
+    def _archive_round(self):
+        """!
+        @brief Conserve les votes du tour qui se termine dans round_history.
+        @note Les tours sans vote (ex: validation directe) ne sont pas archivés.
+        """
+        votes = self.votes.snapshot()
+        if votes:
+            self.round_history.append({
+                "feature": self.get_current_feature(),
+                "round": self.current_round_number,
+                "votes": votes,
+            })
\ No newline at end of file
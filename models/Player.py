@@ -1,10 +1,13 @@
 class Player:
     """!
     @brief Représente un joueur dans la session de jeu.
+    @details Utilise __slots__ pour limiter l'empreinte mémoire dans les grandes salles.
     @attributes
         name Nom du joueur.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name):
         """!
         @brief Constructeur de la classe Player.
@@ -12,4 +15,10 @@ class Player:
         @example
             player = Player("Alice")
         """
-        self.name = name
\ No newline at end of file
+        self.name = name
+
+    def __repr__(self):
+        """!
+        @brief Représentation lisible pour le débogage.
+        """
+        return f"Player({self.name!r})"
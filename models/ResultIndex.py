@@ -0,0 +1,121 @@
+import bisect
+from itertools import islice
+
+## Ordres de tri disponibles pour le bilan.
+SORT_KEYS = ("order", "name", "score")
+
+
+def score_key(score):
+    """!
+    @brief Clé de tri d'un score : valeurs numériques croissantes, puis cartes spéciales.
+    @param score Score validé (nombre ou chaîne : "?", "interro", "cafe"...).
+    @return Tuple comparable.
+    """
+    try:
+        return (0, float(score), "")
+    except (TypeError, ValueError):
+        return (1, 0.0, str(score))
+
+
+class ResultIndex:
+    """!
+    @brief Index de tri précalculé des fonctionnalités validées.
+    @details Maintient trois ordres (validation, nom, score) sous forme de listes triées,
+             mises à jour par insertion dichotomique (bisect) à chaque nouveau résultat.
+             Changer d'ordre de tri ne demande donc aucun tri complet.
+    @attributes
+        scores Dictionnaire {fonctionnalité: score} indexé.
+    """
+
+    def __init__(self):
+        """!
+        @brief Initialise un index vide.
+        """
+        self.scores = {}
+        self._source = None
+        self._by_order = []
+        self._by_name = []
+        self._by_score = []
+
+    def __len__(self):
+        """!
+        @brief Nombre de résultats indexés.
+        """
+        return len(self._by_order)
+
+    def clear(self):
+        """!
+        @brief Vide l'index.
+        """
+        self.scores = {}
+        self._source = None
+        self._by_order = []
+        self._by_name = []
+        self._by_score = []
+
+    def add(self, feature, score):
+        """!
+        @brief Indexe un nouveau résultat.
+        @param feature Nom de la fonctionnalité.
+        @param score Score validé.
+        @return Dictionnaire {ordre: position d'insertion} pour chaque clé de SORT_KEYS.
+        """
+        name_key = feature.casefold()
+        by_name = (name_key, feature)
+        by_score = (score_key(score), name_key, feature)
+
+        name_pos = bisect.bisect_right(self._by_name, by_name)
+        score_pos = bisect.bisect_right(self._by_score, by_score)
+        self._by_name.insert(name_pos, by_name)
+        self._by_score.insert(score_pos, by_score)
+        self._by_order.append(feature)
+        self.scores[feature] = score
+        return {"order": len(self._by_order) - 1, "name": name_pos, "score": score_pos}
+
+    def sync(self, results):
+        """!
+        @brief Met l'index à jour à partir du dictionnaire des résultats validés.
+        @param results Dictionnaire {fonctionnalité: score} (GameSession.validated_features).
+        @return Liste de tuples (fonctionnalité, score, positions) des résultats ajoutés,
+                ou None si l'index a été reconstruit (autre dictionnaire, ou résultats retirés/modifiés).
+        @note Les dictionnaires conservant l'ordre d'insertion, seuls les nouveaux résultats
+              (au-delà de ceux déjà indexés) sont lus.
+        """
+        count = len(self._by_order)
+        if results is not self._source or len(results) < count or \
+                (count and results.get(self._by_order[-1], self) != self.scores[self._by_order[-1]]):
+            self._rebuild(results)
+            return None
+
+        return [(feature, score, self.add(feature, score))
+                for feature, score in islice(results.items(), count, None)]
+
+    def _rebuild(self, results):
+        """!
+        @brief Reconstruit tout l'index avec un tri global (plus rapide que des insertions successives).
+        @param results Dictionnaire {fonctionnalité: score}.
+        """
+        self.scores = dict(results)
+        self._source = results
+        self._by_order = list(results)
+        self._by_name = sorted((feature.casefold(), feature) for feature in results)
+        self._by_score = sorted((score_key(score), feature.casefold(), feature)
+                                for feature, score in results.items())
+
+    def rows(self, sort="order"):
+        """!
+        @brief Résultats dans l'ordre demandé.
+        @param sort Clé de tri parmi SORT_KEYS.
+        @return Liste de tuples (fonctionnalité, score).
+        @raises ValueError Si la clé de tri est inconnue.
+        """
+        if sort == "order":
+            features = self._by_order
+        elif sort == "name":
+            features = [entry[1] for entry in self._by_name]
+        elif sort == "score":
+            features = [entry[2] for entry in self._by_score]
+        else:
+            raise ValueError(f"Tri inconnu: {sort}")
+        scores = self.scores
+        return [(feature, scores[feature]) for feature in features]
@@ -0,0 +1,240 @@
+import time
+
+from models.ConsensusEngine import ConsensusEngine
+from models.GameRules import DECK
+from models.GameSession import GameSession
+
+
+class Room:
+    """!
+    @brief Salle de vote simultané : une GameSession et l'état de révélation de son tour.
+    @details Porte les règles du vote en réseau (vote dans n'importe quel ordre, révélation au
+             dernier vote, revote, validation) indépendamment du transport : SessionServer en héberge
+             une seule, RoomManager des milliers. __slots__ et un deck/moteur de consensus partagés
+             entre salles limitent l'empreinte mémoire de chaque salle.
+    @attributes
+        session GameSession de la salle.
+        deck Valeurs de cartes acceptées.
+        consensus Moteur de consensus (partageable entre salles de même deck).
+        revealed Indique si les votes du tour sont révélés.
+        result Issue du tour révélé ("COFFEE", "REVOTE" ou l'estimation), None avant la révélation.
+        last_active Horodatage (time.monotonic) de la dernière utilisation, pour l'éviction.
+    """
+
+    __slots__ = ("session", "deck", "consensus", "revealed", "result", "last_active")
+
+    def __init__(self, session, deck=DECK, consensus=None):
+        """!
+        @brief Ouvre une salle sur une session configurée (joueurs, backlog, règle).
+        @param session GameSession de la salle.
+        @param deck Valeurs de cartes acceptées.
+        @param consensus ConsensusEngine construit sur ce deck (par défaut un moteur dédié).
+        @example
+            room = Room(session)
+            room.vote("Alice", "5")
+        """
+        self.session = session
+        self.deck = tuple(deck)
+        self.consensus = consensus or ConsensusEngine(self.deck)
+        self.revealed = False
+        self.result = None
+        self.last_active = time.monotonic()
+
+    @classmethod
+    def create(cls, players, backlog, rule=None, deck=DECK, consensus=None):
+        """!
+        @brief Construit une salle à partir de listes simples.
+        @param players Noms des joueurs.
+        @param backlog Fonctionnalités à estimer.
+        @param rule Mode de validation (None : règle par défaut).
+        @param deck Valeurs de cartes acceptées.
+        @param consensus ConsensusEngine partagé.
+        @return La nouvelle salle.
+        @raises ValueError Si la règle est inconnue.
+        """
+        session = GameSession()
+        for name in players:
+            session.add_player(name)
+        session.backlog.add_features(backlog)
+        if rule is not None:
+            session.rules.set_mode(rule)
+        return cls(session, deck, consensus)
+
+    def to_dict(self):
+        """!
+        @brief Sérialise la salle complète, tour en cours compris.
+        @return Un dictionnaire JSON-compatible.
+        @see from_dict
+        """
+        return {
+            "session": self.session.to_dict(status="IN_PROGRESS"),
+            "votes": self.session.votes.snapshot(),
+            "revealed": self.revealed,
+            "result": self.result,
+            "version": self.session.changes.version,
+        }
+
+    @classmethod
+    def from_dict(cls, data, deck=DECK, consensus=None):
+        """!
+        @brief Restaure une salle sérialisée par to_dict().
+        @param data Dictionnaire produit par to_dict().
+        @param deck Valeurs de cartes acceptées.
+        @param consensus ConsensusEngine partagé.
+        @return La salle restaurée.
+        @raises ValueError Si les données sont invalides.
+        """
+        session = GameSession()
+        session.from_dict(data["session"])
+        session.votes.restore(data.get("votes", {}))
+        room = cls(session, deck, consensus)
+        room.revealed = data.get("revealed", False)
+        room.result = data.get("result")
+        if room.revealed:
+            session.votes.close()
+        session.changes.skip_to(data.get("version", 0))
+        return room
+
+    def snapshot(self, full=False):
+        """!
+        @brief État public de la salle, tel qu'envoyé aux clients.
+        @param full Inclut le backlog complet (à la connexion et sur demande "state").
+        @return Dictionnaire du message "state" ; les valeurs des votes n'y figurent qu'après révélation.
+        @note "version" est la version du flux de changements : les deltas suivants s'appliquent dessus.
+        """
+        session = self.session
+        feature = session.get_current_feature()
+        votes = session.votes.snapshot()
+        return {
+            "type": "state",
+            "status": "IN_PROGRESS" if feature is not None else "FINISHED",
+            "feature": feature,
+            "feature_index": session.current_feature_index,
+            "backlog_size": len(session.backlog.features),
+            "round": session.current_round_number,
+            "rule": session.rules.selected_mode,
+            "players": list(session.get_player_names()),
+            "voted": list(votes),
+            "votes": votes if self.revealed else None,
+            "revealed": self.revealed,
+            "result": self.result,
+            "validated": dict(session.validated_features),
+            "backlog": list(session.backlog.features) if full else None,
+            "version": session.changes.version,
+        }
+
+    def changes_since(self, version):
+        """!
+        @brief Deltas émis depuis une version (rattrapage d'un client).
+        @param version Dernière version connue du client.
+        @return La liste des deltas, ou None si le client doit repartir de snapshot().
+        @see ChangeStream.since
+        """
+        return self.session.changes.since(version)
+
+    def results(self):
+        """!
+        @brief Estimations validées de la salle.
+        @return Dictionnaire {status, validated, remaining} ; status vaut "FINISHED" une fois le backlog épuisé.
+        """
+        session = self.session
+        remaining = max(0, len(session.backlog.features) - session.current_feature_index)
+        return {
+            "status": "IN_PROGRESS" if remaining else "FINISHED",
+            "validated": dict(session.validated_features),
+            "remaining": remaining,
+        }
+
+    def import_backlog(self, features):
+        """!
+        @brief Ajoute des fonctionnalités à la fin du backlog de la salle.
+        @param features Noms des fonctionnalités.
+        @return Tuple (nombre d'acceptées, nombre de rejetées) ; les rejets sont les noms vides ou en doublon.
+        @see Backlog.add_features
+        """
+        return self.session.backlog.add_features(features)
+
+    def vote(self, player, card):
+        """!
+        @brief Enregistre le vote d'un joueur ; révèle le tour au dernier vote.
+        @param player Nom du joueur.
+        @param card Valeur de la carte.
+        @raises ValueError Si le joueur ou la carte est inconnu, si le joueur a déjà voté
+                ou si le tour est déjà révélé.
+        @see GameSession.cast_vote
+        """
+        self._check_vote(card)
+        if self.session.cast_vote(player, card):
+            self._reveal()
+
+    def vote_many(self, votes):
+        """!
+        @brief Enregistre un lot de votes, chacun comme un appel à vote().
+        @param votes Dictionnaire {joueur: carte}.
+        @return Dictionnaire {joueur: motif} des votes refusés (vide si tout est accepté).
+        """
+        rejected = {}
+        for player, card in votes.items():
+            try:
+                self.vote(player, card)
+            except ValueError as e:
+                rejected[player] = str(e)
+        return rejected
+
+    def change_vote(self, player, card):
+        """!
+        @brief Remplace le vote d'un joueur avant la révélation.
+        @param player Nom du joueur.
+        @param card Nouvelle valeur de la carte.
+        @raises ValueError Si la carte est inconnue, si le joueur n'a pas voté ou si le tour est révélé.
+        """
+        self._check_vote(card)
+        self.session.votes.change(player, card)
+
+    def _check_vote(self, card):
+        """!
+        @brief Contrôles communs à vote() et change_vote().
+        @raises ValueError Si la carte est inconnue ou s'il n'y a plus de fonctionnalité à estimer.
+        """
+        if card not in self.deck:
+            raise ValueError(f"Carte inconnue : {card}")
+        if self.session.get_current_feature() is None:
+            raise ValueError("Le tour est terminé")
+
+    def _reveal(self):
+        """!
+        @brief Révèle le tour et calcule son issue, comme GameController.handle_end_of_round.
+        """
+        votes = self.session.votes.values()
+        self.revealed = True
+        if all(v == "cafe" for v in votes):
+            self.result = "COFFEE"
+        else:
+            result = self.consensus.resolve(votes, self.session.current_round_number,
+                                            self.session.rules.selected_mode)
+            self.result = "REVOTE" if result is None else result
+        self.session.reveal(self.result)
+
+    def revote(self):
+        """!
+        @brief Relance un tour de vote sur la même fonctionnalité.
+        @raises ValueError Si le tour n'est pas encore révélé.
+        """
+        if not self.revealed:
+            raise ValueError("Le tour n'est pas terminé")
+        self.session.next_round()
+        self.revealed = False
+        self.result = None
+
+    def validate(self, score):
+        """!
+        @brief Valide l'estimation de la fonctionnalité courante et passe à la suivante.
+        @param score Estimation retenue.
+        @raises ValueError Si le tour n'est pas révélé ou s'il n'y a plus de fonctionnalité.
+        """
+        if not self.revealed:
+            raise ValueError("Le tour n'est pas terminé")
+        self.session.save_feature_score(score)
+        self.session.next_feature()
+        self.revealed = False
+        self.result = None
@@ -0,0 +1,86 @@
+from models.Player import Player
+
+class Roster:
+    """!
+    @brief Liste ordonnée des joueurs d'une session, indexée par nom.
+    @details L'ordre d'inscription détermine l'ordre de passage. Les recherches, ajouts et
+             suppressions se font en O(1) ; le tuple des noms est mis en cache et n'est
+             recalculé qu'après une modification du roster.
+    @attributes
+        names Tuple immuable des noms, dans l'ordre d'inscription.
+    """
+
+    __slots__ = ("_players", "_names")
+
+    def __init__(self):
+        """!
+        @brief Initialise un roster vide.
+        @example
+            roster = Roster()
+        """
+        self._players = {}
+        self._names = ()
+
+    @property
+    def names(self):
+        """!
+        @brief Tuple des noms des joueurs, recalculé uniquement après modification.
+        @return Un tuple de chaînes de caractères.
+        """
+        if self._names is None:
+            self._names = tuple(self._players)
+        return self._names
+
+    def __len__(self):
+        """!
+        @brief Nombre de joueurs inscrits.
+        """
+        return len(self._players)
+
+    def __iter__(self):
+        """!
+        @brief Itère sur les objets Player dans l'ordre d'inscription.
+        """
+        return iter(self._players.values())
+
+    def __contains__(self, name):
+        """!
+        @brief Test d'appartenance par nom en O(1).
+        """
+        return name in self._players
+
+    def get(self, name):
+        """!
+        @brief Retourne le joueur portant ce nom.
+        @param name Nom du joueur.
+        @return L'objet Player ou None.
+        """
+        return self._players.get(name)
+
+    def add(self, name):
+        """!
+        @brief Inscrit un nouveau joueur.
+        @param name Nom du joueur.
+        @return True si l'ajout est un succès, False si le nom est vide ou déjà pris.
+        """
+        if not name or name in self._players:
+            return False
+        self._players[name] = Player(name)
+        self._names = None
+        return True
+
+    def remove(self, name):
+        """!
+        @brief Retire un joueur du roster.
+        @param name Nom du joueur.
+        @note Ignore les noms inexistants.
+        """
+        if self._players.pop(name, None) is not None:
+            self._names = None
+
+    def clear(self):
+        """!
+        @brief Retire tous les joueurs.
+        """
+        self._players.clear()
+        self._names = ()
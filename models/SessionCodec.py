@@ -0,0 +1,140 @@
+import gzip
+import json
+import zlib
+
+## En-tête du format compact (Planning Poker Kompact, version 1).
+COMPACT_MAGIC = b"PPK1"
+
+## En-tête d'un flux gzip (JSON compressé par un outil externe).
+GZIP_MAGIC = b"\x1f\x8b"
+
+## Extension de fichier associée au format compact.
+COMPACT_EXTENSION = ".ppk"
+
+## Types de fichiers proposés dans les boîtes de dialogue de sauvegarde de partie.
+SAVE_FILETYPES = [("JSON files", "*.json"), ("Archive compacte", "*" + COMPACT_EXTENSION)]
+
+
+def detect_format(header):
+    """!
+    @brief Détermine le format d'une sauvegarde à partir de ses premiers octets.
+    @param header Au moins les 4 premiers octets du fichier.
+    @return "compact", "gzip" ou "json".
+    """
+    if header.startswith(COMPACT_MAGIC):
+        return "compact"
+    if header.startswith(GZIP_MAGIC):
+        return "gzip"
+    return "json"
+
+
+class _StringTable:
+    """!
+    @brief Table d'internement : chaque chaîne distincte n'est stockée qu'une fois.
+    """
+
+    def __init__(self):
+        """!
+        @brief Initialise une table vide.
+        """
+        self.strings = []
+        self._index = {}
+
+    def ref(self, value):
+        """!
+        @brief Retourne l'index d'une chaîne, en l'ajoutant à la table si besoin.
+        """
+        idx = self._index.get(value)
+        if idx is None:
+            idx = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return idx
+
+
+def encode_compact(data):
+    """!
+    @brief Encode un dictionnaire de session (GameSession.to_dict) au format compact.
+    @details Les noms de joueurs, de fonctionnalités et les cartes sont internés dans une table
+             de chaînes puis référencés par index ; le document obtenu est sérialisé sans
+             espaces et compressé avec zlib, derrière l'en-tête COMPACT_MAGIC.
+    @param data Dictionnaire de session.
+    @return Les octets à écrire.
+    @example
+        raw = encode_compact(session.to_dict(status="FINISHED"))
+    """
+    table = _StringTable()
+    ref = table.ref
+    doc = {k: v for k, v in data.items() if k not in ("players", "backlog", "validated_features", "history")}
+
+    if "players" in data:
+        doc["p"] = [ref(name) for name in data["players"]]
+    if "backlog" in data:
+        doc["b"] = [ref(feature) for feature in data["backlog"]]
+    if "validated_features" in data:
+        doc["v"] = [[ref(feature), score] for feature, score in data["validated_features"].items()]
+    if "history" in data:
+        doc["h"] = [[ref(entry["feature"]) if entry["feature"] is not None else None, entry["round"],
+                     [[ref(player), ref(card)] for player, card in entry["votes"].items()]]
+                    for entry in data["history"]]
+    doc["s"] = table.strings
+
+    body = json.dumps(doc, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return COMPACT_MAGIC + zlib.compress(body, 6)
+
+
+def decode_compact(raw):
+    """!
+    @brief Décode une sauvegarde au format compact.
+    @param raw Octets du fichier, en-tête compris.
+    @return Le dictionnaire de session, au même format que GameSession.to_dict.
+    @raises ValueError Si l'en-tête ou le contenu est invalide.
+    """
+    if not raw.startswith(COMPACT_MAGIC):
+        raise ValueError("En-tête de sauvegarde compacte invalide")
+    try:
+        doc = json.loads(zlib.decompress(raw[len(COMPACT_MAGIC):]).decode("utf-8"))
+        strings = doc.pop("s")
+        data = {k: v for k, v in doc.items() if k not in ("p", "b", "v", "h")}
+        if "p" in doc:
+            data["players"] = [strings[i] for i in doc["p"]]
+        if "b" in doc:
+            data["backlog"] = [strings[i] for i in doc["b"]]
+        if "v" in doc:
+            data["validated_features"] = {strings[i]: score for i, score in doc["v"]}
+        if "h" in doc:
+            data["history"] = [{"feature": strings[f] if f is not None else None, "round": rnd,
+                                "votes": {strings[p]: strings[c] for p, c in votes}}
+                               for f, rnd, votes in doc["h"]]
+    except (zlib.error, UnicodeDecodeError, json.JSONDecodeError, KeyError, IndexError, TypeError) as exc:
+        raise ValueError("Sauvegarde compacte corrompue") from exc
+    return data
+
+
+def decode(raw):
+    """!
+    @brief Décode une sauvegarde complète quel que soit son format (détection par l'en-tête).
+    @param raw Octets du fichier.
+    @return Le dictionnaire de session.
+    @raises ValueError Si le contenu est invalide.
+    """
+    fmt = detect_format(raw[:4])
+    if fmt == "compact":
+        return decode_compact(raw)
+    try:
+        if fmt == "gzip":
+            raw = gzip.decompress(raw)
+        return json.loads(raw.decode("utf-8-sig"))
+    except (OSError, EOFError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Sauvegarde JSON invalide") from exc
+
+
+def encode_for_path(path, data):
+    """!
+    @brief Encode une sauvegarde dans le format déduit de l'extension du fichier.
+    @param path Chemin de destination (".ppk" pour le format compact, JSON indenté sinon).
+    @param data Dictionnaire de session.
+    @return Les octets à écrire.
+    """
+    if path.lower().endswith(COMPACT_EXTENSION):
+        return encode_compact(data)
+    return json.dumps(data, indent=4).encode("utf-8")
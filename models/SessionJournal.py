@@ -0,0 +1,244 @@
+import json
+import os
+import sys
+
+## Nom du dossier applicatif dans le répertoire de données utilisateur.
+APP_DIR_NAME = "AMY_LOREL_PlanningPoker"
+
+
+def user_data_dir():
+    """!
+    @brief Retourne le dossier de données de l'utilisateur pour l'application.
+    @return Chemin absolu (%APPDATA% sous Windows, ~/Library/Application Support sous macOS,
+            $XDG_DATA_HOME ou ~/.local/share ailleurs).
+    @note Le dossier n'est pas créé ici.
+    """
+    if sys.platform.startswith("win"):
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, APP_DIR_NAME)
+
+
+def default_journal_path():
+    """!
+    @brief Emplacement par défaut du journal de la partie en cours.
+    @return Chemin du fichier journal.
+    """
+    return os.path.join(user_data_dir(), "session.journal")
+
+
+class SessionJournal:
+    """!
+    @brief Journal append-only des évènements de jeu avec instantanés périodiques.
+    @details Chaque vote, révélation, revote et validation est ajouté au journal sous forme
+             d'une ligne JSON compacte [seq, type, ...], écrite et synchronisée immédiatement :
+             un crash fait perdre au plus l'évènement en cours d'écriture. Tous les
+             snapshot_every évènements, un instantané complet est écrit de façon atomique puis
+             le journal est compacté. La reprise recharge l'instantané et rejoue la fin du journal.
+    @attributes
+        path Chemin du fichier journal.
+        snapshot_path Chemin de l'instantané associé.
+        snapshot_every Nombre d'évènements entre deux compactages.
+        revealed État de révélation des votes, suivi à partir des évènements.
+    """
+
+    VOTE = "v"
+    REVEAL = "r"
+    REVOTE = "n"
+    VALIDATE = "f"
+
+    def __init__(self, path, snapshot_every=200, fsync=True):
+        """!
+        @brief Prépare un journal sans ouvrir de fichier.
+        @param path Chemin du fichier journal.
+        @param snapshot_every Fréquence des instantanés (en évènements).
+        @param fsync Force la synchronisation disque après chaque évènement.
+        @example
+            journal = SessionJournal(default_journal_path())
+        """
+        self.path = path
+        self.snapshot_path = path + ".snap"
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.revealed = False
+        self._session = None
+        self._fp = None
+        self._seq = 0
+        self._snapshot_seq = 0
+
+    def exists(self):
+        """!
+        @brief Indique si une partie journalisée peut être reprise.
+        @return True si un instantané existe sur le disque.
+        """
+        return os.path.exists(self.snapshot_path)
+
+    def start(self, session, revealed=False):
+        """!
+        @brief Démarre la journalisation d'une session.
+        @param session GameSession à journaliser.
+        @param revealed État de révélation courant.
+        @note Écrit un instantané initial et vide le journal précédent.
+        """
+        self.close()
+        self._session = session
+        self.revealed = revealed
+        self._seq = 0
+        self.compact()
+
+    def record_vote(self, player, card):
+        """!
+        @brief Journalise un vote.
+        @param player Nom du joueur.
+        @param card Carte votée.
+        """
+        self._append(self.VOTE, player, card)
+
+    def record_reveal(self):
+        """!
+        @brief Journalise la révélation des votes.
+        """
+        self.revealed = True
+        self._append(self.REVEAL)
+
+    def record_revote(self):
+        """!
+        @brief Journalise le passage au tour suivant (revote).
+        """
+        self.revealed = False
+        self._append(self.REVOTE)
+
+    def record_validation(self, score):
+        """!
+        @brief Journalise la validation de la fonctionnalité courante.
+        @param score Score retenu.
+        """
+        self.revealed = False
+        self._append(self.VALIDATE, score)
+
+    def _append(self, kind, *args):
+        """!
+        @brief Ajoute un évènement en fin de journal, puis compacte si nécessaire.
+        @param kind Type d'évènement.
+        @param args Données de l'évènement.
+        @raises OSError Si l'écriture échoue.
+        @note Sans session attachée (start non appelé), l'évènement est ignoré.
+        """
+        if self._session is None:
+            return
+        if self._fp is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._fp = open(self.path, "a", encoding="utf-8")
+
+        self._seq += 1
+        self._fp.write(json.dumps([self._seq, kind, *args], separators=(",", ":"), ensure_ascii=False) + "\n")
+        self._fp.flush()
+        if self.fsync:
+            os.fsync(self._fp.fileno())
+
+        if self._seq - self._snapshot_seq >= self.snapshot_every:
+            self.compact()
+
+    def compact(self):
+        """!
+        @brief Écrit un instantané complet puis tronque le journal.
+        @details L'instantané mémorise le dernier numéro de séquence : si un crash survient
+                 avant la troncature, la reprise ignore les évènements déjà inclus.
+        """
+        session = self._session
+        snapshot = {
+            "seq": self._seq,
+            "revealed": self.revealed,
+            "votes": session.votes.snapshot(),
+            "session": session.to_dict(status="IN_PROGRESS"),
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self.snapshot_path)), exist_ok=True)
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"), ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._snapshot_seq = self._seq
+
+        if self._fp is not None:
+            self._fp.close()
+        self._fp = open(self.path, "w", encoding="utf-8")
+
+    def resume(self, session):
+        """!
+        @brief Restaure une session depuis le dernier instantané et rejoue la fin du journal.
+        @param session GameSession à restaurer (réinitialisée).
+        @return True si les votes du tour courant étaient révélés.
+        @raises ValueError Si l'instantané est absent ou invalide.
+        @note Une dernière ligne tronquée (crash pendant l'écriture) est ignorée.
+        """
+        self.close()
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            raise ValueError("Aucune partie journalisée à reprendre") from exc
+
+        session.from_dict(snapshot["session"])
+        session.votes.restore(snapshot.get("votes", {}))
+        self.revealed = snapshot.get("revealed", False)
+        self._seq = self._snapshot_seq = snapshot.get("seq", 0)
+
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    if event[0] <= self._seq:
+                        continue
+                    self._apply(session, event[1], event[2:])
+                    self._seq = event[0]
+
+        self._session = session
+        return self.revealed
+
+    def _apply(self, session, kind, args):
+        """!
+        @brief Rejoue un évènement sur la session.
+        @param session GameSession cible.
+        @param kind Type d'évènement.
+        @param args Données de l'évènement.
+        """
+        if kind == self.VOTE:
+            session.votes.record(args[0], args[1])
+        elif kind == self.REVEAL:
+            self.revealed = True
+        elif kind == self.REVOTE:
+            session.next_round()
+            self.revealed = False
+        elif kind == self.VALIDATE:
+            session.save_feature_score(args[0])
+            session.next_feature()
+            self.revealed = False
+
+    def close(self):
+        """!
+        @brief Ferme le fichier journal sans supprimer les données.
+        """
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def discard(self):
+        """!
+        @brief Termine la journalisation et supprime journal et instantané.
+        @note Appelé quand la partie est terminée : il n'y a plus rien à reprendre.
+        """
+        self.close()
+        self._session = None
+        for path in (self.path, self.snapshot_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
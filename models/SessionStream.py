@@ -0,0 +1,280 @@
+import codecs
+import json
+import os
+import re
+
+## Clés streamées lors du chargement d'une sauvegarde de partie (GameSession.to_dict).
+SESSION_TARGETS = {"players": "players", "backlog": "backlog", "validated_features": "validated",
+                   "history": "history"}
+
+## Clés streamées lors de l'import de configuration (SetupController.export_data).
+SETUP_TARGETS = {"players": "players", "features": "backlog"}
+
+
+class JsonStreamReader:
+    """!
+    @brief Lecteur JSON incrémental basé uniquement sur la bibliothèque standard.
+    @details Le fichier est lu par blocs et décodé avec json.JSONDecoder.raw_decode : seuls
+             le bloc courant et l'élément en cours d'analyse sont gardés en mémoire, ce qui
+             permet de parcourir des tableaux de plusieurs centaines de Mo élément par élément.
+    @attributes
+        bytes_read Nombre d'octets lus depuis le fichier source.
+    """
+
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+    _NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+    ## Plus long jeton que le décodeur signale par sa position de début ("-Infinity").
+    _LONGEST_TOKEN = len("-Infinity")
+
+    def __init__(self, fp, chunk_size=1 << 16):
+        """!
+        @brief Prépare la lecture d'un flux binaire.
+        @param fp Fichier ouvert en mode binaire ("rb").
+        @param chunk_size Taille des blocs lus (octets).
+        """
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self.bytes_read = 0
+
+    def _fill(self):
+        """!
+        @brief Lit un bloc supplémentaire et l'ajoute au tampon.
+        @return False si la fin du fichier est atteinte.
+        @note Le préfixe déjà consommé du tampon est libéré à chaque lecture.
+        """
+        if self._eof:
+            return False
+        raw = self._fp.read(self._chunk_size)
+        self.bytes_read += len(raw)
+        if not raw:
+            self._eof = True
+        self._buf = self._buf[self._pos:] + self._decoder.decode(raw, final=self._eof)
+        self._pos = 0
+        return not self._eof
+
+    def peek(self):
+        """!
+        @brief Ignore les espaces et retourne le prochain caractère significatif.
+        @return Le caractère, ou une chaîne vide en fin de fichier.
+        """
+        while True:
+            self._pos = self._WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill() and self._pos >= len(self._buf):
+                return ""
+
+    def expect(self, char):
+        """!
+        @brief Consomme un caractère de structure attendu.
+        @param char Le caractère attendu ("[", ":", ...).
+        @raises ValueError Si le caractère lu est différent.
+        """
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON invalide : '{char}' attendu, '{found}' trouvé")
+        self._pos += 1
+
+    def _may_continue(self, value, end):
+        """!
+        @brief Indique si un nombre décodé peut se poursuivre dans le bloc suivant.
+        @details raw_decode s'arrête au plus long préfixe valide : "1." ou "3e" en fin de tampon
+                 sont lus comme 1 et 3. Si seuls des caractères numériques séparent la fin du
+                 nombre de la fin du tampon, il faut relire un bloc avant de conclure.
+        @param value Valeur décodée.
+        @param end Position de fin de la valeur dans le tampon.
+        @return True si la valeur est un nombre peut-être tronqué et que le fichier n'est pas fini.
+        """
+        if self._eof or isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        return self._NUMBER_TAIL.match(self._buf, end).end() == len(self._buf)
+
+    def _may_be_truncated(self, exc):
+        """!
+        @brief Indique si une erreur de décodage peut venir de la fin du tampon plutôt que du fichier.
+        @details Une chaîne non terminée ou une erreur signalée dans le dernier jeton du tampon
+                 ("tru", "-Infinit", "\\u00e"...) peut disparaître en relisant un bloc. Toute autre
+                 erreur est définitive : relire le fichier jusqu'au bout ne la corrigerait pas.
+        @param exc L'exception json.JSONDecodeError levée par le décodeur.
+        @return True s'il faut relire un bloc avant de conclure.
+        """
+        return exc.msg.startswith("Unterminated string") or exc.pos > len(self._buf) - self._LONGEST_TOKEN
+
+    def read_value(self):
+        """!
+        @brief Décode une valeur JSON complète à la position courante.
+        @return La valeur Python correspondante.
+        @raises ValueError Si la valeur est invalide ou tronquée.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if not self._may_be_truncated(exc) or not self._fill():
+                    raise ValueError(f"JSON invalide : {exc.msg}") from exc
+                continue
+            # Un nombre en fin de tampon peut être coupé en deux : on relit un bloc.
+            if self._may_continue(value, end):
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def iter_array(self):
+        """!
+        @brief Parcourt un tableau JSON élément par élément.
+        @return Un générateur des éléments décodés.
+        @note Chemin rapide : tant que l'élément tient dans le tampon, le scanner C du module
+              json est appelé directement ; read_value ne sert qu'aux éléments à cheval sur deux blocs.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        match_ws = self._WHITESPACE.match
+        scan = self._json.scan_once
+        while True:
+            buf = self._buf
+            try:
+                value, end = scan(buf, match_ws(buf, self._pos).end())
+            except (StopIteration, json.JSONDecodeError):
+                end = len(buf)
+            if end < len(buf) and not self._may_continue(value, end):
+                self._pos = end
+            else:
+                value = self.read_value()
+            yield value
+
+            buf = self._buf
+            pos = match_ws(buf, self._pos).end()
+            if pos < len(buf) and buf[pos] in ",]":
+                self._pos = pos + 1
+                if buf[pos] == "]":
+                    return
+            elif self.peek() == "]":
+                self._pos += 1
+                return
+            else:
+                self.expect(",")
+
+    def iter_object(self):
+        """!
+        @brief Parcourt un objet JSON clé par clé.
+        @return Un générateur des clés ; la valeur associée doit être consommée
+                (read_value, iter_array, iter_object ou skip_value) avant la clé suivante.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise ValueError("JSON invalide : clé d'objet attendue")
+            self.expect(":")
+            yield key
+            if self.peek() == "}":
+                self._pos += 1
+                return
+            self.expect(",")
+
+    def skip_value(self):
+        """!
+        @brief Ignore la valeur courante sans la charger entièrement en mémoire.
+        """
+        char = self.peek()
+        if char == "[":
+            for _ in self.iter_array():
+                pass
+        elif char == "{":
+            for _ in self.iter_object():
+                self.skip_value()
+        else:
+            self.read_value()
+
+
+def _total_size(fp):
+    """!
+    @brief Retourne la taille du fichier si elle est connue.
+    @param fp Fichier ouvert.
+    @return Taille en octets, ou None pour un flux sans descripteur.
+    """
+    try:
+        return os.fstat(fp.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def stream_into_session(session, fp, targets=SESSION_TARGETS, batch_size=1000, progress=None,
+                        chunk_size=1 << 16):
+    """!
+    @brief Charge un fichier JSON dans une GameSession sans le matérialiser entièrement.
+    @details Les tableaux ciblés sont injectés dans le modèle par lots de batch_size éléments ;
+             les autres tableaux et objets sont ignorés en streaming.
+    @param session GameSession à alimenter (n'est pas réinitialisée ici).
+    @param fp Fichier ouvert en mode binaire.
+    @param targets Correspondance clé JSON -> destination ("players", "backlog", "validated", "history").
+    @param batch_size Nombre d'éléments injectés entre deux rapports de progression.
+    @param progress Callback optionnel progress(octets_lus, octets_totaux) ; le total peut être None.
+    @param chunk_size Taille des blocs lus.
+    @return Dictionnaire des valeurs scalaires de premier niveau (status, rules, index...).
+    @raises ValueError Si le JSON est invalide.
+    """
+    reader = JsonStreamReader(fp, chunk_size)
+    total = _total_size(fp)
+    scalars = {}
+
+    def report():
+        if progress:
+            progress(reader.bytes_read, total)
+
+    for key in reader.iter_object():
+        target = targets.get(key)
+        if target == "validated":
+            count = 0
+            for feature in reader.iter_object():
+                session.validated_features[feature] = reader.read_value()
+                count += 1
+                if count % batch_size == 0:
+                    report()
+        elif target in ("players", "backlog", "history"):
+            batch = []
+            for item in reader.iter_array():
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    _flush(session, target, batch)
+                    batch = []
+                    report()
+            _flush(session, target, batch)
+        elif reader.peek() in ("[", "{"):
+            reader.skip_value()
+        else:
+            scalars[key] = reader.read_value()
+        report()
+
+    if reader.peek():
+        raise ValueError("JSON invalide : données après la fin du document")
+    report()
+    return scalars
+
+
+def _flush(session, target, batch):
+    """!
+    @brief Injecte un lot d'éléments dans le modèle.
+    @param session GameSession cible.
+    @param target "players", "backlog" ou "history".
+    @param batch Liste des éléments du lot.
+    """
+    if target == "players":
+        for name in batch:
+            session.add_player(name)
+    elif target == "history":
+        session.round_history.extend(batch)
+    else:
+        session.backlog.add_features(batch)
@@ -0,0 +1,157 @@
+import threading
+from collections.abc import Mapping
+
+
+class VoteCollector(Mapping):
+    """!
+    @brief Urne du tour en cours : accepte les votes de n'importe quel joueur, dans n'importe quel ordre.
+    @details Les écritures sont protégées par un verrou : plusieurs threads (ou coroutines servies par
+             des threads différents) peuvent voter en même temps. La fin du tour se détecte en O(1)
+             grâce au nombre de votants attendus (joueurs inscrits moins votes reçus), sans dépendre
+             d'un ordre de passage. En lecture, l'urne se comporte comme un dictionnaire
+             {joueur: carte} : les vues, le moteur de consensus et le journal la consomment telle quelle.
+    @attributes
+        closed Indique si le tour est révélé (plus aucun vote ni changement accepté).
+    """
+
+    __slots__ = ("_players", "_votes", "_lock", "_on_cast", "closed")
+
+    def __init__(self, players=(), on_cast=None):
+        """!
+        @brief Crée une urne vide.
+        @param players Conteneur des joueurs autorisés à voter (Roster, set...), consulté à chaque vote.
+        @param on_cast Callback optionnel on_cast(player), appelé sous le verrou pour chaque vote accepté :
+               les notifications suivent exactement l'ordre des votes.
+        @example
+            votes = VoteCollector(session.players)
+            if votes.cast("Alice", "5"):
+                controller.reveal_votes()
+        """
+        self._players = players
+        self._votes = {}
+        self._lock = threading.Lock()
+        self._on_cast = on_cast
+        self.closed = False
+
+    def cast(self, player, card):
+        """!
+        @brief Enregistre le premier vote d'un joueur.
+        @param player Nom du joueur.
+        @param card Valeur de la carte.
+        @return True pour le vote qui complète le tour (un seul appel le reçoit), False sinon.
+        @raises ValueError Si le tour est révélé, si le joueur est inconnu ou s'il a déjà voté.
+        """
+        with self._lock:
+            if self.closed:
+                raise ValueError("Le tour est terminé")
+            if player not in self._players:
+                raise ValueError(f"Joueur inconnu : {player}")
+            if player in self._votes:
+                raise ValueError(f"{player} a déjà voté")
+            self._votes[player] = card
+            if self._on_cast is not None:
+                self._on_cast(player)
+            return len(self._votes) == len(self._players)
+
+    def change(self, player, card):
+        """!
+        @brief Remplace le vote d'un joueur avant la révélation.
+        @param player Nom du joueur.
+        @param card Nouvelle valeur de la carte.
+        @raises ValueError Si le tour est révélé ou si le joueur n'a pas encore voté.
+        @note Ne modifie pas le nombre de votants attendus.
+        """
+        with self._lock:
+            if self.closed:
+                raise ValueError("Le tour est terminé")
+            if player not in self._votes:
+                raise ValueError(f"{player} n'a pas encore voté")
+            self._votes[player] = card
+
+    def record(self, player, card):
+        """!
+        @brief Écrit un vote sans contrôle des règles.
+        @param player Nom du joueur.
+        @param card Valeur de la carte (None si elle n'est pas encore connue).
+        @note Réservé à la relecture du journal et au miroir d'une partie distante.
+        """
+        with self._lock:
+            self._votes[player] = card
+
+    def restore(self, votes):
+        """!
+        @brief Remplace tous les votes du tour, sans contrôle des règles.
+        @param votes Dictionnaire {joueur: carte}.
+        @see record
+        """
+        with self._lock:
+            self._votes = dict(votes)
+
+    def close(self):
+        """!
+        @brief Ferme l'urne à la révélation : les votes ne peuvent plus changer.
+        """
+        with self._lock:
+            self.closed = True
+
+    def reset(self):
+        """!
+        @brief Vide l'urne et la rouvre pour un nouveau tour.
+        """
+        with self._lock:
+            self._votes = {}
+            self.closed = False
+
+    @property
+    def pending(self):
+        """!
+        @brief Nombre de joueurs qui n'ont pas encore voté, en O(1).
+        """
+        return len(self._players) - len(self._votes)
+
+    def is_complete(self):
+        """!
+        @brief Vérifie en O(1) que tous les joueurs inscrits ont voté.
+        @return True si plus aucun vote n'est attendu.
+        """
+        return self.pending <= 0
+
+    def snapshot(self):
+        """!
+        @brief Copie cohérente des votes, prise sous le verrou.
+        @return Un dictionnaire {joueur: carte}.
+        """
+        with self._lock:
+            return dict(self._votes)
+
+    def __getitem__(self, player):
+        return self._votes[player]
+
+    def __contains__(self, player):
+        return player in self._votes
+
+    def __iter__(self):
+        """!
+        @brief Itère sur les votants d'une copie : un vote concurrent n'interrompt pas l'itération.
+        """
+        return iter(self.snapshot())
+
+    def __len__(self):
+        return len(self._votes)
+
+    def items(self):
+        """!
+        @brief Paires (joueur, carte) d'une copie cohérente des votes.
+        """
+        return self.snapshot().items()
+
+    def values(self):
+        """!
+        @brief Cartes des votes, copiées sous le verrou.
+        @return Une liste (plus légère qu'une copie du dictionnaire).
+        """
+        with self._lock:
+            return list(self._votes.values())
+
+    def __repr__(self):
+        return f"VoteCollector({self._votes!r}, closed={self.closed})"
@@ -3,11 +3,46 @@
 @brief Suite de tests unitaires pour les modèles et la logique de jeu.
 """
 
+import asyncio
+import copy
+import gzip
+import http.client
+import io
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from models.GameSession import GameSession
+from models.ConsensusEngine import ConsensusEngine
+from models import SessionStream
+from models import SessionCodec
+from models.ResultIndex import ResultIndex
+from models.SessionJournal import SessionJournal
+from models.VoteCollector import VoteCollector
+from models.ChangeStream import ChangeStream, DEFAULT_WINDOW
 from controllers.GameController import GameController
+from controllers.SessionWriter import SessionWriter, atomic_write
+from controllers.SetupController import SetupController
+from controllers.SessionServer import SessionClient, SessionServer
+from controllers.RemoteGameController import RemoteGameController
+from controllers.RoomManager import RoomManager, ShardedRoomManager, shard_for
+from controllers.HttpApi import ApiServer
+from tools.HeadlessSimulator import HeadlessSimulator
+from tools import StartupProbe
+from views.CardRasterCache import CardRasterCache
+from views.CardAtlas import CardAtlas
+from views.VirtualList import clamp_first, scroll_fractions
+from views.CanvasTable import wrap_positions
+from views.RefreshScheduler import RefreshScheduler
+from views import Instrumentation as instrumentation_module
+from views.ImageCache import ImageCache, scale_for
+from views.CardPrewarm import CardPrewarmer
 
 
 class TestModels(unittest.TestCase):
@@ -31,11 +66,26 @@ class TestModels(unittest.TestCase):
         self.assertFalse(self.session.add_player(""))       # Nom vide interdit
 
         self.assertEqual(len(self.session.players), 2)
-        self.assertEqual(self.session.get_player_names(), ["Alice", "Bob"])
+        self.assertEqual(self.session.get_player_names(), ("Alice", "Bob"))
 
         self.session.remove_player("Alice")
         self.assertEqual(len(self.session.players), 1)
-        self.assertEqual(self.session.get_player_names(), ["Bob"])
+        self.assertEqual(self.session.get_player_names(), ("Bob",))
+
+    def test_player_names_cache(self):
+        """!
+        @brief Le tuple des noms est réutilisé tant que le roster ne change pas.
+        """
+        self.session.add_player("Alice")
+        names = self.session.get_player_names()
+        self.assertIs(self.session.get_player_names(), names)
+
+        self.session.add_player("Bob")
+        self.assertIsNot(self.session.get_player_names(), names)
+        self.assertIn("Bob", self.session.players)
+        self.assertEqual(self.session.players.get("Bob").name, "Bob")
+        with self.assertRaises(AttributeError):
+            self.session.players.get("Bob").score = 3  # __slots__
 
     def test_backlog_management(self):
         """!
@@ -49,6 +99,23 @@ class TestModels(unittest.TestCase):
         self.assertEqual(len(backlog.features), 2)
         self.assertEqual(self.session.get_current_feature(), "Login Page")
 
+    def test_backlog_bulk_insert_and_removal(self):
+        """!
+        @brief Vérifie l'import en lot, les rejets et l'ordre après suppression.
+        """
+        backlog = self.session.backlog
+        accepted, rejected = backlog.add_features(["A", "B", "", "A", "C", "D"])
+        self.assertEqual((accepted, rejected), (4, 2))
+
+        backlog.remove_feature("B")
+        backlog.remove_feature("Inconnue")
+        self.assertNotIn("B", backlog)
+        self.assertEqual(backlog.features, ["A", "C", "D"])
+
+        self.assertTrue(backlog.add_feature("B"))
+        self.assertEqual(backlog.features, ["A", "C", "D", "B"])
+        self.assertEqual(len(backlog), 4)
+
     def test_save_load_serialization(self):
         """!
         @brief Vérifie que to_dict/from_dict sauvegardent et restaurent tout l'état.
@@ -66,12 +133,333 @@ class TestModels(unittest.TestCase):
         new_session = GameSession()
         new_session.from_dict(data)
 
-        self.assertEqual(new_session.get_player_names(), ["Alice", "Bob"])
+        self.assertEqual(new_session.get_player_names(), ("Alice", "Bob"))
         self.assertEqual(new_session.rules.selected_mode, "Moyenne")
         self.assertEqual(new_session.validated_features["Feature A"], 5)
         self.assertEqual(new_session.get_current_feature(), "Feature B")  # Index restauré
 
 
+class TestSessionStream(unittest.TestCase):
+    """!
+    @brief Tests de l'import JSON en streaming.
+    """
+
+    def _payload(self):
+        """!
+        @brief Construit une sauvegarde avec accents, nombres et scores variés.
+        """
+        session = GameSession()
+        for name in ("Alice", "Bérénice", "Zoë"):
+            session.add_player(name)
+        session.backlog.add_features(f"Story n°{i} — écran {i * 1234}" for i in range(200))
+        session.rules.set_mode("Médiane")
+        session.current_feature_index = 3
+        session.current_round_number = 12345
+        session.validated_features = {"Story n°0 — écran 0": 13, "Story n°1 — écran 1234": "cafe"}
+        return session.to_dict(status="PAUSED")
+
+    def test_stream_matches_from_dict(self):
+        """!
+        @brief Avec des blocs minuscules, le résultat est identique à from_dict.
+        """
+        data = self._payload()
+        raw = json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+
+        expected = GameSession()
+        expected.from_dict(data)
+
+        for chunk_size in (1, 7, 4096):
+            session = GameSession()
+            reports = []
+            scalars = session.from_stream(io.BytesIO(raw), batch_size=16, chunk_size=chunk_size,
+                                          progress=lambda done, total: reports.append(done))
+            self.assertEqual(scalars["status"], "PAUSED")
+            self.assertEqual(session.get_player_names(), expected.get_player_names())
+            self.assertEqual(session.backlog.features, expected.backlog.features)
+            self.assertEqual(session.validated_features, expected.validated_features)
+            self.assertEqual(session.rules.selected_mode, "Médiane")
+            self.assertEqual(session.current_round_number, 12345)
+            self.assertTrue(reports)
+            self.assertEqual(reports[-1], len(raw))
+
+    def test_numbers_split_across_chunks(self):
+        """!
+        @brief Un nombre coupé juste après "." ou "e" est relu en entier, quelle que soit la taille des blocs.
+        """
+        values = [1.5, 2.25, 3e5, "x", -0.125, 7, 1E-3, 12.5e+2, [4.75]]
+        raw = b'[1.5, 2.25, 3e5, "x", -0.125, 7, 1E-3, 12.5e+2, [4.75]]'
+        for chunk_size in range(1, len(raw) + 2):
+            reader = SessionStream.JsonStreamReader(io.BytesIO(raw), chunk_size)
+            self.assertEqual(list(reader.iter_array()), values, f"chunk_size={chunk_size}")
+            reader = SessionStream.JsonStreamReader(io.BytesIO(b'{"score": 13.75}'), chunk_size)
+            self.assertEqual(next(reader.iter_object()), "score")
+            self.assertEqual(reader.read_value(), 13.75, f"chunk_size={chunk_size}")
+
+    def test_tokens_split_across_chunks(self):
+        """!
+        @brief Littéraux, chaînes et échappements coupés entre deux blocs sont relus en entier.
+        """
+        values = [True, False, None, float("-inf"), "é\U0001f600", {"k": "v"}]
+        raw = b'[true, false, null, -Infinity, "\\u00e9\\ud83d\\ude00", {"k": "v"}]'
+        for chunk_size in range(1, len(raw) + 2):
+            reader = SessionStream.JsonStreamReader(io.BytesIO(raw), chunk_size)
+            self.assertEqual(list(reader.iter_array()), values, f"chunk_size={chunk_size}")
+
+    def test_early_corruption_stops_reading(self):
+        """!
+        @brief Une erreur en tête de fichier est signalée sans lire le reste du fichier.
+        """
+        raw = b'{"players": ["A", x' + b', "B"' * 100000 + b"]}"
+        reader = SessionStream.JsonStreamReader(io.BytesIO(raw), chunk_size=64)
+        self.assertEqual(next(reader.iter_object()), "players")
+        with self.assertRaises(ValueError):
+            list(reader.iter_array())
+        self.assertLessEqual(reader.bytes_read, 128)
+
+    def test_setup_targets_skip_other_arrays(self):
+        """!
+        @brief L'import de configuration lit "features" et ignore le reste en streaming.
+        """
+        raw = json.dumps({"backlog": ["X"], "players": ["A", "B"], "features": ["F1", "F2", "F1"],
+                          "nested": {"a": [1, {"b": 2}]}, "rule": "Moyenne"}).encode("utf-8")
+        session = GameSession()
+        scalars = SessionStream.stream_into_session(session, io.BytesIO(raw), SessionStream.SETUP_TARGETS,
+                                                    chunk_size=5)
+        self.assertEqual(scalars, {"rule": "Moyenne"})
+        self.assertEqual(session.backlog.features, ["F1", "F2"])
+        self.assertEqual(session.get_player_names(), ("A", "B"))
+
+    def test_invalid_json_raises(self):
+        """!
+        @brief Un fichier tronqué lève une ValueError et laisse la session intacte.
+        """
+        session = GameSession()
+        session.from_dict(self._payload())
+        before = session.to_dict()
+        for raw in (b'{"players": ["A", "B"', b'{"players": [1 2]}', b'[]', b'{"a": 1} x'):
+            with self.assertRaises(ValueError):
+                session.from_stream(io.BytesIO(raw))
+            self.assertEqual(session.to_dict(), before)
+
+    def test_corrupt_setup_import_keeps_current_setup(self):
+        """!
+        @brief Un import de configuration tronqué ne touche ni aux joueurs ni au backlog.
+        """
+        session = GameSession()
+        session.add_player("Alice")
+        session.add_player("Bob")
+        session.backlog.add_features(["US 1"])
+        controller = SetupController(session, MagicMock())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "setup.json")
+            with open(path, "wb") as f:
+                f.write('{"players": ["Zoé"], "features": ["F1", "F2"'.encode("utf-8"))
+            with patch("controllers.SetupController.filedialog.askopenfilename", return_value=path), \
+                    patch("controllers.SetupController.CustomPopup"):
+                self.assertFalse(controller.import_data())
+                self.assertEqual(session.get_player_names(), ("Alice", "Bob"))
+                self.assertEqual(session.backlog.features, ["US 1"])
+
+                with open(path, "wb") as f:
+                    f.write(json.dumps({"players": ["Zoé", "Yann"], "features": ["F1", "F2"],
+                                        "rule": "Médiane"}).encode("utf-8"))
+                self.assertTrue(controller.import_data())
+        self.assertEqual(session.get_player_names(), ("Zoé", "Yann"))
+        self.assertEqual(session.backlog.features, ["F1", "F2"])
+        self.assertEqual(session.rules.selected_mode, "Médiane")
+
+
+class TestSessionCodec(unittest.TestCase):
+    """!
+    @brief Tests du format de sauvegarde compact et de la détection automatique.
+    """
+
+    def setUp(self):
+        """!
+        @brief Produit une partie terminée avec historique via le simulateur.
+        """
+        sim = HeadlessSimulator(players=12, stories=60, distribution="split", seed=7)
+        sim.run()
+        self.data = sim.session.to_dict(status="FINISHED")
+
+    def test_round_trip_and_detection(self):
+        """!
+        @brief Chaque format se relit à l'identique grâce à la détection par en-tête.
+        """
+        compact = SessionCodec.encode_compact(self.data)
+        pretty = SessionCodec.encode_for_path("partie.json", self.data)
+        gzipped = gzip.compress(pretty)
+
+        self.assertEqual(SessionCodec.detect_format(compact[:4]), "compact")
+        self.assertEqual(SessionCodec.detect_format(gzipped[:4]), "gzip")
+        self.assertEqual(SessionCodec.detect_format(pretty[:4]), "json")
+        for raw in (compact, pretty, gzipped):
+            self.assertEqual(SessionCodec.decode(raw), self.data)
+
+        restored = GameSession()
+        restored.from_dict(SessionCodec.decode(compact))
+        self.assertEqual(restored.round_history, self.data["history"])
+        self.assertLess(len(compact), len(pretty) / 5)
+
+    def test_corrupted_compact_raises(self):
+        """!
+        @brief Une archive compacte tronquée lève une ValueError.
+        """
+        compact = SessionCodec.encode_for_path("partie.PPK", self.data)
+        with self.assertRaises(ValueError):
+            SessionCodec.decode(compact[:len(compact) // 2])
+
+
+class TestSessionJournal(unittest.TestCase):
+    """!
+    @brief Tests du journal append-only et de la reprise après crash.
+    """
+
+    def setUp(self):
+        """!
+        @brief Prépare une partie journalisée dans un dossier temporaire.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "session.journal")
+
+        self.session = GameSession()
+        self.session.add_player("Alice")
+        self.session.add_player("Bob")
+        self.session.backlog.add_features(["US1", "US2", "US3"])
+        self.controller = GameController(self.session, MagicMock())
+        self.controller.journal = SessionJournal(self.path, snapshot_every=4, fsync=False)
+        self.controller.journal.start(self.session)
+
+    def tearDown(self):
+        """!
+        @brief Ferme le journal et supprime le dossier temporaire.
+        """
+        self.controller.journal.close()
+        self.tmp.cleanup()
+
+    def _resume(self):
+        """!
+        @brief Reprend la partie journalisée dans un nouveau contrôleur.
+        """
+        session = GameSession()
+        controller = GameController(session, MagicMock())
+        controller.journal = SessionJournal(self.path, fsync=False)
+        controller.resume_from_journal()
+        return session, controller
+
+    def test_resume_replays_tail_after_snapshot(self):
+        """!
+        @brief Revote, validation et vote en cours sont restaurés, historique compris.
+        """
+        c = self.controller
+        c.cast_vote("3"); c.cast_vote("8"); c.reveal_votes()
+        c.restart_round()
+        c.cast_vote("5"); c.cast_vote("5"); c.reveal_votes()
+        c.validate_feature(5)
+        c.cast_vote("13")
+
+        session, controller = self._resume()
+        self.assertEqual(session.validated_features, {"US1": 5})
+        self.assertEqual(session.get_current_feature(), "US2")
+        self.assertEqual(session.votes, {"Alice": "13"})
+        self.assertEqual(controller.get_current_player_name(), "Bob")
+        self.assertFalse(controller.revealed)
+        self.assertEqual([h["round"] for h in session.round_history], [1, 2])
+
+    def test_compaction_and_torn_write(self):
+        """!
+        @brief Le journal reste court et une ligne tronquée par un crash est ignorée.
+        """
+        c = self.controller
+        c.cast_vote("5"); c.cast_vote("5"); c.reveal_votes()
+        c.validate_feature(5)
+        c.cast_vote("8"); c.cast_vote("8"); c.reveal_votes()
+
+        with open(self.path, encoding="utf-8") as f:
+            self.assertLess(len(f.readlines()), 4)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('[99,"f",')
+
+        session, controller = self._resume()
+        self.assertTrue(controller.revealed)
+        self.assertEqual(session.votes, {"Alice": "8", "Bob": "8"})
+        self.assertEqual(session.get_current_feature(), "US2")
+
+    def test_journal_is_discarded_only_when_the_journaled_game_ends(self):
+        """!
+        @brief Afficher des résultats ne supprime pas le journal ; terminer la partie journalisée, si.
+        """
+        from controllers.MainController import MainController
+
+        with patch("controllers.MainController.default_journal_path", return_value=self.path):
+            main_controller = MainController(MagicMock())
+        main_controller.show_result()  # ex : archive FINISHED ouverte via « Charger Partie »
+        self.assertTrue(main_controller.journal.exists())
+
+        c = self.controller
+        for _ in range(3):
+            c.cast_vote("5"); c.cast_vote("5"); c.reveal_votes()
+            c.validate_feature(5)
+        self.assertFalse(c.journal.exists())
+        c.main_controller.show_result.assert_called()
+
+
+class TestSessionWriter(unittest.TestCase):
+    """!
+    @brief Tests du service d'écriture en arrière-plan.
+    """
+
+    def test_burst_is_coalesced_and_atomic(self):
+        """!
+        @brief Une rafale de sauvegardes produit une seule écriture des dernières données.
+        """
+        writer = SessionWriter(coalesce_delay=0.2)
+        results = []
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "save.json")
+            for i in range(10):
+                writer.submit(path, {"version": i}, on_done=results.append)
+            self.assertTrue(writer.flush(timeout=5))
+
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f), {"version": 9})
+            self.assertEqual(os.listdir(tmp), ["save.json"])
+
+        self.assertEqual(writer.writes, 1)
+        self.assertEqual(writer.coalesced, 9)
+        self.assertEqual(results, [None] * 10)
+
+    def test_error_is_reported(self):
+        """!
+        @brief Une écriture impossible est signalée au callback sans lever d'exception.
+        """
+        writer = SessionWriter(coalesce_delay=0)
+        errors = []
+        writer.submit(os.path.join(tempfile.gettempdir(), "absent", "dir", "save.json"), {}, on_done=errors.append)
+        writer.flush(timeout=5)
+        self.assertIsInstance(errors[0], OSError)
+
+    def test_file_mode_is_kept(self):
+        """!
+        @brief L'écriture atomique garde les droits du fichier remplacé et respecte l'umask pour un nouveau fichier.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            existing = os.path.join(tmp, "shared.json")
+            with open(existing, "w") as f:
+                f.write("{}")
+            os.chmod(existing, 0o644)
+            atomic_write(existing, b"{}")
+            self.assertEqual(os.stat(existing).st_mode & 0o777, 0o644)
+
+            old = os.umask(0o027)
+            try:
+                created = os.path.join(tmp, "new.json")
+                atomic_write(created, b"{}")
+            finally:
+                os.umask(old)
+            self.assertEqual(os.stat(created).st_mode & 0o777, 0o640)
+
+
 class TestGameLogic(unittest.TestCase):
     """!
     @brief Tests unitaires pour la logique du contrôleur de jeu.
@@ -104,6 +492,24 @@ class TestGameLogic(unittest.TestCase):
         self.controller.cast_vote("5")
         self.assertTrue(self.controller.is_round_finished())
 
+    def test_votes_in_any_order(self):
+        """!
+        @brief Un joueur peut voter hors de son tour ; le double vote est refusé, la fin du tour détectée.
+        """
+        self.assertTrue(self.controller.cast_vote("8", "Charlie"))
+        self.assertFalse(self.controller.cast_vote("5", "Charlie"))
+        self.assertEqual(self.controller.get_current_player_name(), "Alice")
+
+        self.controller.cast_vote("5")
+        self.assertEqual(self.controller.get_current_player_name(), "Bob")
+        self.controller.cast_vote("5")
+        self.assertIsNone(self.controller.get_current_player_name())
+        self.assertTrue(self.controller.is_round_finished())
+
+        self.controller.reveal_votes()
+        with self.assertRaises(ValueError):
+            self.session.votes.change("Alice", "8")
+
     def test_rule_unanimous_round_one(self):
         """!
         @brief Tour 1 : unanimité absolue requise.
@@ -162,5 +568,1055 @@ class TestGameLogic(unittest.TestCase):
         self.assertEqual(self.controller.calculate_result(), 9)
 
 
+class TestVoteCollector(unittest.TestCase):
+    """!
+    @brief Tests de l'urne concurrente.
+    """
+
+    def test_rules(self):
+        """!
+        @brief Joueur inconnu et double vote refusés, changement avant révélation seulement.
+        """
+        votes = VoteCollector({"Alice", "Bob"})
+        with self.assertRaises(ValueError):
+            votes.cast("Zoé", "5")
+        with self.assertRaises(ValueError):
+            votes.change("Alice", "5")
+        self.assertFalse(votes.cast("Alice", "5"))
+        with self.assertRaises(ValueError):
+            votes.cast("Alice", "8")
+        votes.change("Alice", "8")
+        self.assertEqual((votes.pending, votes.is_complete()), (1, False))
+        self.assertTrue(votes.cast("Bob", "3"))
+        self.assertEqual(votes, {"Alice": "8", "Bob": "3"})
+
+        votes.close()
+        with self.assertRaises(ValueError):
+            votes.change("Bob", "5")
+        votes.reset()
+        self.assertEqual((len(votes), votes.pending, votes.closed), (0, 2, False))
+
+    def test_stress_many_threads(self):
+        """!
+        @brief Des threads votent pour tous les joueurs à la fois : un seul vote par joueur
+               est retenu et un seul appel signale la fin du tour.
+        """
+        players = [f"P{i}" for i in range(500)]
+        votes = VoteCollector(set(players))
+        thread_count = 16
+        barrier = threading.Barrier(thread_count)
+        accepted, rejected, completions = [], [], []
+
+        def hammer(seed):
+            rng = random.Random(seed)
+            order = players[:]
+            rng.shuffle(order)
+            barrier.wait()
+            for name in order:
+                try:
+                    if votes.cast(name, str(seed)):
+                        completions.append(seed)
+                    accepted.append(name)
+                except ValueError:
+                    rejected.append(name)
+                    try:
+                        votes.change(name, str(seed))
+                    except ValueError:
+                        pass
+                list(votes.items())
+
+        threads = [threading.Thread(target=hammer, args=(seed,)) for seed in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(accepted), sorted(players))
+        self.assertEqual(len(rejected), len(players) * (thread_count - 1))
+        self.assertEqual(len(completions), 1)
+        self.assertTrue(votes.is_complete())
+        self.assertEqual(set(votes), set(players))
+
+
+class TestChangeStream(unittest.TestCase):
+    """!
+    @brief Tests du flux de changements versionné de la session.
+    """
+
+    def test_session_emits_deltas_without_vote_values(self):
+        """!
+        @brief Vote sans valeur avant révélation, puis révélation, revote et validation.
+        """
+        session = GameSession()
+        for name in ("Alice", "Bob"):
+            session.add_player(name)
+        session.backlog.add_features(["US 1", "US 2"])
+        session.cast_vote("Alice", "5")
+        session.cast_vote("Bob", "8")
+        session.reveal()
+        session.next_round()
+        session.save_feature_score(5)
+        session.next_feature()
+
+        self.assertEqual([d["type"] for d in session.changes.since(0)],
+                         ["vote", "vote", "reveal", "revote", "validated"])
+        self.assertEqual(session.changes.since(0)[0], {"v": 1, "type": "vote", "player": "Alice"})
+        self.assertEqual(session.changes.since(2)[0]["votes"], {"Alice": "5", "Bob": "8"})
+        self.assertEqual(session.changes.since(4), [{"v": 5, "type": "validated", "feature": "US 1", "score": 5,
+                                                     "feature_index": 1, "next": "US 2"}])
+        self.assertEqual(session.changes.since(5), [])
+
+    def test_resync_window(self):
+        """!
+        @brief Une version trop ancienne ou inconnue impose un état complet.
+        """
+        stream = ChangeStream(maxlen=4)
+        for i in range(20):
+            stream.emit("vote", player=str(i))
+        self.assertIsNone(stream.since(0))
+        self.assertIsNone(stream.since(21))
+        self.assertEqual([d["v"] for d in stream.since(16)], [17, 18, 19, 20])
+        stream.skip_to(7)
+        self.assertEqual((stream.since(7), stream.since(6)), ([], None))
+
+        stream = ChangeStream()
+        for i in range(10 * DEFAULT_WINDOW):
+            stream.emit("vote", player=str(i))
+        self.assertEqual(len(stream.since(stream.version - DEFAULT_WINDOW)), DEFAULT_WINDOW)
+        self.assertIsNone(stream.since(stream.version - DEFAULT_WINDOW - 1))
+
+
+class TestSessionServer(unittest.TestCase):
+    """!
+    @brief Tests du vote simultané en réseau, sur un serveur en boucle locale.
+    """
+
+    def setUp(self):
+        self.session = GameSession()
+        for name in ("Alice", "Bob", "Charlie", "Dora"):
+            self.session.add_player(name)
+        self.session.backlog.add_features(["US 1", "US 2"])
+
+    def _run(self, scenario):
+        """!
+        @brief Démarre un serveur sur un port libre, exécute le scénario puis ferme tout.
+        """
+        async def main():
+            server = SessionServer(self.session)
+            await server.start()
+            try:
+                return await scenario(server)
+            finally:
+                await server.close()
+        return asyncio.run(asyncio.wait_for(main(), 10))
+
+    @staticmethod
+    async def _until(client, predicate):
+        """!
+        @brief Lit les messages d'un client jusqu'à ce que son état (mis à jour par les deltas) vérifie le prédicat.
+        @return Une copie de cet état.
+        """
+        while True:
+            message = await client.receive()
+            if message["type"] in ("state", "delta") and predicate(client.state):
+                return copy.deepcopy(client.state)
+
+    def test_round_lasts_as_long_as_slowest_voter(self):
+        """!
+        @brief Les joueurs votent en parallèle : le tour dure le temps du plus lent, pas la somme.
+        """
+        delays = {"Alice": 0.15, "Bob": 0.05, "Charlie": 0.1, "Dora": 0.15}
+
+        async def scenario(server):
+            clients = {name: SessionClient(name) for name in delays}
+            for name, client in clients.items():
+                state = await client.connect("127.0.0.1", server.port)
+                self.assertEqual(state["backlog"], ["US 1", "US 2"])
+
+            async def play(name, client):
+                await asyncio.sleep(delays[name])
+                await client.send("vote", card="5")
+                return await self._until(client, lambda m: m["revealed"])
+
+            start = time.perf_counter()
+            states = await asyncio.gather(*(play(n, c) for n, c in clients.items()))
+            elapsed = time.perf_counter() - start
+            for client in clients.values():
+                await client.close()
+            return states, elapsed
+
+        states, elapsed = self._run(scenario)
+        self.assertLess(elapsed, sum(delays.values()))
+        for state in states:
+            self.assertEqual(state["votes"], dict.fromkeys(delays, "5"))
+            self.assertEqual(state["result"], 5)
+
+    def test_votes_hidden_until_reveal_and_rules_enforced(self):
+        """!
+        @brief Votes masqués avant révélation, double vote refusé mais vote modifiable, cartes et observateurs contrôlés.
+        """
+        async def scenario(server):
+            host = SessionClient(None)
+            await host.connect("127.0.0.1", server.port)
+            players = {name: SessionClient(name) for name in ("Alice", "Bob", "Charlie", "Dora")}
+            for client in players.values():
+                await client.connect("127.0.0.1", server.port)
+
+            await host.send("vote", card="5")
+            self.assertEqual((await host.receive())["type"], "error")
+            await players["Alice"].send("vote", card="7")
+            self.assertEqual((await players["Alice"].receive())["type"], "error")
+
+            await players["Alice"].send("vote", card="3")
+            state = await self._until(host, lambda m: m["voted"])
+            self.assertEqual((state["voted"], state["votes"]), (["Alice"], None))
+            await players["Alice"].send("vote", card="8")
+            while (await players["Alice"].receive())["type"] == "state":
+                pass
+            await players["Alice"].send("change", card="8")
+            for name in ("Bob", "Charlie", "Dora"):
+                await players[name].send("vote", card="8" if name != "Dora" else "13")
+            state = await self._until(host, lambda m: m["revealed"])
+            self.assertEqual(state["votes"]["Alice"], "8")
+            self.assertEqual(state["result"], "REVOTE")
+
+            await host.send("revote")
+            state = await self._until(host, lambda m: not m["revealed"])
+            self.assertEqual((state["round"], state["voted"]), (2, []))
+
+            for client in players.values():
+                await client.send("vote", card="8")
+            await self._until(host, lambda m: m["revealed"])
+            await host.send("validate", score=8)
+            state = await self._until(host, lambda m: m["feature_index"] == 1)
+            self.assertEqual((state["feature"], state["validated"]), ("US 2", {"US 1": 8}))
+
+            for client in [host, *players.values()]:
+                await client.close()
+
+        self._run(scenario)
+        self.assertEqual(self.session.validated_features, {"US 1": 8})
+
+    def test_malformed_fields_get_an_error_reply(self):
+        """!
+        @brief Joueur, carte ou score qui n'est ni une chaîne ni un nombre : erreur, connexion conservée.
+        """
+        async def scenario(server):
+            host, alice = SessionClient(None), SessionClient("Alice")
+            await host.connect("127.0.0.1", server.port)
+            await alice.connect("127.0.0.1", server.port)
+            replies = []
+            for client, kind, fields in ((host, "join", {"player": ["Alice"]}),
+                                         (alice, "vote", {"card": {"5": 1}}),
+                                         (host, "validate", {"score": [8]}),
+                                         (host, "validate", {"score": True})):
+                await client.send(kind, **fields)
+                replies.append(await client.receive())
+            await host.send("state")
+            state = await host.receive()
+            for client in (host, alice):
+                await client.close()
+            return replies, state
+
+        replies, state = self._run(scenario)
+        self.assertEqual([r["type"] for r in replies], ["error"] * 4)
+        self.assertEqual(replies[0]["message"], "'player' doit être une chaîne ou un nombre")
+        self.assertEqual((state["type"], state["voted"], state["validated"]), ("state", [], {}))
+
+    def test_vote_broadcast_size_is_independent_of_backlog(self):
+        """!
+        @brief Un vote diffuse un delta de taille constante ; un client en retard se resynchronise.
+        """
+        async def vote_payload(backlog_size):
+            session = GameSession()
+            for name in ("Alice", "Bob"):
+                session.add_player(name)
+            session.backlog.add_features(f"Story {i}" for i in range(backlog_size))
+            server = SessionServer(session)
+            await server.start()
+            try:
+                observer, alice = SessionClient(None), SessionClient("Alice")
+                await observer.connect("127.0.0.1", server.port)
+                await alice.connect("127.0.0.1", server.port)
+                await alice.send("vote", card="5")
+                raw = await observer._reader.readline()
+
+                observer.state["version"] = 0
+                observer.state["voted"] = []
+                await observer.send("sync", version=0)
+                state = await self._until(observer, lambda m: m["version"] == 1)
+                self.assertEqual(state["voted"], ["Alice"])
+                for client in (observer, alice):
+                    await client.close()
+                return raw
+            finally:
+                await server.close()
+
+        small = asyncio.run(asyncio.wait_for(vote_payload(3), 10))
+        large = asyncio.run(asyncio.wait_for(vote_payload(5000), 10))
+        self.assertEqual(small, large)
+        self.assertEqual(json.loads(small), {"type": "delta", "changes": [{"v": 1, "type": "vote", "player": "Alice"}]})
+
+
+class TestRemoteGameController(unittest.TestCase):
+    """!
+    @brief Tests du client réseau utilisé par la GameView.
+    """
+
+    def test_game_view_interface_over_loopback(self):
+        """!
+        @brief Le client recopie la partie hébergée et relaie les votes au serveur.
+        """
+        hosted = GameSession()
+        for name in ("Alice", "Bob"):
+            hosted.add_player(name)
+        hosted.backlog.add_features(["US 1", "US 2"])
+        server = SessionServer(hosted)
+        _, port = server.start_in_thread()
+        self.addCleanup(server.stop)
+
+        main_controller = MagicMock()
+        main_controller.game_session = GameSession()
+        remote = RemoteGameController(main_controller, "Bob")
+        remote.connect("127.0.0.1", port)
+        self.addCleanup(remote.close)
+
+        self.assertEqual(remote.get_current_feature_name(), "US 1")
+        self.assertEqual(remote.model.get_player_names(), ("Alice", "Bob"))
+        self.assertEqual(remote.get_current_player_name(), "Bob")
+        self.assertTrue(remote.cast_vote("3"))
+        self.assertEqual(remote.get_current_player_name(), "Alice")
+        self.assertFalse(remote.is_round_finished())
+
+        deadline = time.monotonic() + 5
+        while "Bob" not in hosted.votes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(hosted.votes, {"Bob": "3"})
+
+        loop = remote._loop
+        remote.close()
+        self.assertTrue(loop.is_closed())
+
+    def test_coffee_break_saves_hosted_game_and_stops_server(self):
+        """!
+        @brief Pause café en partie hébergée : l'hôte sauvegarde la session en PAUSED et arrête le serveur.
+        """
+        from controllers.MainController import MainController
+
+        hosted = GameSession()
+        for name in ("Alice", "Bob"):
+            hosted.add_player(name)
+        hosted.backlog.add_features(["US 1", "US 2"])
+        server = SessionServer(hosted)
+        server.start_in_thread()
+        self.addCleanup(server.stop)
+        server.vote("Alice", "cafe")
+        server.vote("Bob", "cafe")
+        self.assertEqual(server.result, "COFFEE")
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch("controllers.MainController.default_journal_path", return_value=os.path.join(tmp, "j")), \
+                patch("controllers.GameController.filedialog.asksaveasfilename",
+                      return_value=os.path.join(tmp, "pause.json")), \
+                patch("controllers.GameController.CustomPopup"):
+            main_controller = MainController(MagicMock())
+            main_controller.server = server
+            remote = RemoteGameController(main_controller)
+            remote.result = "COFFEE"
+            self.assertEqual(remote.handle_end_of_round(), "COFFEE")
+            self.assertTrue(main_controller.writer.flush(timeout=5))
+            with open(os.path.join(tmp, "pause.json"), encoding="utf-8") as f:
+                saved = json.load(f)
+        self.assertIsNone(main_controller.server)
+        self.assertIsNone(server._thread)
+        self.assertEqual((saved["status"], saved["backlog"], saved["current_feature_index"]),
+                         ("PAUSED", ["US 1", "US 2"], 0))
+        main_controller.view.show_frame.assert_called_with("HomeView")
+
+
+class TestRoomManager(unittest.TestCase):
+    """!
+    @brief Tests de l'hébergement multi-salles.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rooms_are_independent_and_survive_eviction(self):
+        """!
+        @brief Les salles ne partagent rien ; une salle évincée revient intacte au prochain accès.
+        """
+        manager = RoomManager(self.tmp.name)
+        ids = [manager.create_room(["Alice", "Bob"], ["US 1", "US 2"]) for _ in range(50)]
+        first, second = ids[0], ids[1]
+        self.assertEqual(manager.call(first, "vote_many", {"Zoé": "3", "Alice": "5", "Bob": "5"}),
+                         {"Zoé": "Joueur inconnu : Zoé"})
+        manager.call(second, "vote", "Alice", "8")
+
+        self.assertEqual(manager.evict_idle(60), 0)
+        self.assertEqual(manager.evict_idle(0), 50)
+        self.assertEqual(len(manager), 0)
+
+        state = manager.call(first, "snapshot")
+        self.assertEqual((state["revealed"], state["result"]), (True, 5))
+        self.assertEqual(manager.call(second, "snapshot")["voted"], ["Alice"])
+        with self.assertRaises(ValueError):
+            manager.call(second, "vote", "Alice", "3")
+        manager.call(first, "validate", 5)
+        self.assertEqual(manager.stats(), {"resident": 2, "evictions": 50, "loads": 2})
+
+        self.assertEqual(manager.close_room(first)["session"]["validated_features"], {"US 1": 5})
+        self.assertNotIn(first, manager)
+        self.assertIn(ids[2], manager)
+        with self.assertRaises(KeyError):
+            manager.call(first, "snapshot")
+        with self.assertRaises(KeyError):
+            manager.call("../etc", "snapshot")
+
+    def test_sharded_rooms_are_routed_by_id(self):
+        """!
+        @brief Les salles sont réparties entre processus et les erreurs remontent à l'appelant.
+        """
+        self.assertEqual({shard_for(f"room{i}", 4) for i in range(100)}, {0, 1, 2, 3})
+        with ShardedRoomManager(2, self.tmp.name) as manager:
+            ids = [manager.create_room(["Alice", "Bob"], ["US 1"], room_id=f"room{i}") for i in range(6)]
+            for room_id in ids:
+                manager.call(room_id, "vote", "Alice", "3")
+            manager.call(ids[0], "vote", "Bob", "3")
+            self.assertEqual(manager.call(ids[0], "snapshot")["result"], 3)
+            with self.assertRaises(ValueError):
+                manager.call(ids[1], "vote", "Alice", "5")
+            with self.assertRaises(KeyError):
+                manager.call("inconnue", "snapshot")
+            with self.assertRaises(RuntimeError):
+                manager.call(ids[2], "vote", ["Bob"], "5")  # TypeError dans le shard, qui doit survivre
+            self.assertEqual(manager.call(ids[2], "snapshot")["voted"], ["Alice"])
+            self.assertEqual(manager.evict_idle(0), 6)
+            self.assertEqual(manager.call(ids[1], "snapshot")["voted"], ["Alice"])
+            self.assertEqual(manager.stats(), {"resident": 1, "evictions": 6, "loads": 1})
+
+
+class TestHttpApi(unittest.TestCase):
+    """!
+    @brief Tests du service JSON-sur-HTTP, via un vrai socket local.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.api = ApiServer(RoomManager(self.tmp.name))
+        host, port = self.api.start_in_thread()
+        self.conn = http.client.HTTPConnection(host, port, timeout=5)
+
+    def tearDown(self):
+        self.conn.close()
+        self.api.stop()
+        self.tmp.cleanup()
+
+    def request(self, method, path, body=None):
+        """!
+        @brief Envoie une requête sur la connexion partagée et décode la réponse JSON.
+        @return Tuple (code HTTP, objet reçu).
+        """
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        self.conn.request(method, path, body=data, headers={"Content-Type": "application/json"})
+        response = self.conn.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_session_lifecycle_on_one_connection(self):
+        """!
+        @brief Création, import de backlog, votes, validation et résultats, sans rouvrir de connexion.
+        """
+        status, created = self.request("POST", "/sessions", {"players": ["Alice", "Bob"], "features": ["US 1"]})
+        self.assertEqual(status, 201)
+        room_id = created["id"]
+        sock = self.conn.sock
+
+        status, imported = self.request("POST", f"/sessions/{room_id}/backlog", {"features": ["US 2", "US 1", ""]})
+        self.assertEqual((status, imported), (200, {"accepted": 1, "rejected": 2}))
+
+        status, voted = self.request("POST", f"/sessions/{room_id}/votes", {"player": "Alice", "card": "5"})
+        self.assertEqual((status, voted["state"]["voted"]), (200, ["Alice"]))
+        self.assertIsNone(voted["state"]["votes"])
+        status, voted = self.request("POST", f"/sessions/{room_id}/votes", {"votes": {"Zoé": "3", "Bob": "5"}})
+        self.assertEqual(voted["rejected"], {"Zoé": "Joueur inconnu : Zoé"})
+        self.assertEqual((voted["state"]["revealed"], voted["state"]["result"]), (True, 5))
+
+        status, changes = self.request("GET", f"/sessions/{room_id}/changes?since=0")
+        self.assertEqual([c["type"] for c in changes["changes"]], ["vote", "vote", "reveal"])
+        status, state = self.request("POST", f"/sessions/{room_id}/validate", {"score": 5})
+        self.assertEqual((status, state["feature"]), (200, "US 2"))
+        self.assertEqual(self.request("GET", f"/sessions/{room_id}/results"),
+                         (200, {"status": "IN_PROGRESS", "validated": {"US 1": 5}, "remaining": 1}))
+        self.assertIs(self.conn.sock, sock)
+
+    def test_bulk_endpoints(self):
+        """!
+        @brief Création, votes et résultats de plusieurs sessions en une requête chacun.
+        """
+        session = {"players": ["Alice", "Bob"], "features": ["US 1"], "rule": "Médiane"}
+        status, created = self.request("POST", "/sessions/bulk", {"sessions": [session, session, {"players": []}]})
+        self.assertEqual(status, 201)
+        first, second, invalid = created["ids"]
+        self.assertIsNone(invalid)
+        self.assertEqual(list(created["errors"]), ["2"])
+
+        status, voted = self.request("POST", "/votes/bulk", {"sessions": {
+            first: {"Alice": "3", "Bob": "3"}, second: {"Alice": "8", "Bob": "42"}, "absente": {"Alice": "1"}}})
+        self.assertEqual(set(voted["rejected"]), {second, "absente"})
+        self.assertEqual(voted["rejected"][second], {"Bob": "Carte inconnue : 42"})
+
+        self.request("POST", f"/sessions/{first}/validate", {"score": 3})
+        status, results = self.request("POST", "/results/bulk", {"ids": [first, second, "absente"]})
+        self.assertEqual(results["results"][first]["validated"], {"US 1": 3})
+        self.assertEqual(results["results"][second]["status"], "IN_PROGRESS")
+        self.assertEqual(results["missing"], ["absente"])
+
+    def test_errors_keep_the_connection_usable(self):
+        """!
+        @brief Les erreurs sont des réponses JSON (400, 404, 405) et n'interrompent pas le keep-alive.
+        """
+        status, created = self.request("POST", "/sessions", {"players": ["Alice", "Bob"], "features": ["US 1"]})
+        room_id = created["id"]
+        self.assertEqual(self.request("GET", "/sessions/inconnue")[0], 404)
+        self.assertEqual(self.request("GET", "/nulle-part")[0], 404)
+        self.assertEqual(self.request("DELETE", f"/sessions/{room_id}/votes")[0], 405)
+        self.assertEqual(self.request("POST", f"/sessions/{room_id}/revote")[0], 400)
+        self.assertEqual(self.request("POST", f"/sessions/{room_id}/votes", {"player": "Alice", "card": "7"}),
+                         (400, {"error": "Carte inconnue : 7"}))
+        self.assertEqual(self.request("POST", f"/sessions/{room_id}/votes", {"player": ["Alice"], "card": "5"}),
+                         (400, {"error": "'player' doit être une chaîne ou un nombre"}))
+        self.assertEqual(self.request("POST", f"/sessions/{room_id}/validate", {})[0], 400)
+        self.conn.request("POST", "/sessions", body=b"{pas du json")
+        response = self.conn.getresponse()
+        self.assertEqual(response.status, 400)
+        response.read()
+
+        status, closed = self.request("DELETE", f"/sessions/{room_id}")
+        self.assertEqual((status, closed["session"]["backlog"]), (200, ["US 1"]))
+        self.assertEqual(self.request("GET", f"/sessions/{room_id}")[0], 404)
+
+
+class TestConsensusEngine(unittest.TestCase):
+    """!
+    @brief Tests unitaires du moteur de consensus par histogramme.
+    """
+
+    def setUp(self):
+        """!
+        @brief Prépare un moteur sur le deck standard du jeu.
+        """
+        self.deck = ["0", "1", "2", "3", "5", "8", "13", "20", "40", "100", "interro", "cafe"]
+        self.engine = ConsensusEngine(self.deck)
+
+    def test_matches_statistics_reference(self):
+        """!
+        @brief Compare chaque règle à un calcul de référence basé sur statistics.
+        """
+        from statistics import mean, median, multimode
+        rng = random.Random(42)
+        for _ in range(300):
+            votes = [rng.choice(self.deck) for _ in range(rng.randint(1, 15))]
+            numeric = [int(v) for v in votes if v.isdigit()]
+            if not numeric:
+                continue
+            self.assertEqual(self.engine.resolve(votes, 2, "Moyenne"), round(mean(numeric)))
+            self.assertEqual(self.engine.resolve(votes, 2, "Médiane"), round(median(numeric)))
+            self.assertEqual(self.engine.resolve(votes, 2, "Majorité Relative"), max(multimode(numeric)))
+
+            winner = max(set(numeric), key=numeric.count)
+            expected = winner if numeric.count(winner) > len(numeric) / 2 else None
+            self.assertEqual(self.engine.resolve(votes, 2, "Majorité Absolue"), expected)
+
+    def test_special_cards_and_off_deck_values(self):
+        """!
+        @brief Cartes spéciales ignorées, valeurs hors deck prises en compte.
+        """
+        self.assertIsNone(self.engine.resolve(["cafe", "interro"], 1, "Moyenne"))
+        self.assertEqual(self.engine.resolve(["cafe", "interro"], 2, "Moyenne"), "?")
+        self.assertEqual(self.engine.resolve(["7", "9"], 2, "Moyenne"), 8)
+        self.assertEqual(self.engine.resolve(["7", "7", "cafe"], 1, "Moyenne"), 7)
+
+    def test_votes_are_read_without_mutating_the_engine(self):
+        """!
+        @brief "05" vaut 5 comme dans la règle d'origine, et aucun vote ne modifie le moteur partagé.
+        """
+        values = list(self.engine.values)
+        self.assertEqual(self.engine.resolve(["05", "5"], 1, "Moyenne"), 5)
+        self.assertEqual(self.engine.resolve(["05", "8"], 2, "Médiane"), 6)
+        self.assertEqual(self.engine.resolve(["7", "07", "9"], 2, "Majorité Relative"), 7)
+        self.assertEqual(self.engine.resolve(["²", "3"], 1, "Moyenne"), 3)
+        self.assertEqual(self.engine.values, values)
+
+    def test_resolve_many(self):
+        """!
+        @brief L'API par lot renvoie un résultat par vecteur, dans l'ordre.
+        """
+        vectors = [["5", "5", "5"], ["3", "5", "8"], ["interro"]]
+        self.assertEqual(self.engine.resolve_many(vectors, 1, "Unanimité"), [5, None, None])
+        self.assertEqual(self.engine.resolve_many(vectors, 2, "Médiane"), [5, 5, "?"])
+
+
+class TestHeadlessSimulator(unittest.TestCase):
+    """!
+    @brief Tests du simulateur headless utilisé par benchmarks.py.
+    """
+
+    def test_full_game_is_played(self):
+        """!
+        @brief Une partie simulée valide toutes les stories et mesure chaque opération.
+        """
+        sim = HeadlessSimulator(players=5, stories=12, distribution="consensus", seed=1)
+        rounds = sim.run(snapshot_every=3)
+
+        self.assertEqual(rounds, 12)
+        self.assertEqual(len(sim.session.validated_features), 12)
+        self.assertEqual(len(sim.timings["cast_vote"]), 5 * 12)
+        self.assertEqual(sim.main_controller.navigation["result"], 1)
+        self.assertEqual(len(sim.timings["from_dict"]), 4)
+
+    def test_divergent_votes_terminate(self):
+        """!
+        @brief Des votes divergents déclenchent des revotes mais la partie se termine.
+        """
+        sim = HeadlessSimulator(players=6, stories=5, distribution="uniform",
+                                mode="Unanimité", seed=3, max_rounds=2)
+        sim.run()
+
+        self.assertIsNone(sim.session.get_current_feature())
+        self.assertGreater(sim.outcomes["REVOTE"], 0)
+
+
+class _FakeRasterCache(CardRasterCache):
+    """!
+    @brief CardRasterCache dont la rastérisation ne dépend pas de cairo.
+    """
+
+    def _rasterize(self, svg_data, output_height):
+        if not svg_data.startswith(b"<svg xmlns"):
+            return b"PNG" + svg_data + str(output_height).encode()
+        # Planche : une vraie image PNG aux dimensions du viewBox.
+        from PIL import Image
+        _, _, width, height = map(float, re.search(rb'viewBox="([^"]+)"', svg_data).group(1).split())
+        buffer = io.BytesIO()
+        Image.new("RGB", (round(width * output_height / height), output_height), "white").save(buffer, "PNG")
+        return buffer.getvalue()
+
+
+class TestCardRasterCache(unittest.TestCase):
+    """!
+    @brief Tests du cache disque des cartes rastérisées.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.assets = os.path.join(self.tmp.name, "img")
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+        os.makedirs(self.assets)
+        for value in ("1", "cafe"):
+            with open(os.path.join(self.assets, f"cartes_{value}.svg"), "w") as f:
+                f.write(f"<svg id='{value}'/>")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_second_process_reads_from_disk(self):
+        """!
+        @brief Un nouveau cache sur le même dossier ne rastérise plus rien.
+        """
+        first = _FakeRasterCache(self.cache_dir, self.assets)
+        for value in first.values():
+            for size in [(70, 105), (80, 120)]:
+                first.png_bytes(value, size)
+        self.assertEqual(first.rasterizations, 4)
+
+        second = _FakeRasterCache(self.cache_dir, self.assets)
+        data = second.png_bytes("cafe", (80, 120))
+        self.assertEqual(second.rasterizations, 0)
+        self.assertEqual(second.disk_hits, 1)
+        self.assertTrue(data.endswith(b"240"))
+
+    def test_modified_asset_is_invalidated(self):
+        """!
+        @brief Modifier un SVG produit une nouvelle entrée et l'ancienne est purgée.
+        """
+        cache = _FakeRasterCache(self.cache_dir, self.assets)
+        cache.png_bytes("1", (70, 105))
+        with open(os.path.join(self.assets, "cartes_1.svg"), "w") as f:
+            f.write("<svg id='un'/>")
+
+        self.assertIn(b"un", cache.png_bytes("1", (70, 105)))
+        self.assertEqual(cache.rasterizations, 2)
+        self.assertEqual(cache.prune(), 1)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+
+def _fake_rasterize(svg_data, output_height):
+    """!
+    @brief Rastérisation factice transmissible aux processus de travail.
+    """
+    return b"PNG" + svg_data + str(output_height).encode()
+
+
+class TestCardPrewarm(unittest.TestCase):
+    """!
+    @brief Tests du préchauffage des cartes en parallèle.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.assets = os.path.join(self.tmp.name, "img")
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+        os.makedirs(self.assets)
+        for value in ("1", "2", "cafe"):
+            with open(os.path.join(self.assets, f"cartes_{value}.svg"), "w") as f:
+                f.write(f"<svg id='{value}'/>")
+        self.sizes = [(70, 105), (80, 120)]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _prewarm(self, workers, rasterize=_fake_rasterize):
+        cache = CardRasterCache(self.cache_dir, self.assets)
+        cards = {}
+        prewarmer = CardPrewarmer(self.sizes, raster_cache=cache, workers=workers, rasterize=rasterize)
+        prewarmer.start(lambda value, size, png: cards.__setitem__((value, size), png))
+        self.assertTrue(prewarmer.flush(timeout=60))
+        return prewarmer, cache, cards
+
+    def test_pool_streams_every_card_and_fills_disk_cache(self):
+        """!
+        @brief Le pool produit les mêmes PNG qu'un seul processus ; un second lancement relit le disque.
+        """
+        prewarmer, cache, cards = self._prewarm(workers=2)
+        self.assertEqual(prewarmer.mode, "pool")
+        self.assertEqual(len(cards), 6)
+        self.assertEqual(cards[("cafe", (80, 120))], b"PNG<svg id='cafe'/>240")
+        self.assertEqual(cache.rasterizations, 6)
+
+        again, cache, cached = self._prewarm(workers=2)
+        self.assertEqual(cached, cards)
+        self.assertEqual((cache.rasterizations, cache.disk_hits), (0, 6))
+        self.assertEqual(cache.png_bytes("1", (70, 105)), cards[("1", (70, 105))])
+
+    def test_stale_entries_are_pruned_after_prewarm(self):
+        """!
+        @brief Le préchauffage purge en fin de course les PNG d'un asset modifié.
+        """
+        os.makedirs(self.cache_dir)
+        stale = os.path.join(self.cache_dir, "1-70x105@2-0123456789abcdef.png")
+        with open(stale, "wb") as f:
+            f.write(b"PNG")
+        self._prewarm(workers=1)
+        self.assertFalse(os.path.exists(stale))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 6)
+
+    def test_unpicklable_rasterizer_falls_back_to_one_process(self):
+        """!
+        @brief Une fonction non transmissible aux processus est exécutée dans le thread de coordination.
+        """
+        prewarmer, cache, cards = self._prewarm(workers=2, rasterize=lambda svg, h: _fake_rasterize(svg, h))
+        self.assertEqual(prewarmer.mode, "serial")
+        self.assertEqual(len(cards), 6)
+        self.assertEqual(prewarmer.delivered, 6)
+
+
+class TestCardAtlas(unittest.TestCase):
+    """!
+    @brief Tests de la planche de cartes (sprite sheet).
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = _FakeRasterCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_one_rasterization_serves_every_size(self):
+        """!
+        @brief Les deux tailles de cartes sont découpées dans une seule planche.
+        """
+        atlas = CardAtlas([(70, 105), (80, 120)], raster_cache=self.cache)
+        self.assertEqual(len(atlas.manifest()), 12)
+
+        for value in atlas.values:
+            self.assertEqual(atlas.card(value, (80, 120)).height, 240)
+            self.assertEqual(atlas.card(value, (70, 105)).height, 210)
+        self.assertEqual(self.cache.rasterizations, 1)
+
+        x, y, w, h = atlas.manifest()[atlas.values[-1]]
+        self.assertLessEqual(x + w, atlas.sheet().width)
+        self.assertLessEqual(y + h, atlas.sheet().height)
+
+    def test_card_ids_do_not_collide(self):
+        """!
+        @brief Les identifiants SVG sont préfixés par carte dans la planche.
+        """
+        atlas = CardAtlas([(80, 120)], raster_cache=self.cache)
+        ids = re.findall(r'\bid="([^"]+)"', atlas.document)
+        self.assertEqual(len(ids), len(set(ids)))
+
+
+class TestVirtualList(unittest.TestCase):
+    """!
+    @brief Tests du fenêtrage de la liste virtualisée (sans affichage).
+    """
+
+    def test_window_is_clamped(self):
+        """!
+        @brief La fenêtre visible reste dans les bornes de la liste.
+        """
+        self.assertEqual(clamp_first(-5, 100000, 12), 0)
+        self.assertEqual(clamp_first(99999, 100000, 12), 99988)
+        self.assertEqual(clamp_first(7, 3, 12), 0)
+
+    def test_scrollbar_fractions(self):
+        """!
+        @brief La barre de défilement reflète la portion affichée.
+        """
+        self.assertEqual(scroll_fractions(0, 5, 12), (0.0, 1.0))
+        self.assertEqual(scroll_fractions(50, 100, 10), (0.5, 0.6))
+        self.assertEqual(scroll_fractions(95, 100, 10)[1], 1.0)
+
+
+class TestCanvasTable(unittest.TestCase):
+    """!
+    @brief Tests de la disposition de la table dessinée sur Canvas.
+    """
+
+    def test_rows_wrap_and_stay_centered(self):
+        """!
+        @brief Les slots passent à la ligne selon la largeur et chaque rangée est centrée.
+        """
+        positions, columns, height = wrap_positions(5, 350, 100, 50)
+        self.assertEqual(columns, 3)
+        self.assertEqual(height, 100)
+        self.assertEqual(positions, [(25, 0), (125, 0), (225, 0), (75, 50), (175, 50)])
+
+    def test_large_room_layout(self):
+        """!
+        @brief 200 joueurs tiennent dans une grille régulière, même sur une largeur trop étroite.
+        """
+        positions, columns, height = wrap_positions(200, 1400, 140, 195)
+        self.assertEqual((columns, height), (10, 20 * 195))
+        self.assertEqual(len(set(positions)), 200)
+
+        positions, columns, _ = wrap_positions(3, 50, 140, 195)
+        self.assertEqual(columns, 1)
+        self.assertEqual(positions[2], (0, 390))
+
+
+class TestResultIndex(unittest.TestCase):
+    """!
+    @brief Tests de l'index de tri du bilan.
+    """
+
+    def test_sorted_orders(self):
+        """!
+        @brief Les trois ordres sont disponibles sans tri à l'affichage.
+        """
+        index = ResultIndex()
+        results = {"Paiement": 8, "accueil": "cafe", "Login": 3, "Export": "?"}
+        self.assertIsNone(index.sync(results))
+
+        self.assertEqual([f for f, _ in index.rows("order")], ["Paiement", "accueil", "Login", "Export"])
+        self.assertEqual([f for f, _ in index.rows("name")], ["accueil", "Export", "Login", "Paiement"])
+        self.assertEqual(index.rows("score"), [("Login", 3), ("Paiement", 8), ("Export", "?"), ("accueil", "cafe")])
+
+    def test_incremental_append(self):
+        """!
+        @brief Les nouveaux résultats sont ajoutés avec leur position dans chaque ordre.
+        """
+        index = ResultIndex()
+        results = {"B": 5, "D": 1}
+        index.sync(results)
+
+        results["A"] = 2
+        added = index.sync(results)
+        self.assertEqual(added, [("A", 2, {"order": 2, "name": 0, "score": 1})])
+        self.assertEqual(index.sync(results), [])
+        self.assertEqual(index.rows("score"), [("D", 1), ("A", 2), ("B", 5)])
+
+        self.assertIsNone(index.sync({"Z": 1}))
+        self.assertEqual(len(index), 1)
+
+
+class TestStartup(unittest.TestCase):
+    """!
+    @brief Imports du démarrage, relevés avec `python -X importtime`.
+    @note Le budget de temps est vérifié par benchmarks.py : une mesure d'horloge serait instable en CI.
+    """
+
+    def test_startup_defers_heavy_imports(self):
+        """!
+        @brief Le lancement n'importe ni les vues secondaires ni cairosvg.
+        """
+        imported, _ = StartupProbe.measure_imports()
+
+        self.assertEqual([m for m in StartupProbe.DEFERRED_MODULES if m in imported], [])
+        for module in StartupProbe.STARTUP_MODULES:
+            self.assertIn(module, imported)
+
+
+class TestRefreshScheduler(unittest.TestCase):
+    """!
+    @brief Tests du regroupement des rafraîchissements.
+    """
+
+    def test_regions_repainted_once_per_pass(self):
+        """!
+        @brief Plusieurs demandes avant le passage idle ne produisent qu'une repeinte par région.
+        """
+        root = MagicMock()
+        view = MagicMock()
+        scheduler = RefreshScheduler(root)
+
+        scheduler.mark_dirty(view, "header", "table", "deck")
+        scheduler.mark_dirty(view, "table")
+        scheduler.mark_dirty(view, "table", "deck")
+        root.after_idle.assert_called_once_with(scheduler.flush)
+
+        scheduler.flush()
+        view.repaint.assert_called_once_with({"header", "table", "deck"})
+        self.assertEqual(scheduler.stats(), {"requests": 6, "redraws": 3, "coalesced": 3, "flushes": 1})
+
+        scheduler.mark_dirty(view, "deck")
+        self.assertEqual(root.after_idle.call_count, 2)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """!
+    @brief Tests de l'instrumentation optionnelle de l'interface.
+    """
+
+    def setUp(self):
+        self.collector = instrumentation_module.instrumentation
+        self.was_enabled = self.collector.enabled
+        self.collector.reset()
+
+    def tearDown(self):
+        self.collector.enabled = self.was_enabled
+        self.collector.reset()
+
+    def test_timed_only_when_enabled(self):
+        """!
+        @brief Les appels ne sont mesurés qu'une fois l'instrumentation activée.
+        """
+        @instrumentation_module.timed("test.op")
+        def op(x):
+            return x * 2
+
+        self.collector.enabled = False
+        self.assertEqual(op(2), 4)
+        self.assertNotIn("test.op", self.collector.timings)
+
+        self.collector.enabled = True
+        op(1)
+        op(2)
+        self.collector.count("card_image.hit", 3)
+        self.collector.count("card_image.miss")
+        snapshot = self.collector.snapshot()
+        self.assertEqual(snapshot["timings"]["test.op"]["calls"], 2)
+        self.assertEqual(snapshot["caches"]["card_image_hit_rate"], 0.75)
+
+    def test_dump_includes_widget_counts(self):
+        """!
+        @brief L'export JSON contient le nombre de widgets vivants par vue.
+        """
+        leaf = MagicMock()
+        leaf.winfo_children.return_value = []
+        frame = MagicMock()
+        frame.winfo_children.return_value = [leaf, leaf]
+        root = MagicMock()
+        root.winfo_children.return_value = [frame]
+        root.frames = {"GameView": frame}
+        root.scheduler = RefreshScheduler(MagicMock())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "mesures.json")
+            self.collector.dump_json(path, root)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        self.assertEqual(data["widgets"], {"total": 4, "GameView": 3})
+        self.assertEqual(data["scheduler"]["redraws"], 0)
+
+
+class TestImageCache(unittest.TestCase):
+    """!
+    @brief Tests du cache LRU d'images de cartes.
+    """
+
+    @staticmethod
+    def _source(calls):
+        from PIL import Image
+
+        def source(value, size, scale):
+            calls.append((value, size, scale))
+            return Image.new("RGBA", (round(size[0] * scale), round(size[1] * scale)))
+        return source
+
+    def test_scale_follows_display(self):
+        """!
+        @brief L'échelle de rastérisation suit le facteur "tk scaling" de l'écran.
+        """
+        # Le ScalingTracker remonte la chaîne des "master" jusqu'à une fenêtre Tk : neutralisé ici
+        ctk_scaling = patch("customtkinter.ScalingTracker.get_widget_scaling", return_value=1.0)
+        ctk_scaling.start()
+        self.addCleanup(ctk_scaling.stop)
+        widget = MagicMock()
+        widget.tk.call.return_value = "1.3333333"  # 96 ppp
+        self.assertEqual(scale_for(widget), 1.0)
+        widget.tk.call.return_value = "2.0"  # 144 ppp
+        self.assertEqual(scale_for(widget), 1.5)
+        widget.tk.call.return_value = "2.6666667"  # 192 ppp
+        self.assertEqual(scale_for(widget), 2.0)
+
+        calls = []
+        cache = ImageCache(source=self._source(calls))
+        cache.card("5", (10, 10), widget)
+        self.assertEqual(calls, [("5", (10, 10), 2.0)])
+
+    def test_lru_eviction_and_stats(self):
+        """!
+        @brief Le plafond mémoire évince l'image la moins récemment utilisée.
+        """
+        calls = []
+        cache = ImageCache(max_bytes=2 * 10 * 10 * 4, source=self._source(calls))
+        first = cache.card("1", (10, 10), scale=1.0)
+        cache.card("2", (10, 10), scale=1.0)
+        self.assertIs(cache.card("1", (10, 10), scale=1.0), first)
+        cache.card("3", (10, 10), scale=1.0)  # évince "2"
+        cache.card("2", (10, 10), scale=1.0)  # à reproduire, évince "1"
+
+        self.assertEqual([value for value, _, _ in calls], ["1", "2", "3", "2"])
+        self.assertEqual(cache.stats(), {"entries": 2, "hits": 1, "misses": 4, "evictions": 2,
+                                         "bytes": 800, "max_bytes": 800})
+
+    def test_miss_during_prewarm_rasterizes_one_card(self):
+        """!
+        @brief Pendant le préchauffage, une carte manquante est rastérisée seule, sans la planche ;
+               ensuite elle est relue depuis le disque.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            assets = os.path.join(tmp, "img")
+            os.makedirs(assets)
+            for value in ("1", "2"):
+                with open(os.path.join(assets, f"cartes_{value}.svg"), "w") as f:
+                    f.write('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 15"/>')
+            raster_cache = _FakeRasterCache(os.path.join(tmp, "cache"), assets)
+            with patch("views.CardRasterCache.shared_cache", return_value=raster_cache), \
+                    patch("views.CardAtlas.shared_atlas", side_effect=AssertionError("planche rastérisée")):
+                cache = ImageCache()
+                cache.prewarmer = MagicMock(running=True)
+                cache.card("1", (10, 15), scale=1.0)
+                self.assertEqual(raster_cache.rasterizations, 1)
+
+                ImageCache().card("1", (10, 15), scale=1.0)
+                self.assertEqual((raster_cache.rasterizations, raster_cache.disk_hits), (1, 1))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
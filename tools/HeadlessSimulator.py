@@ -0,0 +1,222 @@
+import random
+import time
+import tracemalloc
+from collections import defaultdict
+
+from models.GameSession import GameSession
+from controllers.GameController import GameController
+
+
+def _uniform_votes(rng, deck, count):
+    """!
+    @brief Chaque joueur tire une carte au hasard dans tout le deck.
+    """
+    return [rng.choice(deck) for _ in range(count)]
+
+
+def _consensus_votes(rng, deck, count):
+    """!
+    @brief Tous les joueurs votent la même carte numérique.
+    """
+    card = rng.choice([c for c in deck if c.isdigit()])
+    return [card] * count
+
+
+def _split_votes(rng, deck, count):
+    """!
+    @brief L'équipe se partage entre deux cartes numériques voisines.
+    """
+    numeric = [c for c in deck if c.isdigit()]
+    i = rng.randrange(len(numeric) - 1)
+    return [numeric[i + rng.randint(0, 1)] for _ in range(count)]
+
+
+def _skewed_votes(rng, deck, count):
+    """!
+    @brief Votes concentrés autour d'une carte, avec quelques "interro"/"cafe".
+    """
+    numeric = [c for c in deck if c.isdigit()]
+    center = rng.randrange(len(numeric))
+    votes = []
+    for _ in range(count):
+        if rng.random() < 0.05:
+            votes.append(rng.choice(["interro", "cafe"]))
+        else:
+            idx = min(len(numeric) - 1, max(0, round(rng.gauss(center, 1))))
+            votes.append(numeric[idx])
+    return votes
+
+
+VOTE_DISTRIBUTIONS = {
+    "uniform": _uniform_votes,
+    "consensus": _consensus_votes,
+    "split": _split_votes,
+    "skewed": _skewed_votes,
+}
+
+
+class HeadlessMainController:
+    """!
+    @brief Remplace le MainController sans interface graphique.
+    @details Compte les demandes de navigation au lieu d'afficher des vues.
+    @attributes
+        navigation Compteur d'appels par nom de vue.
+    """
+
+    def __init__(self):
+        """!
+        @brief Initialise les compteurs de navigation.
+        """
+        self.navigation = defaultdict(int)
+
+    def show_home(self):
+        """!
+        @brief Enregistre un retour à l'accueil.
+        """
+        self.navigation["home"] += 1
+
+    def show_game(self):
+        """!
+        @brief Enregistre un affichage de la vue de jeu.
+        """
+        self.navigation["game"] += 1
+
+    def show_result(self):
+        """!
+        @brief Enregistre un affichage de la vue des résultats.
+        """
+        self.navigation["result"] += 1
+
+
+class HeadlessGameController(GameController):
+    """!
+    @brief GameController sans boîte de dialogue pour la pause café.
+    @attributes
+        paused_payloads Sauvegardes produites par les pauses café.
+    """
+
+    def __init__(self, game_session, main_controller):
+        """!
+        @brief Initialise le contrôleur headless.
+        @param game_session Instance du modèle GameSession.
+        @param main_controller Instance de HeadlessMainController.
+        """
+        super().__init__(game_session, main_controller)
+        self.paused_payloads = []
+
+    def save_game_state_and_quit(self):
+        """!
+        @brief Sérialise la session en mémoire au lieu d'ouvrir un filedialog.
+        """
+        self.paused_payloads.append(self.model.to_dict(status="PAUSED"))
+        self.main_controller.show_home()
+
+
+class HeadlessSimulator:
+    """!
+    @brief Rejoue des parties complètes de Planning Poker sans interface Tk.
+    @details Pilote GameSession et GameController avec N joueurs synthétiques, M stories et
+             une distribution de votes configurable, en mesurant chaque opération.
+    @attributes
+        session Modèle de session simulé.
+        controller Contrôleur de jeu headless.
+        timings Durées mesurées (secondes) par nom d'opération.
+        peaks Pics mémoire mesurés (octets) par nom d'opération.
+        outcomes Compteur des issues de tour (valeurs, "REVOTE", "COFFEE").
+    """
+
+    def __init__(self, players=8, stories=50, distribution="skewed", mode="Moyenne",
+                 seed=0, max_rounds=3, track_memory=False):
+        """!
+        @brief Prépare une session avec des joueurs et un backlog synthétiques.
+        @param players Nombre de joueurs.
+        @param stories Nombre de user stories.
+        @param distribution Nom de la distribution dans VOTE_DISTRIBUTIONS.
+        @param mode Règle de validation appliquée à partir du tour 2.
+        @param seed Graine du générateur aléatoire.
+        @param max_rounds Nombre de tours avant d'abandonner une story avec "?".
+        @param track_memory Mesure le pic mémoire de chaque opération via tracemalloc.
+        @raises ValueError Si la distribution est inconnue.
+        """
+        if distribution not in VOTE_DISTRIBUTIONS:
+            raise ValueError(f"Distribution inconnue: {distribution}")
+
+        self.rng = random.Random(seed)
+        self.draw_votes = VOTE_DISTRIBUTIONS[distribution]
+        self.max_rounds = max_rounds
+        self.track_memory = track_memory
+
+        self.main_controller = HeadlessMainController()
+        self.session = GameSession()
+        self.controller = HeadlessGameController(self.session, self.main_controller)
+
+        for i in range(players):
+            self.session.add_player(f"Joueur {i + 1}")
+        for i in range(stories):
+            self.session.backlog.add_feature(f"User Story {i + 1}")
+        self.session.rules.set_mode(mode)
+
+        self.timings = defaultdict(list)
+        self.peaks = defaultdict(int)
+        self.outcomes = defaultdict(int)
+
+    def _call(self, name, fn, *args):
+        """!
+        @brief Exécute une opération en mesurant sa durée (et son pic mémoire si demandé).
+        @param name Nom de l'opération mesurée.
+        @param fn Fonction à appeler.
+        @return La valeur de retour de fn.
+        """
+        if self.track_memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        result = fn(*args)
+        self.timings[name].append(time.perf_counter() - start)
+
+        if self.track_memory:
+            peak = tracemalloc.get_traced_memory()[1] - before
+            if peak > self.peaks[name]:
+                self.peaks[name] = peak
+        return result
+
+    def play_round(self):
+        """!
+        @brief Joue un tour complet : votes, révélation, fin de tour puis validation ou revote.
+        @return L'issue du tour ("REVOTE", "COFFEE" ou le score validé).
+        """
+        controller = self.controller
+        for card in self.draw_votes(self.rng, controller.deck, len(self.session.players)):
+            self._call("cast_vote", controller.cast_vote, card)
+        controller.reveal_votes()
+
+        outcome = self._call("handle_end_of_round", controller.handle_end_of_round)
+        if outcome == "COFFEE":
+            # La pause café renvoie à l'accueil : on reprend le même tour.
+            controller._reset_round_state()
+        elif outcome == "REVOTE" and self.session.current_round_number < self.max_rounds:
+            self._call("restart_round", controller.restart_round)
+        else:
+            score = "?" if outcome == "REVOTE" else outcome
+            self._call("validate_feature", controller.validate_feature, score)
+
+        self.outcomes[outcome if outcome in ("REVOTE", "COFFEE") else "VALIDATED"] += 1
+        return outcome
+
+    def run(self, snapshot_every=10):
+        """!
+        @brief Joue toutes les stories du backlog jusqu'au bilan.
+        @param snapshot_every Fréquence (en tours) des allers-retours to_dict/from_dict.
+        @return Le nombre de tours joués.
+        @note Les allers-retours de sérialisation sont mesurés sur une session distincte.
+        """
+        rounds = 0
+        mirror = GameSession()
+        while self.session.get_current_feature() is not None:
+            self.play_round()
+            rounds += 1
+            if snapshot_every and rounds % snapshot_every == 0:
+                data = self._call("to_dict", self.session.to_dict)
+                self._call("from_dict", mirror.from_dict, data)
+        return rounds
@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import time
+
+## Racine du dépôt, utilisée comme dossier courant des processus mesurés.
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+## Modules importés au lancement de l'application (avant le premier affichage).
+STARTUP_MODULES = ("views.MainWindow", "controllers.MainController")
+
+## Modules qui ne doivent être chargés qu'à la première utilisation.
+DEFERRED_MODULES = ("cairosvg", "views.GameView", "views.CardAtlas", "views.SetupView", "views.ResultView")
+
+## Budget (millisecondes) du temps d'import cumulé de STARTUP_MODULES, vérifié par benchmarks.py.
+STARTUP_IMPORT_BUDGET_MS = 600
+
+_FIRST_FRAME_SCRIPT = """
+import time
+start = time.perf_counter()
+from views.MainWindow import MainWindow
+from controllers.MainController import MainController
+app = MainWindow(prewarm=False)
+app.set_controller(MainController(app))
+app.update()
+print("FIRST_FRAME_MS", (time.perf_counter() - start) * 1000)
+app.destroy()
+"""
+
+
+def parse_importtime(stderr):
+    """!
+    @brief Analyse la sortie de `python -X importtime`.
+    @param stderr Texte écrit sur la sortie d'erreur par l'interpréteur.
+    @return Dictionnaire {module: temps cumulé en microsecondes}.
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # ligne d'en-tête
+        modules[parts[2].strip()] = int(parts[1])
+    return modules
+
+
+def measure_imports(modules=STARTUP_MODULES):
+    """!
+    @brief Importe des modules dans un interpréteur neuf avec `-X importtime`.
+    @param modules Modules à importer.
+    @return Tuple (temps cumulé par module importé en µs, durée totale du processus en ms).
+    @raises RuntimeError Si l'import échoue.
+    """
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+                          cwd=REPO_ROOT, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import impossible")
+    return parse_importtime(proc.stderr), wall_ms
+
+
+def startup_import_ms(imported, modules=STARTUP_MODULES):
+    """!
+    @brief Temps d'import cumulé des modules de démarrage.
+    @param imported Résultat de parse_importtime.
+    @param modules Modules de démarrage.
+    @return La somme des temps cumulés, en millisecondes.
+    """
+    return sum(imported.get(name, 0) for name in modules) / 1000
+
+
+def measure_first_frame(timeout=60):
+    """!
+    @brief Mesure le temps jusqu'au premier affichage de la fenêtre principale.
+    @param timeout Délai maximal (secondes).
+    @return Le temps en millisecondes, ou None si aucun affichage n'est disponible.
+    """
+    proc = subprocess.run([sys.executable, "-c", _FIRST_FRAME_SCRIPT], cwd=REPO_ROOT,
+                          capture_output=True, text=True, timeout=timeout)
+    for line in proc.stdout.splitlines():
+        if line.startswith("FIRST_FRAME_MS"):
+            return float(line.split()[1])
+    return None
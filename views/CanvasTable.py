@@ -0,0 +1,286 @@
+import customtkinter as ctk
+
+SLOT_GAP = 20          # Espace horizontal entre deux slots
+SLOT_NAME_HEIGHT = 30  # Hauteur réservée au nom au-dessus de la zone de statut
+SLOT_CAPTION_HEIGHT = 30  # Hauteur réservée à la légende sous la zone de statut
+ROW_GAP = 15           # Espace vertical entre deux rangées
+
+
+def wrap_positions(count, available_width, cell_width, cell_height):
+    """!
+    @brief Dispose des cellules de taille fixe en rangées centrées qui passent à la ligne.
+    @param count Nombre de cellules.
+    @param available_width Largeur disponible.
+    @param cell_width Largeur d'une cellule (espacement compris).
+    @param cell_height Hauteur d'une rangée (espacement compris).
+    @return Tuple (positions, colonnes, hauteur totale) où positions liste le coin
+            haut-gauche (x, y) de chaque cellule, dans l'ordre.
+    """
+    columns = max(1, min(count, int(available_width // cell_width)))
+    rows = -(-count // columns) if count else 0
+    positions = []
+    for i in range(count):
+        row, col = divmod(i, columns)
+        in_row = min(columns, count - row * columns)
+        offset = (available_width - in_row * cell_width) / 2
+        positions.append((max(0, offset) + col * cell_width, row * cell_height))
+    return positions, columns, rows * cell_height
+
+
+class CanvasTable(ctk.CTkFrame):
+    """!
+    @brief Table de jeu dessinée sur un unique Canvas, pour les grandes salles.
+    @details Chaque joueur est un groupe d'éléments Canvas (nom, zone de statut, icône, légende,
+             carte révélée) étiquetés "slot<i>" ; les mises à jour reconfigurent ces éléments par
+             étiquette sans créer de widget. Les slots sont disposés en rangées qui passent à la
+             ligne selon la largeur, avec défilement vertical au-delà de la hauteur affichée.
+    @attributes
+        players Noms des joueurs affichés, dans l'ordre.
+        states États (a_voté, est_actif) affichés, par index de joueur.
+    """
+
+    def __init__(self, parent, slot_width, card_size, accent_color, styles, image_for):
+        """!
+        @brief Construit le Canvas et sa barre de défilement.
+        @param parent Widget parent.
+        @param slot_width Largeur d'un slot.
+        @param card_size Tuple (largeur, hauteur) de la zone de statut et des cartes révélées.
+        @param accent_color Couleur du nom et de la bordure du joueur actif.
+        @param styles Dictionnaire {"voted"|"active"|"waiting": (icône, couleur icône, légende, couleur légende)},
+                      comme pour PlayerSlot.
+        @param image_for Fonction image_for(valeur, taille_px) retournant une image PIL de la carte, ou None.
+        @example
+            table = CanvasTable(area, 120, (80, 120), "#3B8ED0", SLOT_STYLES, image_for)
+            table.set_players(("Alice", "Bob"))
+            table.set_state("Alice", voted=False, active=True)
+        """
+        super().__init__(parent, fg_color="transparent")
+        self.players = ()
+        self.states = []
+        self._index = {}
+        self._slot_width = slot_width
+        self._card_size = card_size
+        self._accent_color = accent_color
+        self._styles = styles
+        self._image_for = image_for
+        self._photos = {}
+        self._revealed = False
+        self._last_votes = None
+        self._columns = None
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.canvas = ctk.CTkCanvas(self, highlightthickness=0, borderwidth=0,
+                                    bg=self._apply_appearance_mode(self._fg_color_of(parent)))
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+
+        self.canvas.bind("<Configure>", self._on_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(sequence, self._on_wheel)
+
+    @staticmethod
+    def _fg_color_of(widget):
+        """!
+        @brief Couleur de fond effective d'un widget (en remontant les parents transparents).
+        """
+        while widget is not None:
+            color = widget.cget("fg_color") if isinstance(widget, ctk.CTkFrame) else None
+            if color not in (None, "transparent"):
+                return color
+            widget = widget.master
+        return ctk.ThemeManager.theme["CTkFrame"]["fg_color"]
+
+    def _px(self, value):
+        """!
+        @brief Convertit une dimension CustomTkinter en pixels Canvas (mise à l'échelle de l'écran).
+        """
+        return round(self._apply_widget_scaling(value))
+
+    def set_players(self, players):
+        """!
+        @brief Aligne la table sur la liste des joueurs.
+        @param players Tuple des noms de joueurs, dans l'ordre de vote.
+        @return True si les slots ont été redessinés.
+        @note Sans changement de liste, rien n'est redessiné.
+        """
+        players = tuple(players)
+        if players == self.players:
+            return False
+        self.players = players
+        self._index = {name: i for i, name in enumerate(players)}
+        self._redraw()
+        return True
+
+    def _cell(self):
+        """!
+        @brief Taille (largeur, hauteur) en pixels d'une cellule, espacements compris.
+        """
+        width = self._px(max(self._slot_width, self._card_size[0]) + SLOT_GAP)
+        height = self._px(SLOT_NAME_HEIGHT + self._card_size[1] + SLOT_CAPTION_HEIGHT + ROW_GAP)
+        return width, height
+
+    def _redraw(self):
+        """!
+        @brief Recrée tous les éléments Canvas des slots (changement de joueurs ou de nombre de colonnes).
+        @note Les états, ou les cartes révélées, sont réappliqués aux nouveaux éléments.
+        """
+        canvas = self.canvas
+        canvas.delete("slot")
+        cell_w, cell_h = self._cell()
+        width = max(canvas.winfo_width(), cell_w)
+        positions, self._columns, total_height = wrap_positions(len(self.players), width, cell_w, cell_h)
+
+        box_w, box_h = self._px(self._card_size[0]), self._px(self._card_size[1])
+        name_h = self._px(SLOT_NAME_HEIGHT)
+        text_color = self._apply_appearance_mode(ctk.ThemeManager.theme["CTkLabel"]["text_color"])
+        box_color = self._apply_appearance_mode(("gray90", "gray25"))
+        for i, (name, (x, y)) in enumerate(zip(self.players, positions)):
+            tag = f"slot{i}"
+            cx = x + cell_w / 2
+            canvas.create_text(cx, y + name_h / 2, text=name, fill="gray", width=cell_w,
+                               font=("Arial", self._px(14), "bold"), tags=("slot", tag, f"{tag}.name"))
+            left, top = cx - box_w / 2, y + name_h
+            canvas.create_rectangle(left, top, left + box_w, top + box_h, fill=box_color, width=0,
+                                    outline=self._accent_color, tags=("slot", tag, f"{tag}.box"))
+            canvas.create_text(cx, top + box_h / 2, text="", fill=text_color,
+                               font=("Arial", self._px(40)), tags=("slot", tag, f"{tag}.icon"))
+            canvas.create_image(cx, top + box_h / 2, state="hidden", tags=("slot", tag, f"{tag}.card"))
+            canvas.create_text(cx, top + box_h + self._px(SLOT_CAPTION_HEIGHT) / 2, text="", fill=text_color,
+                               font=("Arial", self._px(12)), tags=("slot", tag, f"{tag}.caption"))
+
+        canvas.configure(scrollregion=(0, 0, width, total_height))
+        if self._revealed:
+            self.reveal(self._last_votes)
+            return
+        previous = self.states
+        self.states = [None] * len(self.players)
+        for i, state in enumerate(previous[:len(self.players)]):
+            if state is not None:
+                self._apply_state(i, *state)
+
+    def set_state(self, name, voted, active):
+        """!
+        @brief Met à jour le statut d'un joueur (Attente / Réfléchit / A voté).
+        @param name Nom du joueur.
+        @param voted True si le joueur a voté pendant ce tour.
+        @param active True si c'est au joueur de voter.
+        @return True si l'affichage a été modifié.
+        """
+        index = self._index.get(name)
+        if index is None:
+            return False
+        if self.states[index] == (voted, active):
+            return False
+        self._apply_state(index, voted, active)
+        return True
+
+    def _apply_state(self, index, voted, active):
+        """!
+        @brief Reconfigure les éléments d'un slot pour un statut donné.
+        """
+        canvas, tag = self.canvas, f"slot{index}"
+        text_color = self._apply_appearance_mode(ctk.ThemeManager.theme["CTkLabel"]["text_color"])
+        key = "voted" if voted else ("active" if active else "waiting")
+        icon, icon_color, caption, caption_color = self._styles[key]
+
+        canvas.itemconfigure(f"{tag}.name", fill=self._accent_color if active else "gray")
+        canvas.itemconfigure(f"{tag}.box", width=self._px(2) if active else 0)
+        canvas.itemconfigure(f"{tag}.icon", text=icon, fill=self._apply_appearance_mode(icon_color or text_color))
+        canvas.itemconfigure(f"{tag}.caption", text=caption,
+                             fill=self._apply_appearance_mode(caption_color or text_color))
+        self.states[index] = (voted, active)
+
+    def reveal(self, votes):
+        """!
+        @brief Révèle la carte de chaque joueur à la place de sa zone de statut.
+        @param votes Dictionnaire {nom: valeur} ; les joueurs sans vote gardent leur slot vide.
+        @note Les cartes sont converties une seule fois par valeur en image Tk.
+        """
+        canvas = self.canvas
+        card_px = (self._px(self._card_size[0]), self._px(self._card_size[1]))
+        for i, name in enumerate(self.players):
+            tag = f"slot{i}"
+            value = votes.get(name)
+            photo = self._photo(value, card_px) if value is not None else None
+            canvas.itemconfigure(f"{tag}.name", fill=self._apply_appearance_mode(
+                ctk.ThemeManager.theme["CTkLabel"]["text_color"]))
+            canvas.itemconfigure(f"{tag}.box", width=0, fill="white")
+            canvas.itemconfigure(f"{tag}.caption", text="")
+            if photo is not None:
+                canvas.itemconfigure(f"{tag}.card", image=photo, state="normal")
+                canvas.itemconfigure(f"{tag}.icon", text="")
+            else:
+                canvas.itemconfigure(f"{tag}.icon", text="" if value is None else str(value), fill="black")
+        self.states = [None] * len(self.players)
+        self._revealed = True
+        self._last_votes = dict(votes)
+
+    def hide_cards(self):
+        """!
+        @brief Masque les cartes révélées (nouveau tour) et remet les zones de statut.
+        @return True si des cartes étaient révélées ; les statuts doivent alors être réappliqués par set_state().
+        """
+        if not self._revealed:
+            return False
+        box_color = self._apply_appearance_mode(("gray90", "gray25"))
+        for i in range(len(self.players)):
+            self.canvas.itemconfigure(f"slot{i}.box", fill=box_color)
+            self.canvas.itemconfigure(f"slot{i}.card", state="hidden")
+        self._revealed = False
+        return True
+
+    def _photo(self, value, size_px):
+        """!
+        @brief Image Tk d'une carte, créée une seule fois par valeur et par taille.
+        @param value Valeur de la carte.
+        @param size_px Tuple (largeur, hauteur) en pixels.
+        @return L'image Tk, ou None si la carte n'a pas d'image.
+        """
+        key = (value, size_px)
+        if key not in self._photos:
+            image = self._image_for(value, size_px)
+            if image is not None:
+                from PIL import ImageTk
+                image = image.copy()  # l'image source est partagée par le cache
+                image.thumbnail(size_px)
+                image = ImageTk.PhotoImage(image, master=self.canvas)
+            self._photos[key] = image
+        return self._photos[key]
+
+    def _on_resize(self, event):
+        """!
+        @brief Redispose les slots quand le nombre de colonnes tenant dans la largeur change.
+        """
+        cell_w, _ = self._cell()
+        columns = max(1, min(len(self.players), int(event.width // cell_w)))
+        if columns != self._columns:
+            self._redraw()
+
+    def _set_scaling(self, new_widget_scaling, new_window_scaling):
+        """!
+        @brief Redessine la table après un changement de mise à l'échelle (écran HiDPI, zoom).
+        """
+        super()._set_scaling(new_widget_scaling, new_window_scaling)
+        self._photos.clear()
+        self._redraw()
+
+    def _set_appearance_mode(self, mode_string):
+        """!
+        @brief Redessine la table après un changement de thème clair/sombre.
+        """
+        super()._set_appearance_mode(mode_string)
+        self.canvas.configure(bg=self._apply_appearance_mode(self._fg_color_of(self.master)))
+        self._redraw()
+
+    def _on_wheel(self, event):
+        """!
+        @brief Défilement à la molette (Windows/macOS : delta, X11 : boutons 4 et 5).
+        """
+        if getattr(event, "num", None) == 4 or event.delta > 0:
+            self.canvas.yview_scroll(-1, "units")
+        else:
+            self.canvas.yview_scroll(1, "units")
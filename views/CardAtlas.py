@@ -0,0 +1,201 @@
+import hashlib
+import io
+import math
+import re
+import threading
+
+from views.CardRasterCache import ASSETS_DIR, DEFAULT_SCALE, shared_cache, svg_path
+
+## Espace (unités SVG) laissé entre deux cartes pour éviter les débordements au recadrage.
+ATLAS_GUTTER = 2.0
+
+_ROOT_TAG = re.compile(r"<svg\b[^>]*>", re.S)
+_SIZE_ATTR = re.compile(r'\s(?:width|height|x|y)="[^"]*"')
+_VIEWBOX = re.compile(r'viewBox="\s*([-\d.]+)[\s,]+([-\d.]+)[\s,]+([-\d.]+)[\s,]+([-\d.]+)\s*"')
+_PROLOG = re.compile(r"<\?xml.*?\?>|<!--.*?-->|<!DOCTYPE.*?>", re.S)
+
+
+def _card_size(svg_text):
+    """!
+    @brief Lit la taille (viewBox) d'un SVG de carte.
+    @param svg_text Contenu du fichier SVG.
+    @return Tuple (largeur, hauteur) en unités SVG.
+    @raises ValueError Si la racine <svg> ou son viewBox est introuvable.
+    """
+    root = _ROOT_TAG.search(_PROLOG.sub("", svg_text))
+    viewbox = _VIEWBOX.search(root.group(0)) if root else None
+    if viewbox is None:
+        raise ValueError("SVG de carte sans viewBox")
+    return float(viewbox.group(3)), float(viewbox.group(4))
+
+
+def _embed_card(svg_text, prefix, x, y):
+    """!
+    @brief Transforme le SVG d'une carte en élément <svg> imbriqué positionné dans l'atlas.
+    @param svg_text Contenu du fichier cartes_<value>.svg.
+    @param prefix Préfixe ajouté aux identifiants pour éviter les collisions entre cartes.
+    @param x Abscisse de la carte dans l'atlas (unités SVG).
+    @param y Ordonnée de la carte dans l'atlas (unités SVG).
+    @return Le fragment SVG.
+    @raises ValueError Si la racine <svg> ou son viewBox est introuvable.
+    """
+    width, height = _card_size(svg_text)
+    svg_text = _PROLOG.sub("", svg_text)
+    svg_text = re.sub(r'\bid="([^"]+)"', rf'id="{prefix}\1"', svg_text)
+    svg_text = re.sub(r"url\(#([^)]+)\)", rf"url(#{prefix}\1)", svg_text)
+    svg_text = re.sub(r'href="#([^"]+)"', rf'href="#{prefix}\1"', svg_text)
+
+    root = _ROOT_TAG.search(svg_text)
+    tag = _SIZE_ATTR.sub("", root.group(0))
+    tag = tag[:-1].rstrip("/ \n") + f' x="{x:g}" y="{y:g}" width="{width:g}" height="{height:g}">'
+    return svg_text[:root.start()] + tag + svg_text[root.end():]
+
+
+def build_atlas_svg(values, assets_dir=ASSETS_DIR, columns=6):
+    """!
+    @brief Compose les SVG des cartes en une seule planche SVG (grille régulière).
+    @param values Valeurs des cartes, dans l'ordre de placement.
+    @param assets_dir Dossier des SVG sources.
+    @param columns Nombre de cartes par ligne.
+    @return Tuple (document SVG, layout) où layout associe chaque valeur à son
+            rectangle (x, y, largeur, hauteur) en unités SVG.
+    @raises OSError Si un SVG est introuvable.
+    @note Les identifiants de chaque carte sont préfixés pour que les références
+          url(#...) restent propres à leur carte.
+    """
+    sources = []
+    for value in values:
+        with open(svg_path(value, assets_dir), encoding="utf-8") as f:
+            sources.append(f.read())
+
+    # La grille est calée sur la première carte ; toutes partagent le même format.
+    cell_w, cell_h = _card_size(sources[0]) if sources else (0.0, 0.0)
+    fragments = []
+    layout = {}
+    for i, (value, svg_text) in enumerate(zip(values, sources)):
+        x = (i % columns) * (cell_w + ATLAS_GUTTER)
+        y = (i // columns) * (cell_h + ATLAS_GUTTER)
+        fragments.append(_embed_card(svg_text, f"c{i}-", x, y))
+        layout[value] = (x, y) + _card_size(svg_text)
+
+    rows = max(1, math.ceil(len(values) / columns))
+    total_w = min(columns, len(values)) * (cell_w + ATLAS_GUTTER) - ATLAS_GUTTER
+    total_h = rows * (cell_h + ATLAS_GUTTER) - ATLAS_GUTTER
+    document = (f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+                f'width="{total_w:g}" height="{total_h:g}" viewBox="0 0 {total_w:g} {total_h:g}">\n'
+                + "\n".join(fragments) + "\n</svg>\n")
+    return document, layout
+
+
+class CardAtlas:
+    """!
+    @brief Planche unique (sprite sheet) contenant toutes les cartes du deck.
+    @details Les SVG individuels sont composés en une seule planche, rastérisée une seule fois
+             par échelle à la résolution de la plus grande taille demandée, puis mise en cache
+             disque via CardRasterCache. Chaque carte est ensuite servie par recadrage (et
+             réduction pour les tailles plus petites) : CARD_SIZE_DECK et CARD_SIZE_TABLE
+             proviennent de la même planche.
+    @attributes
+        sizes Tailles d'affichage (largeur, hauteur) servies par l'atlas.
+        values Valeurs des cartes présentes sur la planche.
+        layout Rectangles des cartes en unités SVG.
+        raster_cache Cache disque utilisé pour la planche.
+    """
+
+    def __init__(self, sizes, raster_cache=None, columns=6):
+        """!
+        @brief Compose la planche SVG (sans la rastériser).
+        @param sizes Tailles d'affichage à servir.
+        @param raster_cache Instance de CardRasterCache (par défaut le cache partagé).
+        @param columns Nombre de cartes par ligne.
+        @example
+            atlas = CardAtlas([CARD_SIZE_DECK, CARD_SIZE_TABLE])
+            image = atlas.card("13", CARD_SIZE_TABLE)
+        """
+        self.sizes = tuple(sizes)
+        self.raster_cache = raster_cache or shared_cache()
+        self.values = self.raster_cache.values()
+        self.document, self.layout = build_atlas_svg(self.values, self.raster_cache.assets_dir, columns)
+        self.digest = hashlib.sha256(self.document.encode("utf-8")).hexdigest()
+        self._reference_height = max(size[1] for size in self.sizes)
+        self._total_height = float(_VIEWBOX.search(self.document).group(4))
+        self._sheets = {}
+        self._lock = threading.Lock()
+
+    def _units_to_px(self, scale):
+        """!
+        @brief Facteur de conversion unités SVG -> pixels de la planche à une échelle donnée.
+        @note Calculé à partir de la hauteur entière de la planche, comme le fait le rastériseur.
+        """
+        return self._sheet_height(scale) / self._total_height
+
+    def _sheet_height(self, scale):
+        """!
+        @brief Hauteur en pixels de la planche rastérisée à une échelle donnée.
+        """
+        card_h = next(iter(self.layout.values()))[3]
+        return round(self._total_height * self._reference_height * scale / card_h)
+
+    def manifest(self, scale=DEFAULT_SCALE):
+        """!
+        @brief Rectangles des cartes dans la planche rastérisée.
+        @param scale Facteur de rastérisation.
+        @return Dictionnaire {valeur: (x, y, largeur, hauteur)} en pixels.
+        """
+        k = self._units_to_px(scale)
+        rects = {}
+        for value, (x, y, w, h) in self.layout.items():
+            # Arrondi par défaut des deux bords : le rectangle ne déborde jamais de la planche.
+            left, top = math.floor(x * k), math.floor(y * k)
+            rects[value] = (left, top, math.floor((x + w) * k) - left, math.floor((y + h) * k) - top)
+        return rects
+
+    def sheet(self, scale=DEFAULT_SCALE):
+        """!
+        @brief Retourne la planche rastérisée pour une échelle (une seule rastérisation par échelle).
+        @param scale Facteur de rastérisation.
+        @return L'image PIL de la planche.
+        @note PIL n'est importé qu'au premier besoin, pas au chargement du module.
+        """
+        with self._lock:
+            image = self._sheets.get(scale)
+            if image is None:
+                png = self.raster_cache.render_png(f"atlas{self._reference_height}", self.digest,
+                                                   self.document.encode("utf-8"), self._sheet_height(scale), scale)
+                from PIL import Image
+                image = Image.open(io.BytesIO(png))
+                image.load()
+                self._sheets[scale] = image
+            return image
+
+    def card(self, value, size, scale=DEFAULT_SCALE):
+        """!
+        @brief Découpe une carte dans la planche.
+        @param value Valeur de la carte.
+        @param size Tuple (largeur, hauteur) d'affichage.
+        @param scale Facteur de rastérisation.
+        @return Image PIL de hauteur size[1] * scale, au ratio du SVG.
+        @raises KeyError Si la valeur n'existe pas sur la planche.
+        """
+        from PIL import Image
+        x, y, w, h = self.manifest(scale)[value]
+        image = self.sheet(scale).crop((x, y, x + w, y + h))
+        target_h = round(size[1] * scale)
+        if target_h != h:
+            image = image.resize((round(w * target_h / h), target_h), Image.LANCZOS)
+        return image
+
+
+_shared_atlas = None
+
+
+def shared_atlas(sizes):
+    """!
+    @brief Retourne l'atlas partagé, créé au premier appel pour les tailles données.
+    @param sizes Tailles d'affichage à servir.
+    @return Le CardAtlas du processus.
+    """
+    global _shared_atlas
+    if _shared_atlas is None:
+        _shared_atlas = CardAtlas(sizes)
+    return _shared_atlas
@@ -0,0 +1,211 @@
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
+
+from views.CardRasterCache import DEFAULT_SCALE, rasterize_svg, shared_cache, svg_path
+
+
+class CardPrewarmer:
+    """!
+    @brief Préchauffage des cartes : rastérise tous les src/img/cartes_*.svg dans un pool de processus.
+    @details cairosvg est lié au CPU et garde le GIL : les rastérisations manquantes sont réparties
+             entre plusieurs processus, les PNG déjà présents dans le cache disque sont relus sans
+             calcul. Chaque PNG terminé est enregistré dans le CardRasterCache puis transmis au
+             thread Tk via after(), au fur et à mesure. Si le pool ne peut pas démarrer (plateforme,
+             fonction non transmissible, processus tué...), le reste est rastérisé dans le thread
+             de coordination. Une fois toutes les cartes prêtes, les PNG d'assets modifiés ou
+             disparus sont purgés du cache disque.
+    @attributes
+        sizes Tailles d'affichage (largeur, hauteur) à préparer.
+        scale Facteur de rastérisation.
+        raster_cache Cache disque où sont enregistrés les PNG.
+        workers Nombre de processus de travail (1 : pas de pool).
+        mode "pool" ou "serial" selon le chemin effectivement utilisé, None avant la fin.
+        delivered Nombre de cartes transmises.
+    """
+
+    def __init__(self, sizes, scale=DEFAULT_SCALE, raster_cache=None, workers=None, rasterize=rasterize_svg,
+                 root=None, poll_ms=30):
+        """!
+        @brief Prépare le préchauffage sans démarrer de thread.
+        @param sizes Tailles d'affichage à préparer.
+        @param scale Facteur de rastérisation.
+        @param raster_cache Instance de CardRasterCache (par défaut le cache partagé).
+        @param workers Nombre de processus (par défaut le nombre de cœurs).
+        @param rasterize Fonction de module rasterize(svg_data, output_height) -> PNG, exécutée dans les processus.
+        @param root Widget Tk utilisé pour after() ; sans root, les cartes sont transmises par flush().
+        @param poll_ms Période de relève des cartes terminées côté Tk.
+        @example
+            prewarmer = CardPrewarmer(CARD_SIZES, scale, root=main_window)
+            prewarmer.start(lambda value, size, png: print(value, size, len(png)))
+        """
+        self.sizes = tuple(sizes)
+        self.scale = scale
+        self.raster_cache = raster_cache or shared_cache()
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.rasterize = rasterize
+        self.root = root
+        self.poll_ms = poll_ms
+        self.mode = None
+        self.delivered = 0
+
+        self._on_card = None
+        self._done = queue.Queue()
+        self._thread = None
+        self._digests = set()
+
+    def start(self, on_card=None):
+        """!
+        @brief Lance le préchauffage dans un thread de coordination.
+        @param on_card Callback optionnel on_card(valeur, taille, png) appelé sur le thread Tk pour chaque carte.
+        @return self, pour chaîner.
+        """
+        if self._thread is not None:
+            return self
+        self._on_card = on_card
+        self._thread = threading.Thread(target=self._run, name="CardPrewarm", daemon=True)
+        self._thread.start()
+        if self.root is not None:
+            self.root.after(self.poll_ms, self._poll)
+        return self
+
+    @property
+    def running(self):
+        """!
+        @brief Indique si le thread de coordination rastérise encore des cartes.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def jobs(self):
+        """!
+        @brief Liste les cartes à préparer et relit celles déjà présentes sur le disque.
+        @return Tuple (prêtes, à rastériser) : prêtes est une liste de (valeur, taille, png),
+                à rastériser une liste de (valeur, taille, chemin, svg_data, hauteur de sortie).
+        """
+        cache = self.raster_cache
+        ready, missing = [], []
+        for value in cache.values():
+            with open(svg_path(value, cache.assets_dir), "rb") as f:
+                svg_data = f.read()
+            digest = cache.asset_hash(value)
+            self._digests.add(digest[:16])
+            for size in self.sizes:
+                output_height = round(size[1] * self.scale)
+                path = cache.png_path(value, digest, output_height, self.scale, label=f"{size[0]}x{size[1]}")
+                data = cache.load_png(path)
+                if data is not None:
+                    ready.append((value, size, data))
+                else:
+                    missing.append((value, size, path, svg_data, output_height))
+        return ready, missing
+
+    def _run(self):
+        """!
+        @brief Boucle du thread de coordination.
+        """
+        try:
+            ready, missing = self.jobs()
+        except OSError as e:
+            print(f"Préchauffage des cartes interrompu : {e}")
+            self._done.put(None)
+            return
+
+        for card in ready:
+            self._done.put(card)
+
+        remaining = list(missing)
+        self.mode = "serial"
+        if self.workers > 1 and len(remaining) > 1:
+            try:
+                remaining = self._run_pool(remaining)
+                self.mode = "pool"
+            except (OSError, NotImplementedError, BrokenProcessPool, PicklingError, AttributeError) as e:
+                print(f"Pool de rastérisation indisponible, repli sur un seul processus : {e}")
+                remaining = [job for job in remaining if job is not None]
+
+        for job in remaining:
+            self._finish(job, lambda: self.rasterize(job[3], job[4]))
+        try:
+            # Les PNG qui viennent d'être écrits sont conservés même si un asset a changé entre-temps.
+            self.raster_cache.prune(keep=self._digests)
+        except OSError as e:
+            print(f"Purge du cache de cartes impossible : {e}")
+        self._done.put(None)
+
+    def _run_pool(self, jobs):
+        """!
+        @brief Répartit les rastérisations entre les processus et transmet chaque PNG dès qu'il est prêt.
+        @param jobs Cartes à rastériser ; les entrées terminées y sont remplacées par None.
+        @return Liste vide (tout a été traité).
+        @raises BrokenProcessPool Si un processus meurt ; les cartes non terminées restent dans jobs.
+        @note Le contexte "spawn" évite de dupliquer un processus qui détient la connexion Tk.
+        """
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs)), mp_context=context) as pool:
+            futures = {pool.submit(self.rasterize, job[3], job[4]): i for i, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                i = futures[future]
+                if isinstance(future.exception(), (BrokenProcessPool, PicklingError, AttributeError)):
+                    raise future.exception()
+                self._finish(jobs[i], future.result)
+                jobs[i] = None
+        return []
+
+    def _finish(self, job, produce):
+        """!
+        @brief Enregistre un PNG rastérisé et le place dans la file de transmission.
+        @param job Tuple (valeur, taille, chemin, svg_data, hauteur de sortie).
+        @param produce Fonction sans argument retournant les octets PNG (ou levant l'erreur de rastérisation).
+        @note Une carte en erreur est journalisée et ignorée : elle sera rastérisée au premier affichage.
+        """
+        value, size, path = job[:3]
+        try:
+            data = produce()
+        except Exception as e:
+            print(f"Rastérisation de cartes_{value}.svg ignorée : {e}")
+            return
+        self.raster_cache.rasterizations += 1
+        self.raster_cache.save_png(path, data)
+        self._done.put((value, size, data))
+
+    def _poll(self):
+        """!
+        @brief Transmet les cartes terminées sur le thread Tk, puis se reprogramme tant que le préchauffage tourne.
+        """
+        if not self._drain():
+            self.root.after(self.poll_ms, self._poll)
+
+    def _drain(self):
+        """!
+        @brief Transmet les cartes en attente dans le thread appelant.
+        @return True si le préchauffage est terminé.
+        """
+        while True:
+            try:
+                card = self._done.get_nowait()
+            except queue.Empty:
+                return False
+            if card is None:
+                return True
+            self.delivered += 1
+            if self._on_card is not None:
+                self._on_card(*card)
+
+    def flush(self, timeout=None):
+        """!
+        @brief Attend la fin du préchauffage et transmet les cartes restantes.
+        @param timeout Délai maximal (secondes), None pour attendre indéfiniment.
+        @return True si le préchauffage est terminé.
+        @note Utilisé sans affichage (tests, benchmarks).
+        """
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        finished = not self._thread.is_alive()
+        if finished:
+            self._drain()
+        return finished
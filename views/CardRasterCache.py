@@ -0,0 +1,256 @@
+import glob
+import hashlib
+import os
+import sys
+import threading
+
+from models.SessionJournal import APP_DIR_NAME
+
+## Dossier des cartes SVG livrées avec l'application.
+ASSETS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "img"))
+
+## Échelle de rastérisation historique (output_height = hauteur * 2).
+DEFAULT_SCALE = 2
+
+
+def user_cache_dir():
+    """!
+    @brief Retourne le dossier de cache de l'utilisateur pour l'application.
+    @return Chemin absolu (%LOCALAPPDATA% sous Windows, ~/Library/Caches sous macOS,
+            $XDG_CACHE_HOME ou ~/.cache ailleurs).
+    """
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, APP_DIR_NAME, "cards")
+
+
+def svg_path(value, assets_dir=ASSETS_DIR):
+    """!
+    @brief Chemin du fichier SVG d'une carte.
+    @param value Valeur de la carte (ex: '20', 'cafe').
+    @param assets_dir Dossier des assets.
+    @return Le chemin absolu de cartes_<value>.svg.
+    """
+    return os.path.join(assets_dir, f"cartes_{value}.svg")
+
+
+def rasterize_svg(svg_data, output_height):
+    """!
+    @brief Convertit un SVG en PNG avec cairosvg.
+    @param svg_data Contenu du fichier SVG.
+    @param output_height Hauteur de sortie en pixels.
+    @return Les octets PNG.
+    @note Fonction de module (donc transmissible à un processus de travail) ; cairosvg n'est
+          importé qu'au premier besoin : un cache chaud ne charge jamais cairo.
+    """
+    import cairosvg
+    return cairosvg.svg2png(bytestring=svg_data, output_height=output_height)
+
+
+class CardRasterCache:
+    """!
+    @brief Cache PNG persistant des cartes rastérisées.
+    @details Chaque PNG est stocké dans le dossier de cache utilisateur sous une clé composée
+             du hash SHA-256 du SVG source, de la taille de sortie et de l'échelle. Modifier un
+             asset sous src/img/ change son hash : l'ancienne entrée n'est plus jamais lue et
+             prune() la supprime. Au second lancement, aucune rastérisation n'est nécessaire.
+    @attributes
+        cache_dir Dossier où sont stockés les PNG.
+        assets_dir Dossier des SVG sources.
+        rasterizations Nombre d'appels à cairosvg effectués par ce processus.
+        disk_hits Nombre de PNG relus depuis le disque.
+    """
+
+    def __init__(self, cache_dir=None, assets_dir=ASSETS_DIR):
+        """!
+        @brief Prépare le cache sans toucher au disque.
+        @param cache_dir Dossier de cache (par défaut user_cache_dir()).
+        @param assets_dir Dossier des SVG sources.
+        """
+        self.cache_dir = cache_dir or user_cache_dir()
+        self.assets_dir = assets_dir
+        self.rasterizations = 0
+        self.disk_hits = 0
+        self._hashes = {}
+        self._lock = threading.Lock()
+
+    def values(self):
+        """!
+        @brief Liste les valeurs de cartes disponibles dans le dossier d'assets.
+        @return Liste des valeurs (ex: ['0', '1', ..., 'cafe', 'interro']).
+        """
+        prefix = "cartes_"
+        return sorted(os.path.basename(p)[len(prefix):-len(".svg")]
+                      for p in glob.glob(os.path.join(self.assets_dir, prefix + "*.svg")))
+
+    def asset_hash(self, value):
+        """!
+        @brief Hash SHA-256 du SVG d'une carte, recalculé seulement si le fichier a changé.
+        @param value Valeur de la carte.
+        @return Le hash hexadécimal.
+        @raises OSError Si le SVG est introuvable.
+        """
+        path = svg_path(value, self.assets_dir)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._hashes.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        with self._lock:
+            self._hashes[path] = (stamp, digest)
+        return digest
+
+    def png_bytes(self, value, size, scale=DEFAULT_SCALE):
+        """!
+        @brief Retourne le PNG d'une carte, depuis le disque ou en le rastérisant.
+        @param value Valeur de la carte.
+        @param size Tuple (largeur, hauteur) d'affichage.
+        @param scale Facteur de rastérisation.
+        @return Les octets PNG.
+        @raises OSError Si le SVG est introuvable.
+        @note Une erreur d'écriture du cache n'empêche pas de retourner l'image.
+        """
+        with open(svg_path(value, self.assets_dir), "rb") as f:
+            svg_data = f.read()
+        return self.render_png(value, self.asset_hash(value), svg_data, round(size[1] * scale), scale,
+                               label=f"{size[0]}x{size[1]}")
+
+    def cached_png(self, value, size, scale=DEFAULT_SCALE):
+        """!
+        @brief Relit le PNG d'une carte depuis le disque, sans jamais rastériser.
+        @param value Valeur de la carte.
+        @param size Tuple (largeur, hauteur) d'affichage.
+        @param scale Facteur de rastérisation.
+        @return Les octets PNG, ou None si la carte n'est pas encore en cache.
+        @raises OSError Si le SVG est introuvable.
+        """
+        path = self.png_path(value, self.asset_hash(value), round(size[1] * scale), scale,
+                             label=f"{size[0]}x{size[1]}")
+        return self.load_png(path)
+
+    def render_png(self, name, digest, svg_data, output_height, scale=DEFAULT_SCALE, label=None):
+        """!
+        @brief Retourne le PNG d'un document SVG quelconque, depuis le disque ou en le rastérisant.
+        @param name Préfixe du fichier en cache (valeur de carte, "atlas..."...).
+        @param digest Hash SHA-256 hexadécimal du document source.
+        @param svg_data Contenu SVG (octets), rastérisé seulement en cas d'absence sur le disque.
+        @param output_height Hauteur de sortie en pixels.
+        @param scale Facteur de rastérisation, inclus dans la clé.
+        @param label Taille d'affichage incluse dans la clé (par défaut la hauteur de sortie).
+        @return Les octets PNG.
+        @note Une erreur d'écriture du cache n'empêche pas de retourner l'image.
+        """
+        path = self.png_path(name, digest, output_height, scale, label)
+        data = self.load_png(path)
+        if data is not None:
+            return data
+
+        data = self._rasterize(svg_data, output_height)
+        self.rasterizations += 1
+        self.save_png(path, data)
+        return data
+
+    def png_path(self, name, digest, output_height, scale=DEFAULT_SCALE, label=None):
+        """!
+        @brief Chemin du PNG en cache pour un document SVG.
+        @param name Préfixe du fichier (valeur de carte, "atlas..."...).
+        @param digest Hash SHA-256 hexadécimal du document source.
+        @param output_height Hauteur de sortie en pixels.
+        @param scale Facteur de rastérisation.
+        @param label Taille d'affichage (par défaut la hauteur de sortie).
+        @return Le chemin absolu du fichier.
+        """
+        label = label or f"h{output_height}"
+        return os.path.join(self.cache_dir, f"{name}-{label}@{scale:g}-{digest[:16]}.png")
+
+    def load_png(self, path):
+        """!
+        @brief Relit un PNG depuis le cache disque.
+        @param path Chemin retourné par png_path().
+        @return Les octets PNG, ou None si l'entrée est absente.
+        """
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        self.disk_hits += 1
+        return data
+
+    def save_png(self, path, data):
+        """!
+        @brief Enregistre un PNG dans le cache disque.
+        @param path Chemin retourné par png_path().
+        @param data Octets PNG.
+        @note Une erreur d'écriture est journalisée sans être propagée.
+        """
+        try:
+            self._store(path, data)
+        except OSError as e:
+            print(f"Cache de cartes indisponible : {e}")
+
+    def _rasterize(self, svg_data, output_height):
+        """!
+        @brief Convertit un SVG en PNG avec cairosvg.
+        @param svg_data Contenu du fichier SVG.
+        @param output_height Hauteur de sortie en pixels.
+        @return Les octets PNG.
+        """
+        return rasterize_svg(svg_data, output_height)
+
+    def _store(self, path, data):
+        """!
+        @brief Écrit un PNG dans le cache de façon atomique.
+        @param path Chemin final.
+        @param data Octets PNG.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def prune(self, keep=()):
+        """!
+        @brief Supprime les PNG dont le SVG source a changé ou a disparu.
+        @param keep Préfixes de hash (16 caractères) à conserver en plus de ceux des cartes (ex: atlas).
+        @return Le nombre de fichiers supprimés.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        current = set(keep)
+        for value in self.values():
+            current.add(self.asset_hash(value)[:16])
+
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            stem, ext = os.path.splitext(name)
+            if ext == ".png" and stem.rsplit("-", 1)[-1] not in current:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+_shared_cache = None
+
+
+def shared_cache():
+    """!
+    @brief Retourne l'instance de cache partagée par toutes les vues.
+    @return Le CardRasterCache du processus.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = CardRasterCache()
+    return _shared_cache
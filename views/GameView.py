@@ -1,17 +1,25 @@
 import customtkinter as ctk
-from PIL import Image
-import io
-import os
-import cairosvg
+from views.ImageCache import shared_image_cache
+from views.PlayerSlot import PlayerSlot
+from views.CanvasTable import CanvasTable
+from views.Instrumentation import timed
 
 CARD_SIZE_DECK = (70, 105)   # Taille des cartes dans la main
 CARD_SIZE_TABLE = (80, 120)  # Taille des cartes révélées sur la table
+CARD_SIZES = (CARD_SIZE_DECK, CARD_SIZE_TABLE)  # Tailles servies par l'atlas de cartes
 PLAYER_SLOT_WIDTH = 120      # Largeur fixe pour aligner chaque joueur
+CANVAS_TABLE_MIN_PLAYERS = 16  # À partir de ce nombre de joueurs, la table est dessinée sur un Canvas
 THEME_COLOR_ACCENT = "#3B8ED0"
 THEME_COLOR_SUCCESS = "#2CC985"
 THEME_COLOR_WARNING = "#E5A00D"
 THEME_TABLE_BG = ("gray90", "gray13") # Fond de la table
 THEME_HEADER_BG = ("gray85", "gray17") # Fond du header
+GAME_REGIONS = ("header", "table", "deck")  # Régions repeintes indépendamment
+SLOT_STYLES = {  # Icône, couleur icône, légende, couleur légende de chaque statut de slot
+    "voted": ("✅", None, "A voté", THEME_COLOR_SUCCESS),
+    "active": ("🤔", None, "Réfléchit...", THEME_COLOR_WARNING),
+    "waiting": ("...", "gray", "Attente", "gray"),
+}
 
 class GameView(ctk.CTkFrame):
     """!
@@ -19,7 +27,10 @@ class GameView(ctk.CTkFrame):
     @details Affiche la table de jeu, les slots des joueurs, et la main (deck).
     @attributes
         controller Contrôleur de jeu associé.
-        _card_image_cache Cache des images de cartes CTkImage.
+        _image_cache Cache LRU des images de cartes, partagé entre les vues.
+        _slots Slots persistants de la phase de vote, indexés par nom de joueur.
+        _canvas_table Table dessinée sur un Canvas pour les grandes salles (créée au premier besoin).
+        _deck_buttons Boutons persistants de la main, dans l'ordre du deck.
     """
 
     def __init__(self, parent, controller):
@@ -73,6 +84,13 @@ class GameView(ctk.CTkFrame):
         self.players_container = ctk.CTkFrame(self.table_area, fg_color="transparent")
         self.players_container.grid(row=0, column=0, sticky="s")
 
+        # Slots persistants (phase de vote) et cartes révélées (phase de résultats)
+        self.voting_slots_frame = ctk.CTkFrame(self.players_container, fg_color="transparent")
+        self.result_slots_frame = ctk.CTkFrame(self.players_container, fg_color="transparent")
+        self._slots = {}
+        self._slot_order = ()
+        self._canvas_table = None
+
         # Conteneur pour le résultat central
         self.center_result_container = ctk.CTkFrame(self.table_area, fg_color="transparent")
         self.center_result_container.grid(row=1, column=0, sticky="n", pady=(20, 0))
@@ -88,107 +106,200 @@ class GameView(ctk.CTkFrame):
         self.deck_frame = ctk.CTkFrame(self.deck_container, fg_color="transparent")
         self.deck_frame.pack(expand=True)
 
-        # Cache pour conserver les images CTkImage et éviter la collecte du garbage collector
-        self._card_image_cache = {}
+        # Cache LRU partagé : conserve les CTkImage à l'échelle réelle de l'écran
+        self._image_cache = shared_image_cache()
+
+        # Boutons du deck, construits une fois par définition de deck
+        self._deck_buttons = []
+        self._deck_values = None
+        self._deck_enabled = None
+
+        # Joueurs à mettre à jour à la prochaine repeinte de la table (None : tous)
+        self._pending_players = set()
 
-    def refresh_ui(self):
+    @timed("GameView.refresh_ui")
+    def refresh_ui(self, changed_players=None):
         """!
-        @brief Met à jour l'ensemble de l'interface en fonction de l'état du contrôleur.
+        @brief Met à jour immédiatement l'ensemble de l'interface en fonction de l'état du contrôleur.
         @details Rafraîchit le header, la phase de jeu (vote ou résultat) et le deck.
+        @param changed_players Joueurs dont le statut a pu changer (None : tous les joueurs).
         @example
             game_view.refresh_ui()
+        @see schedule_refresh pour un rafraîchissement regroupé en fin de tour de boucle Tk.
+        """
+        self._paint(GAME_REGIONS, changed_players)
+
+    def schedule_refresh(self, regions=GAME_REGIONS, changed_players=None):
+        """!
+        @brief Demande la repeinte de régions lors du prochain passage idle de la boucle Tk.
+        @param regions Régions à repeindre parmi GAME_REGIONS.
+        @param changed_players Joueurs dont le slot a changé (None : tous les joueurs).
+        @note Plusieurs demandes dans le même tour de boucle ne produisent qu'une repeinte par région ;
+              sans RefreshScheduler sur la fenêtre parente, la repeinte est immédiate.
+        """
+        if "table" in regions:
+            if changed_players is None:
+                self._pending_players = None
+            elif self._pending_players is not None:
+                self._pending_players.update(changed_players)
+
+        scheduler = getattr(self.master, "scheduler", None)
+        if scheduler is None:
+            self.repaint(regions)
+        else:
+            scheduler.mark_dirty(self, *regions)
+
+    @timed("GameView.repaint")
+    def repaint(self, regions):
+        """!
+        @brief Repeint les régions demandées (appelé par le RefreshScheduler).
+        @param regions Ensemble de régions parmi GAME_REGIONS.
+        """
+        changed_players, self._pending_players = self._pending_players, set()
+        self._paint(regions, changed_players)
+
+    def _paint(self, regions, changed_players):
+        """!
+        @brief Repeint les régions de la vue.
+        @param regions Régions à repeindre ("header", "table", "deck").
+        @param changed_players Joueurs dont le slot a changé (None : tous les joueurs).
         """
         feature = self.controller.get_current_feature_name()
         if not feature: return
 
-        self.lbl_feature.configure(text=feature)
-        
-        round_num = self.controller.model.current_round_number
-        rule_text = "Unanimité requise" if round_num == 1 else self.controller.model.rules.selected_mode
-        self.lbl_round_num.configure(text=f"Tour {round_num}")
-        self.lbl_round_rule.configure(text=rule_text)
+        if "header" in regions:
+            self.lbl_feature.configure(text=feature)
 
-        current_player_name = self.controller.get_current_player_name()
+            round_num = self.controller.model.current_round_number
+            rule_text = "Unanimité requise" if round_num == 1 else self.controller.model.rules.selected_mode
+            self.lbl_round_num.configure(text=f"Tour {round_num}")
+            self.lbl_round_rule.configure(text=rule_text)
 
-        if self.controller.revealed:
-            self.lbl_instruction_bar.configure(text="RÉSULTATS DU VOTE", text_color=THEME_COLOR_ACCENT)
-            self._show_results_phase()
-        else:
-            self.lbl_instruction_bar.configure(text=f"C'EST À {current_player_name.upper()} DE VOTER", text_color=THEME_COLOR_WARNING)
-            self._show_voting_phase()
+            if self.controller.revealed:
+                self.lbl_instruction_bar.configure(text="RÉSULTATS DU VOTE", text_color=THEME_COLOR_ACCENT)
+            else:
+                current_player_name = self.controller.get_current_player_name()
+                text = (f"C'EST À {current_player_name.upper()} DE VOTER" if current_player_name
+                        else "EN ATTENTE DE LA RÉVÉLATION")
+                self.lbl_instruction_bar.configure(text=text, text_color=THEME_COLOR_WARNING)
+
+        if "table" in regions:
+            if self.controller.revealed:
+                self._show_results_phase()
+            else:
+                self._show_voting_phase(changed_players)
 
-    def _show_voting_phase(self):
+        if "deck" in regions:
+            self._build_deck(enabled=not self.controller.revealed)
+
+    @timed("GameView._show_voting_phase")
+    def _show_voting_phase(self, changed_players=None):
         """!
         @brief Affiche la phase de vote.
-        @details Dessine les slots joueurs avec leur statut (Attente / Réfléchit / A voté).
-        @note Les cartes du deck sont activées tant que les votes ne sont pas révélés.
+        @details Les slots joueurs sont persistants : seuls ceux dont le statut change
+                 (Attente / Réfléchit / A voté) sont reconfigurés.
+        @param changed_players Joueurs à mettre à jour (None : tous les joueurs, sans recréer de widget).
         """
-        for w in self.players_container.winfo_children(): w.destroy()
-        for w in self.center_result_container.winfo_children(): w.destroy()
+        if self.result_slots_frame.winfo_manager() or self.center_result_container.winfo_children():
+            self.result_slots_frame.pack_forget()
+            for w in self.result_slots_frame.winfo_children(): w.destroy()
+            for w in self.center_result_container.winfo_children(): w.destroy()
 
         votes = self.controller.get_votes()
         players = self.controller.model.get_player_names()
         current_voter = self.controller.get_current_player_name()
-        
-        for i, name in enumerate(players):
-            # Slot joueur
-            slot = ctk.CTkFrame(self.players_container, width=PLAYER_SLOT_WIDTH, fg_color="transparent")
+
+        table = self._table_for(players)
+        if table is not None:
+            if table.hide_cards() | table.set_players(players) or changed_players is None:
+                changed_players = players
+            for name in changed_players:
+                table.set_state(name, name in votes, name == current_voter)
+            return
+
+        if not self.voting_slots_frame.winfo_manager():
+            self.voting_slots_frame.pack()
+        if self._sync_slots(players) or changed_players is None:
+            changed_players = players
+
+        for name in changed_players:
+            slot = self._slots.get(name)
+            if slot is not None:
+                slot.set_state(name in votes, name == current_voter)
+
+    def _table_for(self, players):
+        """!
+        @brief Choisit le rendu de la table selon le nombre de joueurs.
+        @param players Tuple des noms de joueurs.
+        @return La CanvasTable (affichée) pour une grande salle, None pour la table en widgets.
+        @note En passant au Canvas, les slots en widgets sont détruits ; la table en widgets
+              est réaffichée dès que la salle repasse sous CANVAS_TABLE_MIN_PLAYERS.
+        """
+        table = self._canvas_table
+        if len(players) < CANVAS_TABLE_MIN_PLAYERS:
+            if table is not None and table.winfo_manager():
+                table.grid_remove()
+                self.players_container.grid()
+            return None
+
+        if table is None:
+            table = self._canvas_table = CanvasTable(self.table_area, PLAYER_SLOT_WIDTH, CARD_SIZE_TABLE,
+                                                     THEME_COLOR_ACCENT, SLOT_STYLES, self._get_card_pil_image)
+            table.grid(row=0, column=0, sticky="nsew")
+        elif not table.winfo_manager():
+            table.grid()
+
+        if self.players_container.winfo_manager():
+            self.players_container.grid_remove()
+            for slot in self._slots.values(): slot.destroy()
+            self._slots = {}
+            self._slot_order = ()
+        return table
+
+    def _sync_slots(self, players):
+        """!
+        @brief Aligne le pool de slots sur la liste des joueurs.
+        @param players Tuple des noms de joueurs, dans l'ordre de vote.
+        @return True si des slots ont été créés, supprimés ou réordonnés.
+        @note Les slots des joueurs conservés sont réutilisés tels quels.
+        """
+        if players == self._slot_order:
+            return False
+
+        for name in set(self._slots) - set(players):
+            self._slots.pop(name).destroy()
+        for slot in self._slots.values():
+            slot.pack_forget()
+
+        for name in players:
+            slot = self._slots.get(name)
+            if slot is None:
+                slot = self._slots[name] = PlayerSlot(self.voting_slots_frame, name, PLAYER_SLOT_WIDTH,
+                                                      CARD_SIZE_TABLE, THEME_COLOR_ACCENT, SLOT_STYLES)
             slot.pack(side="left", padx=10)
-            slot.grid_propagate(False)
-
-            # Nom du joueur
-            is_active = (name == current_voter)
-            name_color = THEME_COLOR_ACCENT if is_active else "gray"
-            ctk.CTkLabel(slot, text=name, font=("Arial", 14, "bold"), text_color=name_color).pack(pady=(0, 10))
-
-            # Zone de statut (Taille carte fixe)
-            border_width = 2 if is_active else 0
-            border_color = THEME_COLOR_ACCENT if is_active else None
-
-            status_box = ctk.CTkFrame(slot, width=CARD_SIZE_TABLE[0], height=CARD_SIZE_TABLE[1], 
-                                      fg_color=("gray90", "gray25"), corner_radius=8, 
-                                      border_width=border_width,
-                                      border_color=border_color)
-            status_box.pack()
-            status_box.pack_propagate(False)
-
-            if name in votes:
-                ctk.CTkLabel(status_box, text="✅", font=("Arial", 40)).pack(expand=True)
-                ctk.CTkLabel(slot, text="A voté", font=("Arial", 12), text_color=THEME_COLOR_SUCCESS).pack(pady=(5,0))
-            elif is_active:
-                ctk.CTkLabel(status_box, text="🤔", font=("Arial", 40)).pack(expand=True)
-                ctk.CTkLabel(slot, text="Réfléchit...", font=("Arial", 12), text_color=THEME_COLOR_WARNING).pack(pady=(5,0))
-            else:
-                ctk.CTkLabel(status_box, text="...", font=("Arial", 40), text_color="gray").pack(expand=True)
-                ctk.CTkLabel(slot, text="Attente", font=("Arial", 12), text_color="gray").pack(pady=(5,0))
 
-        self._build_deck(enabled=True)
+        self._slot_order = tuple(players)
+        return True
 
+    @timed("GameView._show_results_phase")
     def _show_results_phase(self):
         """!
         @brief Affiche la phase de résultats.
         @details Révèle les cartes des joueurs et affiche le panneau de résultat central.
         @note Peut déclencher une sauvegarde/retour accueil via le contrôleur si pause café.
         """
-        for w in self.players_container.winfo_children(): w.destroy()
+        self.voting_slots_frame.pack_forget()
+        for w in self.result_slots_frame.winfo_children(): w.destroy()
         for w in self.center_result_container.winfo_children(): w.destroy()
-        
-        votes = self.controller.get_votes()
-        
-        for i, (name, val) in enumerate(votes.items()):
-            slot = ctk.CTkFrame(self.players_container, width=PLAYER_SLOT_WIDTH, fg_color="transparent")
-            slot.pack(side="left", padx=10)
-
-            ctk.CTkLabel(slot, text=name, font=("Arial", 14, "bold")).pack(pady=(0, 10))
 
-            card_frame = ctk.CTkFrame(slot, fg_color="white", corner_radius=10)
-            card_frame.pack()
-
-            card_image = self._get_card_image(val, CARD_SIZE_TABLE)
-            card_text = "" if card_image else str(val)
-
-            ctk.CTkLabel(card_frame, text=card_text, image=card_image, width=CARD_SIZE_TABLE[0], height=CARD_SIZE_TABLE[1],
-                         fg_color="transparent", corner_radius=10).pack(padx=3, pady=3)
+        votes = self.controller.get_votes()
+        players = self.controller.model.get_player_names()
+        table = self._table_for(players)
+        if table is not None:
+            table.set_players(players)
+            table.reveal(votes)
+        else:
+            self._show_revealed_cards(votes)
 
         result = self.controller.handle_end_of_round()
         
@@ -226,39 +337,74 @@ class GameView(ctk.CTkFrame):
                                          fg_color=THEME_COLOR_SUCCESS, hover_color="#229A65",
                                          command=lambda: self.controller.validate_feature(result)).pack()
 
-        self._build_deck(enabled=False)
 
+    def _show_revealed_cards(self, votes):
+        """!
+        @brief Affiche la carte révélée de chaque joueur sous forme de widgets (petites salles).
+        @param votes Dictionnaire {nom: valeur} des votes du tour.
+        """
+        self.result_slots_frame.pack()
+
+        for name, val in votes.items():
+            slot = ctk.CTkFrame(self.result_slots_frame, width=PLAYER_SLOT_WIDTH, fg_color="transparent")
+            slot.pack(side="left", padx=10)
+
+            ctk.CTkLabel(slot, text=name, font=("Arial", 14, "bold")).pack(pady=(0, 10))
+
+            card_frame = ctk.CTkFrame(slot, fg_color="white", corner_radius=10)
+            card_frame.pack()
+
+            card_image = self._get_card_image(val, CARD_SIZE_TABLE)
+            card_text = "" if card_image else str(val)
+
+            ctk.CTkLabel(card_frame, text=card_text, image=card_image, width=CARD_SIZE_TABLE[0], height=CARD_SIZE_TABLE[1],
+                         fg_color="transparent", corner_radius=10).pack(padx=3, pady=3)
 
     def _build_deck(self, enabled):
         """!
-        @brief Construit le deck de cartes cliquables.
+        @brief Affiche le deck de cartes cliquables.
+        @details Les boutons sont créés une seule fois par définition de deck ; les rafraîchissements
+                 suivants ne modifient que leur état (actif/désactivé, couleurs, survol).
         @param enabled Indique si les cartes doivent être actives (cliquables).
-        @note Désactive les boutons quand les votes sont révélés.
+        @note Désactive les boutons quand les votes sont révélés. Le deck n'est reconstruit
+              que si GameController.deck change.
         """
-        for w in self.deck_frame.winfo_children(): w.destroy()
-
-        for val in self.controller.deck:
-            cmd = lambda v=val: self._on_vote(v) if enabled else None
-            btn = self._create_card_button(self.deck_frame, val, cmd, size=CARD_SIZE_DECK)
-            
+        deck = tuple(self.controller.deck)
+        if deck != self._deck_values:
+            for btn in self._deck_buttons: btn.destroy()
+            self._deck_buttons = []
+            for val in deck:
+                btn = self._create_card_button(self.deck_frame, val, lambda v=val: self._on_vote(v), size=CARD_SIZE_DECK)
+                btn.pack(side="left", padx=5)
+                self._deck_buttons.append(btn)
+            self._deck_values = deck
+            self._deck_enabled = None
+
+        if enabled == self._deck_enabled:
+            return
+
+        for btn in self._deck_buttons:
             if not enabled:
                 btn.configure(state="disabled", fg_color=("gray85", "gray25"))
             else:
-                btn.configure(hover_color=THEME_COLOR_ACCENT, border_color=THEME_COLOR_ACCENT)
-
-            btn.pack(side="left", padx=5)
+                btn.configure(state="normal", fg_color="white",
+                              hover_color=THEME_COLOR_ACCENT, border_color=THEME_COLOR_ACCENT)
+        self._deck_enabled = enabled
 
     def _on_vote(self, val):
         """!
         @brief Callback lors du clic sur une carte du deck.
         @param val La valeur de la carte.
         @note Marque la phase comme révélée quand tous les joueurs ont voté.
+              Seuls les slots du votant et du joueur suivant sont mis à jour.
         """
+        voter = self.controller.get_current_player_name()
         self.controller.cast_vote(val)
         if self.controller.is_round_finished():
-            self.controller.revealed = True
-        self.refresh_ui()
+            self.controller.reveal_votes()
+        self.schedule_refresh(changed_players=(voter, self.controller.get_current_player_name()))
 
+    @timed("GameView._get_card_image")
     def _get_card_image(self, value, size):
         """!
         @brief Charge et retourne l'image CTkImage d'une carte donnée.
@@ -266,26 +412,25 @@ class GameView(ctk.CTkFrame):
         @param size Tuple (largeur, hauteur).
         @return L'objet CTkImage correspondant.
         @note Retourne None si l'image SVG est introuvable ou invalide.
+        @see ImageCache.card (échelle de l'écran, éviction LRU, découpe dans l'atlas)
         """
-        cache_key = (value, size)
-        if cache_key in self._card_image_cache:
-            return self._card_image_cache[cache_key]
-
-        filename = f"cartes_{value}.svg"
-        image_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "img", filename))
-
         try:
-            with open(image_path, "rb") as f:
-                svg_data = f.read()
-            png_data = cairosvg.svg2png(bytestring=svg_data, output_height=size[1]*2)
-            pil_image = Image.open(io.BytesIO(png_data))
-            ctk_image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=size)
-            self._card_image_cache[cache_key] = ctk_image
-            return ctk_image
+            return self._image_cache.card(value, size, self)
         except Exception as e:
-            print(f"Erreur chargement image {filename}: {e}")
+            print(f"Erreur chargement image cartes_{value}.svg: {e}")
             return None
 
+    def _get_card_pil_image(self, value, size_px):
+        """!
+        @brief Image PIL d'une carte de la table, pour le rendu Canvas.
+        @param value Valeur de la carte.
+        @param size_px Tuple (largeur, hauteur) en pixels à l'écran.
+        @return L'image PIL partagée par le cache (à l'échelle de l'écran, donc au moins aussi
+                grande que size_px), ou None si l'image est introuvable.
+        """
+        ctk_image = self._get_card_image(value, CARD_SIZE_TABLE)
+        return ctk_image.cget("light_image") if ctk_image else None
+
     def _create_card_button(self, parent, value, command, size):
         """!
         @brief Crée un widget carte.
@@ -5,6 +5,7 @@ class HeaderView(ctk.CTkFrame):
     @brief Barre de navigation supérieure commune à l'application.
     @attributes
         controller Contrôleur principal permettant la navigation/fermeture.
+        overlay Panneau d'instrumentation, créé au premier clic sur "Stats".
     """
 
     def __init__(self, parent, controller):
@@ -12,22 +13,38 @@ class HeaderView(ctk.CTkFrame):
         @brief Initialise le Header.
         @param parent Widget parent.
         @param controller Contrôleur (MainController).
-        @note Affiche un titre et deux actions (Accueil / Quitter).
+        @note Affiche un titre, le bouton des mesures et deux actions (Accueil / Quitter).
         """
         super().__init__(parent)
         self.controller = controller
+        self.overlay = None
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=0)
         self.grid_columnconfigure(2, weight=0)
+        self.grid_columnconfigure(3, weight=0)
 
         ctk.CTkLabel(self, text="AMY LOREL — Planning Poker", font=("Arial", 16, "bold")).grid(row=0, column=0, sticky="w", padx=12, pady=8)
 
+        self.stats_btn = ctk.CTkButton(self, text="Stats", width=60, fg_color="transparent", border_width=1,
+                                       text_color=("gray10", "gray90"), command=self._on_stats)
+        self.stats_btn.grid(row=0, column=1, padx=6, pady=6)
+
         self.home_btn = ctk.CTkButton(self, text="Accueil", width=100, command=self._on_home)
-        self.home_btn.grid(row=0, column=1, padx=6, pady=6)
+        self.home_btn.grid(row=0, column=2, padx=6, pady=6)
 
         self.quit_btn = ctk.CTkButton(self, text="Quitter", width=80, fg_color="transparent", text_color="red", command=self._on_quit)
-        self.quit_btn.grid(row=0, column=2, padx=12, pady=6)
+        self.quit_btn.grid(row=0, column=3, padx=12, pady=6)
+
+    def _on_stats(self):
+        """!
+        @brief Affiche ou masque le panneau d'instrumentation.
+        @note Le panneau (et l'instrumentation) ne sont créés qu'au premier clic.
+        """
+        if self.overlay is None:
+            from views.InstrumentationOverlay import InstrumentationOverlay
+            self.overlay = InstrumentationOverlay(self.master)
+        self.overlay.toggle()
 
     def _on_home(self):
         """!
@@ -20,7 +20,7 @@ class HomeView(ctk.CTkFrame):
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
-        self.grid_rowconfigure(5, weight=1)
+        self.grid_rowconfigure(7, weight=1)
 
         ctk.CTkLabel(self, text="Planning Poker", font=("Arial", 40, "bold")).grid(row=1, column=0, pady=20)
 
@@ -30,5 +30,28 @@ class HomeView(ctk.CTkFrame):
         ctk.CTkButton(self, text="Charger une partie", width=200, height=50,
                       command=lambda: self.controller.load_game()).grid(row=3, column=0, pady=10)
 
+        ctk.CTkButton(self, text="Reprendre la dernière partie", width=200, height=50,
+                      fg_color="transparent", border_width=2, border_color="gray",
+                      command=lambda: self.controller.resume_game()).grid(row=4, column=0, pady=10)
+
+        ctk.CTkButton(self, text="Rejoindre une partie réseau", width=200, height=50,
+                      fg_color="transparent", border_width=2, border_color="gray",
+                      command=self.join_network_game).grid(row=5, column=0, pady=10)
+
         ctk.CTkButton(self, text="Quitter", width=200, height=50, fg_color="red", hover_color="darkred",
-                      command=lambda: self.controller.quit_app()).grid(row=4, column=0, pady=10)
\ No newline at end of file
+                      command=lambda: self.controller.quit_app()).grid(row=6, column=0, pady=10)
+
+    def join_network_game(self):
+        """!
+        @brief Demande l'adresse de l'hôte et le nom du joueur, puis rejoint la partie réseau.
+        @note L'adresse est au format hôte:port, affiché par l'hôte au lancement de la partie.
+        @see MainController.join_game
+        """
+        address = ctk.CTkInputDialog(text="Adresse de la partie (hôte:port) :", title="Rejoindre une partie").get_input()
+        if not address:
+            return
+        name = ctk.CTkInputDialog(text="Votre nom de joueur :", title="Rejoindre une partie").get_input()
+        if not name or not name.strip():
+            return
+        host, _, port = address.strip().rpartition(":")
+        self.controller.join_game(host or "127.0.0.1", port, name.strip())
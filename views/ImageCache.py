@@ -0,0 +1,199 @@
+import io
+import math
+import os
+import threading
+from collections import OrderedDict
+
+import customtkinter as ctk
+
+from views.Instrumentation import instrumentation
+
+## Plafond mémoire par défaut des images conservées (octets de pixels décodés).
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+## Variable d'environnement fixant le plafond du cache partagé, en mégaoctets.
+ENV_MAX_MB = "PLANNING_POKER_IMAGE_CACHE_MB"
+
+## Résolution de référence de Tk : 96 ppp, soit 96/72 pixel par point.
+TK_BASE_SCALING = 96 / 72
+
+
+def scale_for(widget):
+    """!
+    @brief Facteur de rastérisation adapté à l'écran d'un widget.
+    @details Combine le facteur "tk scaling" (pixels par point) et le facteur de mise à
+             l'échelle de CustomTkinter, arrondis au demi supérieur pour limiter le nombre
+             de variantes en cache.
+    @param widget Widget Tk affiché sur l'écran visé.
+    @return Facteur >= 1 (ex: 1.0 en 96 ppp, 2.0 sur un écran Retina/200 %).
+    """
+    try:
+        tk_factor = float(widget.tk.call("tk", "scaling")) / TK_BASE_SCALING
+    except Exception:
+        tk_factor = 1.0
+    try:
+        ctk_factor = ctk.ScalingTracker.get_widget_scaling(widget)
+    except Exception:
+        ctk_factor = 1.0
+    # Arrondi préalable : "tk scaling" n'est connu qu'à quelques décimales près
+    return max(1.0, math.ceil(round(max(tk_factor, ctk_factor) * 2, 3)) / 2)
+
+
+class ImageCache:
+    """!
+    @brief Cache LRU des images de cartes partagé par toutes les vues.
+    @details Les images sont rastérisées à l'échelle réelle de l'écran (PNG du cache disque,
+             sinon atlas de cartes), conservées sous forme de CTkImage et évincées de la moins récemment utilisée à la
+             plus récente dès que le plafond mémoire est dépassé.
+    @attributes
+        max_bytes Plafond mémoire (octets de pixels décodés).
+        hits Nombre d'images servies depuis le cache.
+        misses Nombre d'images produites.
+        evictions Nombre d'images évincées.
+        bytes Mémoire actuellement occupée.
+        prewarmer CardPrewarmer en cours de préparation des cartes (None sans préchauffage).
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, source=None):
+        """!
+        @brief Initialise un cache vide.
+        @param max_bytes Plafond mémoire en octets.
+        @param source Fonction source(value, size, scale) -> image PIL ; par défaut l'atlas de cartes partagé.
+        @example
+            cache = ImageCache(max_bytes=8 * 1024 * 1024)
+            image = cache.card("13", (80, 120), widget)
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self.prewarmer = None
+        self._source = source
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """!
+        @brief Nombre d'images en cache.
+        """
+        return len(self._entries)
+
+    def _default_source(self, value, size, scale):
+        """!
+        @brief Source par défaut : PNG de la carte en cache disque, sinon découpe dans l'atlas partagé.
+        @note Pendant le préchauffage, une carte absente du disque est rastérisée seule :
+              rastériser toute la planche doublerait le travail du pool.
+        """
+        from PIL import Image
+        from views.CardRasterCache import shared_cache
+        raster_cache = shared_cache()
+        png = raster_cache.cached_png(value, size, scale)
+        if png is None and self.prewarmer is not None and self.prewarmer.running:
+            png = raster_cache.png_bytes(value, size, scale)
+        if png is not None:
+            image = Image.open(io.BytesIO(png))
+            image.load()
+            return image
+
+        from views.CardAtlas import shared_atlas
+        from views.GameView import CARD_SIZES
+        return shared_atlas(CARD_SIZES).card(value, size, scale)
+
+    def card(self, value, size, widget=None, scale=None):
+        """!
+        @brief Retourne la CTkImage d'une carte.
+        @param value Valeur de la carte.
+        @param size Tuple (largeur, hauteur) d'affichage.
+        @param widget Widget servant à déterminer l'échelle de l'écran.
+        @param scale Échelle imposée (prioritaire sur widget).
+        @return La CTkImage correspondante.
+        @raises Exception Toute erreur de la source d'images (SVG introuvable, rastérisation...).
+        """
+        if scale is None:
+            scale = scale_for(widget) if widget is not None else 1.0
+        key = (value, size, scale)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                instrumentation.count("card_image.hit")
+                return entry[0]
+
+        pil_image = (self._source or self._default_source)(value, size, scale)
+        with self._lock:
+            self.misses += 1
+            instrumentation.count("card_image.miss")
+        return self._insert(key, pil_image)
+
+    def put(self, value, size, scale, pil_image):
+        """!
+        @brief Dépose dans le cache une image produite ailleurs (ex: préchauffage en parallèle).
+        @param value Valeur de la carte.
+        @param size Tuple (largeur, hauteur) d'affichage.
+        @param scale Échelle de rastérisation de l'image.
+        @param pil_image Image PIL rastérisée.
+        @return La CTkImage conservée.
+        """
+        return self._insert((value, size, scale), pil_image)
+
+    def _insert(self, key, pil_image):
+        """!
+        @brief Conserve une image sous une clé puis évince les plus anciennes au-delà du plafond.
+        @param key Tuple (valeur, taille, échelle).
+        @param pil_image Image PIL rastérisée.
+        @return La CTkImage conservée.
+        """
+        ctk_image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=key[1])
+        nbytes = pil_image.width * pil_image.height * len(pil_image.getbands())
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[key] = (ctk_image, nbytes)
+            self.bytes += nbytes
+            # L'image demandée est toujours conservée, même seule au-dessus du plafond.
+            while self.bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+        return ctk_image
+
+    def clear(self):
+        """!
+        @brief Vide le cache (les widgets affichant une image la conservent).
+        """
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """!
+        @brief Compteurs du cache.
+        @return Dictionnaire {entries, hits, misses, evictions, bytes, max_bytes}.
+        """
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "bytes": self.bytes, "max_bytes": self.max_bytes}
+
+
+_shared_cache = None
+
+
+def shared_image_cache():
+    """!
+    @brief Retourne le cache d'images partagé par toutes les vues.
+    @details Le plafond mémoire peut être fixé via la variable d'environnement
+             PLANNING_POKER_IMAGE_CACHE_MB (par défaut 32 Mo).
+    @return L'ImageCache du processus.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        try:
+            max_bytes = int(float(os.environ[ENV_MAX_MB]) * 1024 * 1024)
+        except (KeyError, ValueError):
+            max_bytes = DEFAULT_MAX_BYTES
+        _shared_cache = ImageCache(max_bytes=max_bytes)
+    return _shared_cache
@@ -0,0 +1,205 @@
+import functools
+import json
+import os
+import sys
+import time
+from collections import defaultdict, deque
+
+## Variable d'environnement activant l'instrumentation dès le lancement.
+ENV_FLAG = "PLANNING_POKER_INSTRUMENT"
+
+## Nombre d'échantillons conservés par mesure pour les percentiles.
+SAMPLE_WINDOW = 500
+
+
+class _Timing:
+    """!
+    @brief Statistiques d'une mesure : appels, cumul, maximum et derniers échantillons.
+    """
+
+    __slots__ = ("calls", "total", "worst", "samples")
+
+    def __init__(self):
+        """!
+        @brief Initialise des statistiques vides.
+        """
+        self.calls = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+
+    def add(self, seconds):
+        """!
+        @brief Ajoute un échantillon (secondes).
+        """
+        self.calls += 1
+        self.total += seconds
+        self.worst = max(self.worst, seconds)
+        self.samples.append(seconds)
+
+    def summary(self):
+        """!
+        @brief Résumé en millisecondes : appels, cumul, moyenne, p95 et maximum.
+        """
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total / self.calls * 1000, 3) if self.calls else 0.0,
+            "p95_ms": round(p95 * 1000, 3),
+            "max_ms": round(self.worst * 1000, 3),
+        }
+
+
+class Instrumentation:
+    """!
+    @brief Collecte optionnelle de mesures de l'interface (durées, compteurs, widgets, caches).
+    @details Désactivée par défaut : une méthode décorée par timed() ne coûte alors qu'un test
+             de booléen. L'activation se fait via la variable d'environnement
+             PLANNING_POKER_INSTRUMENT=1 ou depuis le bouton "Stats" du header.
+    @attributes
+        enabled Indique si les mesures sont collectées.
+        timings Statistiques par nom de mesure.
+        counters Compteurs libres (succès/échecs de cache...).
+    """
+
+    def __init__(self, enabled=False):
+        """!
+        @brief Initialise un collecteur vide.
+        @param enabled Active la collecte dès la création.
+        """
+        self.enabled = enabled
+        self.timings = defaultdict(_Timing)
+        self.counters = defaultdict(int)
+        self.started_at = time.time()
+
+    def record(self, name, seconds):
+        """!
+        @brief Enregistre une durée.
+        @param name Nom de la mesure (ex: "GameView.refresh_ui").
+        @param seconds Durée en secondes.
+        """
+        self.timings[name].add(seconds)
+
+    def count(self, name, amount=1):
+        """!
+        @brief Incrémente un compteur si l'instrumentation est active.
+        @param name Nom du compteur.
+        @param amount Valeur à ajouter.
+        """
+        if self.enabled:
+            self.counters[name] += amount
+
+    def reset(self):
+        """!
+        @brief Efface toutes les mesures.
+        """
+        self.timings.clear()
+        self.counters.clear()
+        self.started_at = time.time()
+
+    def hit_rate(self, prefix):
+        """!
+        @brief Taux de succès d'un cache suivi par les compteurs <prefix>.hit et <prefix>.miss.
+        @param prefix Préfixe des compteurs.
+        @return Taux entre 0 et 1, ou None sans accès.
+        """
+        hits, misses = self.counters.get(prefix + ".hit", 0), self.counters.get(prefix + ".miss", 0)
+        return round(hits / (hits + misses), 3) if hits + misses else None
+
+    def snapshot(self, root=None):
+        """!
+        @brief Photographie de toutes les mesures.
+        @param root Fenêtre principale (pour compter les widgets vivants et lire le RefreshScheduler).
+        @return Dictionnaire sérialisable en JSON.
+        """
+        data = {
+            "enabled": self.enabled,
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "timings": {name: timing.summary() for name, timing in sorted(self.timings.items())},
+            "counters": dict(sorted(self.counters.items())),
+            "caches": {"card_image_hit_rate": self.hit_rate("card_image")},
+        }
+
+        # Lit le cache disque seulement s'il a déjà été créé (sans l'importer ni le créer).
+        raster_module = sys.modules.get("views.CardRasterCache")
+        if raster_module is not None and raster_module._shared_cache is not None:
+            cache = raster_module._shared_cache
+            data["caches"]["disk_hits"] = cache.disk_hits
+            data["caches"]["rasterizations"] = cache.rasterizations
+
+        image_module = sys.modules.get("views.ImageCache")
+        if image_module is not None and image_module._shared_cache is not None:
+            data["caches"]["images"] = image_module._shared_cache.stats()
+
+        if root is not None:
+            data["widgets"] = widget_counts(root)
+            scheduler = getattr(root, "scheduler", None)
+            if scheduler is not None:
+                data["scheduler"] = scheduler.stats()
+        return data
+
+    def dump_json(self, path, root=None):
+        """!
+        @brief Écrit la photographie des mesures dans un fichier JSON.
+        @param path Chemin du fichier.
+        @param root Fenêtre principale.
+        @raises OSError Si l'écriture échoue.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(root), f, indent=4)
+
+
+def count_widgets(widget):
+    """!
+    @brief Compte un widget et tous ses descendants.
+    @param widget Widget racine.
+    @return Le nombre de widgets Tk vivants.
+    """
+    total = 1
+    stack = list(widget.winfo_children())
+    while stack:
+        child = stack.pop()
+        total += 1
+        stack.extend(child.winfo_children())
+    return total
+
+
+def widget_counts(root):
+    """!
+    @brief Nombre de widgets vivants, au total et par vue instanciée.
+    @param root Fenêtre principale (MainWindow).
+    @return Dictionnaire {"total": n, "<NomDeVue>": n...}.
+    """
+    counts = {"total": count_widgets(root)}
+    for name, frame in getattr(root, "frames", {}).items():
+        counts[name] = count_widgets(frame)
+    return counts
+
+
+## Collecteur partagé par toute l'application.
+instrumentation = Instrumentation(enabled=os.environ.get(ENV_FLAG, "") not in ("", "0"))
+
+
+def timed(name):
+    """!
+    @brief Décorateur mesurant la durée d'une méthode lorsque l'instrumentation est active.
+    @param name Nom de la mesure.
+    @return Le décorateur.
+    @example
+        @timed("GameView.refresh_ui")
+        def refresh_ui(self): ...
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not instrumentation.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                instrumentation.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
@@ -0,0 +1,106 @@
+import customtkinter as ctk
+from tkinter import filedialog
+from views.CustomPopup import CustomPopup
+from views.Instrumentation import instrumentation
+
+class InstrumentationOverlay(ctk.CTkFrame):
+    """!
+    @brief Panneau flottant affichant les mesures d'instrumentation en direct.
+    @details Affiche les durées des rafraîchissements, le nombre de widgets vivants, les taux de
+             succès des caches d'images et les compteurs du RefreshScheduler ; les mesures peuvent
+             être exportées en JSON pour une analyse hors ligne.
+    @attributes
+        refresh_ms Période de mise à jour de l'affichage.
+    """
+
+    def __init__(self, parent, refresh_ms=1000):
+        """!
+        @brief Construit le panneau (masqué).
+        @param parent Fenêtre principale (MainWindow).
+        @param refresh_ms Période de mise à jour en millisecondes.
+        """
+        super().__init__(parent, corner_radius=10, border_width=1, fg_color=("gray95", "gray10"))
+        self.refresh_ms = refresh_ms
+        self._job = None
+
+        self.lbl_stats = ctk.CTkLabel(self, text="", font=("Courier", 12), justify="left", anchor="nw")
+        self.lbl_stats.pack(fill="both", expand=True, padx=12, pady=(10, 5))
+
+        buttons = ctk.CTkFrame(self, fg_color="transparent")
+        buttons.pack(fill="x", padx=12, pady=(0, 10))
+        ctk.CTkButton(buttons, text="Exporter JSON", width=120, command=self._on_export).pack(side="left")
+        ctk.CTkButton(buttons, text="Réinitialiser", width=100, fg_color="transparent", border_width=1,
+                      command=instrumentation.reset).pack(side="right")
+
+    def is_visible(self):
+        """!
+        @brief Indique si le panneau est affiché.
+        """
+        return bool(self.winfo_manager())
+
+    def toggle(self):
+        """!
+        @brief Affiche ou masque le panneau.
+        @note Le premier affichage active l'instrumentation ; elle reste active une fois le panneau masqué.
+        """
+        if self.is_visible():
+            self.place_forget()
+            if self._job is not None:
+                self.after_cancel(self._job)
+                self._job = None
+        else:
+            instrumentation.enabled = True
+            self.place(relx=1.0, x=-20, y=60, anchor="ne")
+            self.lift()
+            self._tick()
+
+    def _tick(self):
+        """!
+        @brief Met à jour le texte affiché puis se reprogramme.
+        """
+        self.lbl_stats.configure(text=self.format_snapshot(instrumentation.snapshot(self.winfo_toplevel())))
+        self._job = self.after(self.refresh_ms, self._tick)
+
+    @staticmethod
+    def format_snapshot(snapshot):
+        """!
+        @brief Met en forme une photographie des mesures pour l'affichage.
+        @param snapshot Résultat de Instrumentation.snapshot.
+        @return Texte multiligne.
+        """
+        lines = [f"{'mesure':<32}{'appels':>7}{'moy ms':>9}{'p95 ms':>9}{'max ms':>9}"]
+        for name, t in snapshot["timings"].items():
+            lines.append(f"{name:<32}{t['calls']:>7}{t['mean_ms']:>9.2f}{t['p95_ms']:>9.2f}{t['max_ms']:>9.2f}")
+
+        widgets = snapshot.get("widgets", {})
+        if widgets:
+            lines.append("")
+            lines.append("widgets : " + ", ".join(f"{name} {count}" for name, count in widgets.items()))
+
+        caches = snapshot["caches"]
+        rate = caches.get("card_image_hit_rate")
+        cache_line = f"cache images : {'-' if rate is None else f'{rate:.0%}'}"
+        if "disk_hits" in caches:
+            cache_line += f", disque {caches['disk_hits']}, rastérisations {caches['rasterizations']}"
+        lines.append(cache_line)
+        images = caches.get("images")
+        if images:
+            lines.append(f"images : {images['entries']} ({images['bytes'] / 1048576:.1f}/"
+                         f"{images['max_bytes'] / 1048576:.0f} Mo, {images['evictions']} évincées)")
+
+        scheduler = snapshot.get("scheduler")
+        if scheduler:
+            lines.append(f"repeintes : {scheduler['redraws']} ({scheduler['coalesced']} regroupées, "
+                         f"{scheduler['flushes']} passes)")
+        return "\n".join(lines)
+
+    def _on_export(self):
+        """!
+        @brief Exporte les mesures courantes dans un fichier JSON choisi par l'utilisateur.
+        """
+        filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        if filename:
+            try:
+                instrumentation.dump_json(filename, self.winfo_toplevel())
+            except OSError as e:
+                CustomPopup("Erreur", f"Export des mesures impossible :\n{e}", type="error")
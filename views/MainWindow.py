@@ -1,9 +1,18 @@
+import importlib
+import io
 import customtkinter as ctk
 from views.HeaderView import HeaderView
-from views.HomeView import HomeView
-from views.SetupView import SetupView
-from views.GameView import GameView
-from views.ResultView import ResultView
+from views.RefreshScheduler import RefreshScheduler
+
+APP_TITLE = "AMY LOREL Planning Poker"
+
+## Vues de l'application : module à importer et attribut du MainController fournissant leur contrôleur.
+FRAME_REGISTRY = {
+    "HomeView": ("views.HomeView", None),
+    "SetupView": ("views.SetupView", "setup_controller"),
+    "GameView": ("views.GameView", "game_controller"),
+    "ResultView": ("views.ResultView", "result_controller"),
+}
 
 class MainWindow(ctk.CTk):
     """!
@@ -11,18 +20,22 @@ class MainWindow(ctk.CTk):
     @details Hérite de CTk. Gère le conteneur principal et la navigation entre les différentes frames.
     @attributes
         controller Instance principale pour relayer les actions.
-        frames Dictionnaire des vues instanciées.
+        frames Dictionnaire des vues déjà instanciées.
         header Barre d'en-tête commune.
+        scheduler Planificateur regroupant les rafraîchissements des vues.
+        prewarmer Préchauffage des cartes en cours (None tant qu'il n'a pas démarré).
     """
 
-    def __init__(self):
+    def __init__(self, prewarm=True):
         """!
         @brief Constructeur de la fenêtre principale.
-        @details Configure la géométrie, le titre, le header commun et instancie toutes les vues.
-        @note Instancie les vues sans contrôleur ; set_controller injecte ensuite les dépendances.
+        @details Configure la géométrie, le titre, le header commun et affiche l'accueil.
+        @param prewarm Prépare en arrière-plan la vue de jeu et la planche de cartes une fois l'accueil affiché.
+        @note Seule HomeView est créée au démarrage ; les autres vues (et leurs dépendances
+              lourdes) sont importées et instanciées au premier affichage.
         """
         super().__init__()
-        self.title("AMY LOREL Planning Poker")
+        self.title(APP_TITLE)
         self.minsize(1280, 820)
         self.geometry("1280x820")
         
@@ -34,36 +47,55 @@ class MainWindow(ctk.CTk):
 
         self.controller = None
         self.frames = {}
+        self.scheduler = RefreshScheduler(self)
+        self.prewarmer = None
 
         self.header = HeaderView(parent=self, controller=None)
         self.header.grid(row=0, column=0, sticky="ew")
 
-        # Instanciation de toutes les vues
-        for F in (HomeView, SetupView, GameView, ResultView):
-            page_name = F.__name__
-            frame = F(parent=self, controller=None)
-            self.frames[page_name] = frame
+        self.show_frame("HomeView")
+
+        if prewarm:
+            self.after(500, self.prewarm)
+
+    def get_frame(self, page_name):
+        """!
+        @brief Retourne une vue, en l'important et l'instanciant à la première demande.
+        @param page_name Nom de la vue (clé de FRAME_REGISTRY).
+        @return L'instance de la vue.
+        @raises KeyError Si la vue est inconnue.
+        """
+        frame = self.frames.get(page_name)
+        if frame is None:
+            module_name, controller_attr = FRAME_REGISTRY[page_name]
+            frame_class = getattr(importlib.import_module(module_name), page_name)
+            frame = frame_class(parent=self, controller=self._controller_for(controller_attr))
             frame.grid(row=1, column=0, sticky="nsew")
+            self.frames[page_name] = frame
+        return frame
 
-        self.show_frame("HomeView")
+    def _controller_for(self, controller_attr):
+        """!
+        @brief Contrôleur à injecter dans une vue.
+        @param controller_attr Attribut du MainController (None : le MainController lui-même).
+        @return Le contrôleur, ou None tant que set_controller n'a pas été appelé.
+        """
+        if self.controller is None or controller_attr is None:
+            return self.controller
+        return getattr(self.controller, controller_attr)
 
     def set_controller(self, main_controller):
         """!
         @brief Injecte les dépendances de contrôleurs dans les vues.
         @param main_controller Instance de MainController.
-        @note Partage la même instance de contrôleur principal et met à jour le header.
+        @note Partage la même instance de contrôleur principal et met à jour le header
+              ainsi que les vues déjà créées ; les suivantes le reçoivent à leur création.
         """
         self.controller = main_controller
         self.header.controller = main_controller
 
-        if "HomeView" in self.frames:
-            self.frames["HomeView"].controller = main_controller
-        if "SetupView" in self.frames:
-            self.frames["SetupView"].controller = main_controller.setup_controller
-        if "GameView" in self.frames:
-            self.frames["GameView"].controller = main_controller.game_controller
-        if "ResultView" in self.frames:
-            self.frames["ResultView"].controller = main_controller.result_controller
+        for page_name, frame in self.frames.items():
+            frame.controller = self._controller_for(FRAME_REGISTRY[page_name][1])
 
     def show_frame(self, page_name):
         """!
@@ -72,9 +104,48 @@ class MainWindow(ctk.CTk):
         @example
             window.show_frame("GameView")
         """
-        frame = self.frames[page_name]
+        frame = self.get_frame(page_name)
         frame.tkraise()
 
+    def prewarm(self):
+        """!
+        @brief Prépare la vue de jeu pendant que l'utilisateur est sur l'accueil.
+        @details Importe le module GameView puis rastérise toutes les cartes du deck, à l'échelle
+                 de l'écran, dans un pool de processus (ou les relit depuis le cache disque) ;
+                 chaque carte prête est déposée dans le cache d'images partagé.
+        @note Toute erreur est journalisée : le chargement se refera au premier affichage.
+              Une carte demandée avant la fin du préchauffage est rastérisée seule, pas
+              avec toute la planche.
+        """
+        try:
+            from views.GameView import CARD_SIZES
+            from views.CardPrewarm import CardPrewarmer
+            from views.ImageCache import scale_for, shared_image_cache
+            scale = scale_for(self)
+            image_cache = shared_image_cache()
+
+            def on_card(value, size, png):
+                from PIL import Image
+                image_cache.put(value, size, scale, Image.open(io.BytesIO(png)))
+
+            self.prewarmer = CardPrewarmer(CARD_SIZES, scale, root=self)
+            image_cache.prewarmer = self.prewarmer
+            self.prewarmer.start(on_card)
+        except Exception as e:
+            print(f"Préchargement ignoré : {e}")
+
+    def show_progress(self, fraction):
+        """!
+        @brief Affiche l'avancement d'un chargement long dans la barre de titre.
+        @param fraction Avancement entre 0 et 1, ou None pour restaurer le titre.
+        @note Force un rafraîchissement des tâches en attente pour que la fenêtre reste réactive.
+        """
+        if fraction is None:
+            self.title(APP_TITLE)
+        else:
+            self.title(f"{APP_TITLE} — Chargement {round(fraction * 100)} %")
+        self.update_idletasks()
+
     def quit_app(self):
         """!
         @brief Ferme proprement l'application.
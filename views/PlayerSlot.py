@@ -0,0 +1,68 @@
+import customtkinter as ctk
+
+class PlayerSlot(ctk.CTkFrame):
+    """!
+    @brief Emplacement persistant d'un joueur sur la table pendant la phase de vote.
+    @details Les widgets (nom, zone de statut, icône, légende) sont créés une seule fois ;
+             set_state() ne reconfigure que ce qui change et ne fait rien si l'état est identique.
+    @attributes
+        name Nom du joueur affiché.
+        state Tuple (a_voté, est_actif) actuellement affiché, None avant le premier set_state.
+    """
+
+    def __init__(self, parent, name, width, box_size, accent_color, styles):
+        """!
+        @brief Construit les widgets du slot.
+        @param parent Widget parent.
+        @param name Nom du joueur.
+        @param width Largeur fixe du slot.
+        @param box_size Tuple (largeur, hauteur) de la zone de statut (taille d'une carte).
+        @param accent_color Couleur du nom et de la bordure du joueur actif.
+        @param styles Dictionnaire {"voted"|"active"|"waiting": (icône, couleur icône, légende, couleur légende)} ;
+                      une couleur None reprend la couleur du thème.
+        """
+        super().__init__(parent, width=width, fg_color="transparent")
+        self.name = name
+        self.state = None
+        self._accent_color = accent_color
+        self._styles = styles
+        self._default_text_color = ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+
+        self.lbl_name = ctk.CTkLabel(self, text=name, font=("Arial", 14, "bold"), text_color="gray")
+        self.lbl_name.pack(pady=(0, 10))
+
+        self.status_box = ctk.CTkFrame(self, width=box_size[0], height=box_size[1],
+                                       fg_color=("gray90", "gray25"), corner_radius=8,
+                                       border_width=0, border_color=accent_color)
+        self.status_box.pack()
+        self.status_box.pack_propagate(False)
+
+        self.lbl_icon = ctk.CTkLabel(self.status_box, text="", font=("Arial", 40))
+        self.lbl_icon.pack(expand=True)
+
+        self.lbl_status = ctk.CTkLabel(self, text="", font=("Arial", 12))
+        self.lbl_status.pack(pady=(5, 0))
+
+    def set_state(self, voted, active):
+        """!
+        @brief Met à jour l'affichage du slot.
+        @param voted True si le joueur a voté pendant ce tour.
+        @param active True si c'est au joueur de voter.
+        @return True si l'affichage a été modifié, False s'il était déjà à jour.
+        @note Le statut "A voté" est prioritaire sur "Réfléchit...", comme dans l'affichage d'origine.
+        """
+        state = (voted, active)
+        if state == self.state:
+            return False
+
+        if self.state is None or self.state[1] != active:
+            self.lbl_name.configure(text_color=self._accent_color if active else "gray")
+            self.status_box.configure(border_width=2 if active else 0)
+
+        key = "voted" if voted else ("active" if active else "waiting")
+        icon, icon_color, caption, caption_color = self._styles[key]
+        self.lbl_icon.configure(text=icon, text_color=icon_color or self._default_text_color)
+        self.lbl_status.configure(text=caption, text_color=caption_color or self._default_text_color)
+
+        self.state = state
+        return True
@@ -0,0 +1,74 @@
+class RefreshScheduler:
+    """!
+    @brief Regroupe les demandes de rafraîchissement des vues en une passe par tour de boucle Tk.
+    @details Les vues marquent des régions "sales" (header, table, deck, results...) ; une seule
+             passe after_idle repeint ensuite chaque région une fois, quel que soit le nombre de
+             demandes reçues entre-temps.
+    @attributes
+        requests Nombre de régions demandées (doublons compris).
+        redraws Nombre de régions effectivement repeintes.
+        flushes Nombre de passes de rafraîchissement exécutées.
+    """
+
+    def __init__(self, root):
+        """!
+        @brief Prépare le planificateur.
+        @param root Widget Tk fournissant after_idle().
+        @example
+            scheduler = RefreshScheduler(main_window)
+            scheduler.mark_dirty(game_view, "table", "deck")
+        """
+        self.root = root
+        self.requests = 0
+        self.redraws = 0
+        self.flushes = 0
+        self._dirty = {}
+        self._scheduled = False
+
+    @property
+    def coalesced(self):
+        """!
+        @brief Nombre de demandes absorbées par une passe déjà prévue.
+        """
+        return self.requests - self.redraws - self.pending()
+
+    def pending(self):
+        """!
+        @brief Nombre de régions en attente de repeinte.
+        """
+        return sum(len(regions) for regions in self._dirty.values())
+
+    def mark_dirty(self, view, *regions):
+        """!
+        @brief Marque des régions d'une vue à repeindre.
+        @param view Vue exposant repaint(regions).
+        @param regions Noms des régions à repeindre.
+        @note Programme une passe after_idle si aucune n'est déjà prévue.
+        """
+        self.requests += len(regions)
+        self._dirty.setdefault(view, set()).update(regions)
+        if not self._scheduled:
+            self._scheduled = True
+            self.root.after_idle(self.flush)
+
+    def flush(self):
+        """!
+        @brief Repeint toutes les régions en attente.
+        @note Une vue qui redemande un rafraîchissement pendant la passe est repeinte à la passe suivante.
+        """
+        self._scheduled = False
+        dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return
+        self.flushes += 1
+        for view, regions in dirty.items():
+            self.redraws += len(regions)
+            view.repaint(regions)
+
+    def stats(self):
+        """!
+        @brief Compteurs du planificateur.
+        @return Dictionnaire {requests, redraws, coalesced, flushes}.
+        """
+        return {"requests": self.requests, "redraws": self.redraws,
+                "coalesced": self.coalesced, "flushes": self.flushes}
@@ -1,9 +1,54 @@
 import customtkinter as ctk
+from models.ResultIndex import ResultIndex
+from views.VirtualList import VirtualList
+from views.Instrumentation import timed
 
 # --- Constantes de Design ---
 THEME_HEADER_BG = ("gray85", "gray17")
 THEME_COLOR_SUCCESS = "#2CC985"
 THEME_COLOR_ACCENT = "#3B8ED0"
+RESULT_ROW_HEIGHT = 70
+SORT_LABELS = {"Ordre d'estimation": "order", "Nom": "name", "Score": "score"}
+
+
+class _ResultRow(ctk.CTkFrame):
+    """!
+    @brief Ligne recyclable du bilan (fonctionnalité + badge de score).
+    """
+
+    def __init__(self, parent, height):
+        """!
+        @brief Construit les widgets de la ligne, sans contenu.
+        @param parent Zone d'affichage de la VirtualList.
+        @param height Hauteur de la ligne.
+        """
+        super().__init__(parent, height=height - 10, fg_color=("gray90", "gray20"), corner_radius=10)
+        self.pack_propagate(False)
+
+        self.label = ctk.CTkLabel(self, text="", font=("Arial", 16), wraplength=500, justify="left")
+        self.label.pack(side="left", padx=20)
+
+        badge = ctk.CTkFrame(self, fg_color=THEME_COLOR_SUCCESS, corner_radius=20, width=50, height=40)
+        badge.pack(side="right", padx=20)
+        badge.pack_propagate(False)
+
+        self.badge_label = ctk.CTkLabel(badge, text="", font=("Arial", 18, "bold"), text_color="white")
+        self.badge_label.pack(expand=True)
+
+    def show(self, index, result):
+        """!
+        @brief Associe la ligne à un résultat.
+        @param index Position du résultat dans l'ordre affiché.
+        @param result Tuple (fonctionnalité, score).
+        @note Convertit les cartes spéciales "cafe" et "interro" en symboles.
+        """
+        feature_name, score = result
+        display_score = str(score)
+        if score == "cafe": display_score = "☕"
+        elif score == "interro": display_score = "?"
+
+        self.label.configure(text=str(feature_name))
+        self.badge_label.configure(text=display_score)
 
 class ResultView(ctk.CTkFrame):
     """!
@@ -11,6 +56,8 @@ class ResultView(ctk.CTkFrame):
     @details Liste les User Stories estimées et permet de sauvegarder ou quitter.
     @attributes
         controller Contrôleur des résultats associé.
+        index Index de tri précalculé des résultats affichés.
+        sort_key Ordre de tri courant ("order", "name" ou "score").
     """
 
     def __init__(self, parent, controller):
@@ -19,10 +66,12 @@ class ResultView(ctk.CTkFrame):
         @param parent Conteneur parent (MainWindow).
         @param controller Contrôleur associé (ResultController).
         @return None
-        @note Prépare la zone scrollable des résultats et le footer d'actions.
+        @note Prépare la liste virtualisée des résultats et le footer d'actions.
         """
         super().__init__(parent)
         self.controller = controller
+        self.index = ResultIndex()
+        self.sort_key = "order"
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -35,8 +84,15 @@ class ResultView(ctk.CTkFrame):
         ctk.CTkLabel(self.header_frame, text="Toutes les fonctionnalités ont été estimées.", 
                      font=("Arial", 14), text_color="gray").pack()
 
-        self.results_frame = ctk.CTkScrollableFrame(self, fg_color="transparent")
-        self.results_frame.grid(row=1, column=0, sticky="nsew", padx=40, pady=20)
+        self.sort_selector = ctk.CTkSegmentedButton(self.header_frame, values=list(SORT_LABELS),
+                                                    command=self._on_sort)
+        self.sort_selector.set(next(iter(SORT_LABELS)))
+        self.sort_selector.pack(pady=(10, 0))
+
+        self.results_list = VirtualList(self, _ResultRow, row_height=RESULT_ROW_HEIGHT, fg_color="transparent")
+        self.results_list.grid(row=1, column=0, sticky="nsew", padx=40, pady=20)
+
+        self.lbl_empty = ctk.CTkLabel(self, text="Aucun résultat disponible.", font=("Arial", 16))
 
         self.footer_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.footer_frame.grid(row=2, column=0, sticky="ew", padx=40, pady=30)
@@ -54,51 +110,59 @@ class ResultView(ctk.CTkFrame):
                                       command=self._on_home)
         self.btn_home.pack(side="right")
 
+    @timed("ResultView.refresh_ui")
     def refresh_ui(self):
         """!
         @brief Charge et affiche les résultats depuis le contrôleur.
+        @details Seuls les résultats validés depuis le dernier affichage sont insérés dans la liste ;
+                 l'index de tri n'est reconstruit que si la session a changé.
         @return None
         @example
             result_view.refresh_ui()
         """
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
-
         if self.controller:
             results = self.controller.get_results()
         else:
             results = {}
 
-        if not results:
-            ctk.CTkLabel(self.results_frame, text="Aucun résultat disponible.", font=("Arial", 16)).pack(pady=20)
-            return
+        added = self.index.sync(results)
+        if added is None:
+            self.results_list.set_items(self.index.rows(self.sort_key))
+        else:
+            for feature, score, positions in added:
+                self.results_list.insert(positions[self.sort_key], (feature, score))
 
-        for feature, score in results.items():
-            self._create_result_row(feature, score)
+        if not results:
+            self.lbl_empty.grid(row=1, column=0, pady=20, sticky="n")
+        else:
+            self.lbl_empty.grid_remove()
 
-    def _create_result_row(self, feature_name, score):
+    def schedule_refresh(self):
         """!
-        @brief Crée une ligne visuelle pour un résultat.
-        @param feature_name Nom de la fonctionnalité.
-        @param score Score validé.
-        @return None
-        @note Convertit les cartes spéciales "cafe" et "interro" en symboles.
+        @brief Demande la mise à jour du bilan au prochain passage idle de la boucle Tk.
+        @note Sans RefreshScheduler sur la fenêtre parente, la mise à jour est immédiate.
         """
-        row = ctk.CTkFrame(self.results_frame, fg_color=("gray90", "gray20"), corner_radius=10)
-        row.pack(fill="x", pady=5, ipadx=10, ipady=10)
-
-        ctk.CTkLabel(row, text=str(feature_name), font=("Arial", 16), 
-                     wraplength=500, justify="left").pack(side="left", padx=10)
+        scheduler = getattr(self.master, "scheduler", None)
+        if scheduler is None:
+            self.refresh_ui()
+        else:
+            scheduler.mark_dirty(self, "results")
 
-        display_score = str(score)
-        if score == "cafe": display_score = "☕"
-        elif score == "interro": display_score = "?"
+    def repaint(self, regions):
+        """!
+        @brief Repeint la vue (appelé par le RefreshScheduler).
+        @param regions Régions à repeindre ; la vue n'a qu'une région, "results".
+        """
+        self.refresh_ui()
 
-        badge = ctk.CTkFrame(row, fg_color=THEME_COLOR_SUCCESS, corner_radius=20, width=50, height=40)
-        badge.pack(side="right", padx=10)
-        badge.pack_propagate(False) 
-        
-        ctk.CTkLabel(badge, text=display_score, font=("Arial", 18, "bold"), text_color="white").pack(expand=True)
+    def _on_sort(self, label):
+        """!
+        @brief Change l'ordre de tri du bilan.
+        @param label Libellé du tri choisi dans SORT_LABELS.
+        @note Utilise l'ordre précalculé par ResultIndex : aucun tri n'est effectué ici.
+        """
+        self.sort_key = SORT_LABELS[label]
+        self.results_list.set_items(self.index.rows(self.sort_key))
 
     def _on_save(self):
         """!
@@ -1,4 +1,44 @@
 import customtkinter as ctk
+from views.VirtualList import VirtualList
+from views.Instrumentation import timed
+
+LIST_ROW_HEIGHT = 40  # Hauteur d'une ligne des listes joueurs/backlog
+
+
+class _ListItemRow(ctk.CTkFrame):
+    """!
+    @brief Ligne recyclable des listes de la configuration (texte + bouton de suppression).
+    """
+
+    def __init__(self, parent, height, icon, delete_command):
+        """!
+        @brief Construit les widgets de la ligne, sans contenu.
+        @param parent Zone d'affichage de la VirtualList.
+        @param height Hauteur de la ligne.
+        @param icon Icône textuelle affichée devant le texte.
+        @param delete_command Fonction delete_command(texte) appelée par le bouton de suppression.
+        """
+        super().__init__(parent, height=height - 4, fg_color=("gray85", "gray25"))
+        self.pack_propagate(False)
+        self.icon = icon
+        self.text = None
+
+        self.label = ctk.CTkLabel(self, text="", anchor="w")
+        self.label.pack(side="left", padx=10, pady=5)
+
+        ctk.CTkButton(self, text="✕", width=30, height=30,
+                      fg_color="transparent", text_color="red", hover_color=("gray70", "gray30"),
+                      command=lambda: delete_command(self.text)).pack(side="right", padx=5)
+
+    def show(self, index, text):
+        """!
+        @brief Associe la ligne à un élément.
+        @param index Position de l'élément dans la liste.
+        @param text Le texte à afficher.
+        """
+        self.text = text
+        self.label.configure(text=f"{self.icon}  {text}" if self.icon else text)
+
 
 class SetupView(ctk.CTkFrame):
     """!
@@ -83,12 +123,14 @@ class SetupView(ctk.CTkFrame):
 
         ctk.CTkLabel(self.right_card, text="👥 Joueurs inscrits", font=("Segoe UI Emoji", 16)).grid(row=0, column=0, sticky="w", padx=20, pady=(15, 5))
         
-        self.list_players = ctk.CTkScrollableFrame(self.right_card, fg_color="transparent")
+        self.list_players = VirtualList(self.right_card, self._row_factory("👤", self.remove_player_ui),
+                                        row_height=LIST_ROW_HEIGHT, fg_color="transparent")
         self.list_players.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
 
         ctk.CTkLabel(self.right_card, text="📋 Backlog", font=("Segoe UI Emoji", 16)).grid(row=2, column=0, sticky="w", padx=20, pady=(15, 5))
         
-        self.list_features = ctk.CTkScrollableFrame(self.right_card, fg_color="transparent")
+        self.list_features = VirtualList(self.right_card, self._row_factory("📌", self.remove_feature_ui),
+                                         row_height=LIST_ROW_HEIGHT, fg_color="transparent")
         self.list_features.grid(row=3, column=0, sticky="nsew", padx=10, pady=(0, 10))
 
         self.footer_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -109,23 +151,31 @@ class SetupView(ctk.CTkFrame):
                                        command=self.start_game)
         self.btn_start.pack(side="right")
 
+        self.btn_host = ctk.CTkButton(self.footer_frame, text="HÉBERGER EN RÉSEAU 🌐",
+                                      font=("Segoe UI Emoji", 14, "bold"), height=50, width=200,
+                                      fg_color="transparent", border_width=2, border_color="#E04F5F",
+                                      command=self.host_game)
+        self.btn_host.pack(side="right", padx=(0, 10))
+
     def add_player(self):
         """!
         @brief Action d'ajout d'un joueur déclenchée par l'interface.
         @note Ignore si l'ajout échoue.
         """
-        if self.controller.add_player(self.entry_player.get().strip()):
+        name = self.entry_player.get().strip()
+        if self.controller.add_player(name):
             self.entry_player.delete(0, "end")
-            self.refresh_lists()
+            self.list_players.append(name)
 
     def add_feature(self):
         """!
         @brief Action d'ajout d'une fonctionnalité déclenchée par l'interface.
         @note Ignoré si le backlog refuse la valeur (vide ou doublon).
         """
-        if self.controller.add_feature(self.entry_feature.get().strip()):
+        name = self.entry_feature.get().strip()
+        if self.controller.add_feature(name):
             self.entry_feature.delete(0, "end")
-            self.refresh_lists()
+            self.list_features.append(name)
 
     def import_json(self):
         """!
@@ -150,6 +200,14 @@ class SetupView(ctk.CTkFrame):
         self.controller.set_rule(self.rules_var.get())
         self.controller.start_game()
 
+    def host_game(self):
+        """!
+        @brief Valide la règle sélectionnée et demande au contrôleur d'héberger la partie en réseau.
+        @see SetupController.host_game
+        """
+        self.controller.set_rule(self.rules_var.get())
+        self.controller.host_game()
+
     def refresh_ui(self):
         """!
         @brief Met à jour l'ensemble de l'interface (règles et listes).
@@ -162,55 +220,36 @@ class SetupView(ctk.CTkFrame):
         self.rules_var.set(rules[0])
         self.refresh_lists()
 
+    @timed("SetupView.refresh_lists")
     def refresh_lists(self):
         """!
-        @brief Reconstruit visuellement les listes de joueurs et de fonctionnalités.
+        @brief Recharge les listes de joueurs et de fonctionnalités depuis le contrôleur.
+        @note Les listes sont virtualisées : seules les lignes visibles sont (ré)affichées.
         """
-        for widget in self.list_players.winfo_children():
-            widget.destroy()
-        
-        for p_name in self.controller.get_players():
-            self._create_list_item(self.list_players, p_name, 
-                                   lambda n=p_name: self.remove_player_ui(n), icon="👤")
-
-        for widget in self.list_features.winfo_children():
-            widget.destroy()
+        self.list_players.set_items(self.controller.get_players())
+        self.list_features.set_items(self.controller.get_features())
 
-        for f_name in self.controller.get_features():
-            self._create_list_item(self.list_features, f_name, 
-                                   lambda n=f_name: self.remove_feature_ui(n), icon="📌")
-
-    def _create_list_item(self, parent_frame, text, delete_command, icon=""):
+    def _row_factory(self, icon, delete_command):
         """!
-        @brief Crée un élément de liste stylisé avec un bouton de suppression.
-        @param parent_frame Le conteneur parent.
-        @param text Le texte à afficher.
-        @param delete_command La fonction à appeler lors du clic sur la suppression.
-        @param icon Une icône textuelle optionnelle.
+        @brief Fabrique de lignes pour une VirtualList de la configuration.
+        @param icon Icône textuelle des lignes.
+        @param delete_command Fonction appelée avec le texte de la ligne à supprimer.
+        @return Fonction row_factory(parent, height) attendue par VirtualList.
         """
-        item_card = ctk.CTkFrame(parent_frame, fg_color=("gray85", "gray25"))
-        item_card.pack(fill="x", pady=2, padx=2)
-        
-        full_text = f"{icon}  {text}" if icon else text
-        ctk.CTkLabel(item_card, text=full_text, anchor="w").pack(side="left", padx=10, pady=5)
-        
-        btn_del = ctk.CTkButton(item_card, text="✕", width=30, height=30, 
-                                fg_color="transparent", text_color="red", hover_color=("gray70", "gray30"),
-                                command=delete_command)
-        btn_del.pack(side="right", padx=5)
+        return lambda parent, height: _ListItemRow(parent, height, icon, delete_command)
 
     def remove_player_ui(self, name):
         """!
-        @brief Demande la suppression d'un joueur et rafraîchit l'interface.
+        @brief Demande la suppression d'un joueur et retire sa ligne de la liste.
         @param name Nom du joueur.
         """
         self.controller.remove_player(name)
-        self.refresh_lists()
+        self.list_players.remove(name)
 
     def remove_feature_ui(self, name):
         """!
-        @brief Demande la suppression d'une fonctionnalité et rafraîchit l'interface.
+        @brief Demande la suppression d'une fonctionnalité et retire sa ligne de la liste.
         @param name Nom de la fonctionnalité.
         """
         self.controller.remove_feature(name)
-        self.refresh_lists()
\ No newline at end of file
+        self.list_features.remove(name)
\ No newline at end of file
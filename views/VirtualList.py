@@ -0,0 +1,202 @@
+import math
+import customtkinter as ctk
+
+
+def clamp_first(first, total, visible):
+    """!
+    @brief Borne l'index de la première ligne affichée.
+    @param first Index demandé.
+    @param total Nombre total d'éléments.
+    @param visible Nombre de lignes entièrement visibles.
+    @return Index compris entre 0 et max(0, total - visible).
+    """
+    return max(0, min(first, total - visible))
+
+
+def scroll_fractions(first, total, visible):
+    """!
+    @brief Position de la barre de défilement pour une fenêtre de lignes.
+    @param first Index de la première ligne affichée.
+    @param total Nombre total d'éléments.
+    @param visible Nombre de lignes entièrement visibles.
+    @return Tuple (début, fin) entre 0 et 1, au format attendu par Scrollbar.set.
+    """
+    if total <= visible or total == 0:
+        return 0.0, 1.0
+    return first / total, min(1.0, (first + visible) / total)
+
+
+class VirtualList(ctk.CTkFrame):
+    """!
+    @brief Liste virtualisée : seules les lignes visibles existent sous forme de widgets.
+    @details Un pool fixe de lignes (autant que la hauteur affichée en contient) est recyclé au
+             défilement : chaque ligne est simplement réassociée à un autre élément. Les insertions
+             et suppressions ne touchent que les lignes visibles, quelle que soit la taille de la liste.
+    @attributes
+        row_height Hauteur fixe d'une ligne (unités CustomTkinter, avant mise à l'échelle).
+        first Index du premier élément affiché.
+    """
+
+    def __init__(self, parent, row_factory, row_height=40, **kwargs):
+        """!
+        @brief Construit la zone d'affichage et la barre de défilement.
+        @param parent Widget parent.
+        @param row_factory Fonction row_factory(parent, height) retournant un widget ligne
+                           qui expose show(index, item).
+        @param row_height Hauteur fixe d'une ligne.
+        @param kwargs Options transmises à CTkFrame (fg_color...).
+        @example
+            lst = VirtualList(card, lambda parent, height: MyRow(parent, height), row_height=38)
+            lst.set_items(names)
+        """
+        super().__init__(parent, **kwargs)
+        self.row_height = row_height
+        self.first = 0
+        self._row_factory = row_factory
+        self._items = []
+        self._rows = []
+        self._visible = 1
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.body.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.body)
+
+    def __len__(self):
+        """!
+        @brief Nombre d'éléments de la liste (affichés ou non).
+        """
+        return len(self._items)
+
+    def set_items(self, items):
+        """!
+        @brief Remplace tout le contenu de la liste.
+        @param items Séquence d'éléments ; elle est copiée.
+        @note Aucun widget n'est créé : seules les lignes visibles sont réassociées.
+        """
+        self._items = list(items)
+        self.first = clamp_first(self.first, len(self._items), self._visible)
+        self._render()
+
+    def insert(self, index, item):
+        """!
+        @brief Insère un élément.
+        @param index Position d'insertion.
+        @param item Élément à insérer.
+        """
+        self._items.insert(index, item)
+        if index < self.first + len(self._rows):
+            self._render()
+        else:
+            self._update_scrollbar()
+
+    def append(self, item):
+        """!
+        @brief Ajoute un élément en fin de liste et le rend visible.
+        @param item Élément à ajouter.
+        """
+        self._items.append(item)
+        self.first = clamp_first(len(self._items), len(self._items), self._visible)
+        self._render()
+
+    def remove(self, item):
+        """!
+        @brief Supprime un élément s'il est présent.
+        @param item Élément à supprimer.
+        @return True si l'élément a été supprimé.
+        """
+        try:
+            index = self._items.index(item)
+        except ValueError:
+            return False
+        del self._items[index]
+        self.first = clamp_first(self.first, len(self._items), self._visible)
+        if index < self.first + len(self._rows):
+            self._render()
+        else:
+            self._update_scrollbar()
+        return True
+
+    def scroll_to(self, first):
+        """!
+        @brief Fait défiler la liste jusqu'à un index.
+        @param first Index du premier élément à afficher.
+        """
+        first = clamp_first(first, len(self._items), self._visible)
+        if first != self.first:
+            self.first = first
+            self._render()
+
+    def _on_resize(self, event):
+        """!
+        @brief Ajuste la taille du pool de lignes à la hauteur affichée.
+        """
+        row_px = self.row_height * self._get_widget_scaling()
+        self._visible = max(1, int(event.height // row_px))
+        needed = math.ceil(event.height / row_px)
+        while len(self._rows) < needed:
+            row = self._row_factory(self.body, self.row_height)
+            self._bind_wheel(row)
+            self._rows.append(row)
+        self.first = clamp_first(self.first, len(self._items), self._visible)
+        self._render()
+
+    def _render(self):
+        """!
+        @brief Réassocie chaque ligne du pool à l'élément qu'elle doit afficher.
+        @note Une ligne déjà associée au même élément n'est pas reconfigurée.
+        """
+        for offset, row in enumerate(self._rows):
+            index = self.first + offset
+            if index < len(self._items):
+                item = self._items[index]
+                if getattr(row, "_bound", None) != (index, item):
+                    row.show(index, item)
+                    row._bound = (index, item)
+                if not row.winfo_manager():
+                    row.place(x=0, y=offset * self.row_height, relwidth=1)
+            elif row.winfo_manager():
+                row.place_forget()
+                row._bound = None
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        """!
+        @brief Synchronise la barre de défilement avec la fenêtre affichée.
+        """
+        self.scrollbar.set(*scroll_fractions(self.first, len(self._items), self._visible))
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """!
+        @brief Callback de la barre de défilement ("moveto" ou "scroll").
+        """
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * len(self._items)))
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self.scroll_to(self.first + int(amount) * step)
+
+    def _on_wheel(self, event):
+        """!
+        @brief Défilement à la molette (Windows/macOS : delta, X11 : boutons 4 et 5).
+        """
+        if getattr(event, "num", None) == 4 or event.delta > 0:
+            self.scroll_to(self.first - 3)
+        else:
+            self.scroll_to(self.first + 3)
+
+    def _bind_wheel(self, widget):
+        """!
+        @brief Associe la molette à un widget et à ses enfants directs.
+        @param widget Widget à lier.
+        """
+        for target in [widget] + list(widget.winfo_children()):
+            target.bind("<MouseWheel>", self._on_wheel, add="+")
+            target.bind("<Button-4>", self._on_wheel, add="+")
+            target.bind("<Button-5>", self._on_wheel, add="+")